@@ -20,7 +20,7 @@ Updated with enhanced engine and all new capabilities
 
 
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 
 from flask_cors import CORS
 
@@ -36,7 +36,7 @@ import sys
 
 import os
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from functools import wraps
 
@@ -46,7 +46,7 @@ from collections import defaultdict
 
 # UPDATED IMPORT: Use the new enhanced engine
 
-from horary_engine.engine import HoraryEngine, serialize_planet_with_solar
+from horary_engine.engine import HoraryEngine, ChartNotFoundError, override_combinations, serialize_planet_with_solar
 from horary_engine.serialization import (
     serialize_lunar_aspect,
     deserialize_chart_for_evaluation,
@@ -54,6 +54,15 @@ from horary_engine.serialization import (
 from horary_engine.services.geolocation import LocationError
 from evaluate_chart import evaluate_chart
 from horary_engine.utils import token_to_string
+from horary_engine.calculation.voc_calendar import from_julian_day, julian_day, void_periods
+from horary_engine.chart_context import CONTEXT_STATS
+from horary_engine.chart_cache import chart_cache
+from horary_engine.result_cache import result_cache
+from horary_engine.services.geocode_cache import geocode_cache
+from horary_engine.services.gazetteer import get_gazetteer
+from horary_engine.services.timezone_resolver import timezone_resolver
+from horary_engine.services.nominatim import nominatim_geocoder
+from models import Sign
 
 
 
@@ -274,15 +283,11 @@ def health_check():
 
     
 
-    # Test timezone finder
+    # Test timezone finder (the shared resolver, created on first use)
 
     try:
 
-        from timezonefinder import TimezoneFinder
-
-        tf = TimezoneFinder()
-
-        test_tz = tf.timezone_at(lat=51.5074, lng=-0.1278)  # London
+        test_tz = timezone_resolver().timezone_at(51.5074, -0.1278)  # London
 
         health_status['services']['timezone_finder'] = {
 
@@ -350,13 +355,9 @@ def health_check():
 
         try:
 
-            from geopy.geocoders import Nominatim
-
-            geolocator = Nominatim(user_agent="enhanced_health_check")
+            # Through the shared rate limiter; short timeout and queue wait
 
-            # Use shorter timeout and catch specific timeout errors
-
-            location = geolocator.geocode("London, UK", timeout=1)
+            location = nominatim_geocoder().geocode("London, UK", timeout=1, max_wait_seconds=1)
 
             health_status['services']['geocoding'] = {
 
@@ -372,7 +373,7 @@ def health_check():
 
             error_str = str(e).lower()
 
-            if any(word in error_str for word in ['timeout', 'connection', 'network']):
+            if any(word in error_str for word in ['timeout', 'connection', 'network', 'busy']):
 
                 health_status['services']['geocoding'] = {
 
@@ -507,9 +508,7 @@ def get_timezone():
 
             # Get timezone using enhanced timezone manager
 
-            from horary_engine.services.geolocation import TimezoneManager
-
-            timezone_manager = TimezoneManager()
+            timezone_manager = horary_engine.engine.timezone_manager
 
             timezone_str = timezone_manager.get_timezone_for_location(lat, lon)
 
@@ -639,9 +638,7 @@ def get_current_time():
 
             # Get current time using enhanced timezone manager
 
-            from horary_engine.services.geolocation import TimezoneManager
-
-            timezone_manager = TimezoneManager()
+            timezone_manager = horary_engine.engine.timezone_manager
 
             dt_local, dt_utc, timezone_used = timezone_manager.get_current_time_for_location(lat, lon)
 
@@ -729,6 +726,46 @@ def get_current_time():
 
 
 
+def _reasoning_v1_requested() -> bool:
+    """Whether the request asks for reasoning v1 (header, query string or environment)"""
+    use_reasoning_v1 = request.headers.get('X-Use-Reasoning-V1')
+    if use_reasoning_v1 is None:
+        use_reasoning_v1 = request.args.get('useReasoningV1')
+    if use_reasoning_v1 is None:
+        use_reasoning_v1 = os.getenv('USE_REASONING_V1', 'false')
+    return str(use_reasoning_v1).lower() == 'true'
+
+
+def _attach_evaluation(result, use_reasoning_v1):
+    """Attach structured evaluation results (ledger and rationale) to a judgment"""
+    try:
+        chart_data = result.get('chart_data')
+        if chart_data:
+            chart_obj = deserialize_chart_for_evaluation(chart_data)
+            evaluation = evaluate_chart(chart_obj, use_dsl=False)
+            ledger = evaluation.get('ledger', [])
+            for entry in ledger:
+                entry['key'] = token_to_string(entry.get('key'))
+                if 'polarity' in entry and hasattr(entry['polarity'], 'name'):
+                    entry['polarity'] = entry['polarity'].name
+            result['ledger'] = ledger
+            if use_reasoning_v1:
+                result['reasoning_v1'] = evaluation.get('rationale', [])
+            else:
+                result['rationale'] = evaluation.get('rationale', [])
+        else:
+            if use_reasoning_v1:
+                result['reasoning_v1'] = result.get('reasoning', [])
+            else:
+                result['rationale'] = result.get('reasoning', [])
+    except Exception as eval_error:
+        logger.warning(f"evaluate_chart failed: {eval_error}")
+        if use_reasoning_v1:
+            result['reasoning_v1'] = result.get('reasoning', [])
+        else:
+            result['rationale'] = result.get('reasoning', [])
+
+
 @app.route('/api/calculate-chart', methods=['POST'])
 
 @timing_decorator('calculate_chart')
@@ -781,12 +818,7 @@ def calculate_chart():
 
         manual_houses = data.get('manualHouses')
 
-        use_reasoning_v1 = request.headers.get('X-Use-Reasoning-V1')
-        if use_reasoning_v1 is None:
-            use_reasoning_v1 = request.args.get('useReasoningV1')
-        if use_reasoning_v1 is None:
-            use_reasoning_v1 = os.getenv('USE_REASONING_V1', 'false')
-        use_reasoning_v1 = str(use_reasoning_v1).lower() == 'true'
+        use_reasoning_v1 = _reasoning_v1_requested()
 
         
 
@@ -894,33 +926,19 @@ def calculate_chart():
 
             try:
 
-                houses_list = [int(h.strip()) for h in manual_houses.split(',') if h.strip()]
-
-                if len(houses_list) < 2:
-
-                    return jsonify({
-
-                        'error': 'Manual houses must include at least querent and quesited houses (e.g., "1,7")',
+                houses_list = _parse_manual_houses(manual_houses)
 
-                        'judgment': 'ERROR',
-
-                        'confidence': 0,
-
-                        'reasoning': [make_reason('Invalid manual house specification')]
-
-                    }), 400
-
-            except ValueError:
+            except ValueError as e:
 
                 return jsonify({
 
-                    'error': 'Manual houses must be numbers separated by commas (e.g., "1,7")',
+                    'error': str(e),
 
                     'judgment': 'ERROR',
 
                     'confidence': 0,
 
-                    'reasoning': [make_reason('Invalid manual house format')]
+                    'reasoning': [make_reason(str(e))]
 
                 }), 400
 
@@ -1062,7 +1080,9 @@ def calculate_chart():
 
                 'exaltation_confidence_boost': exaltation_confidence_boost
 
-            }
+            },
+
+            'ephemeris_calls': result.pop('ephemeris_stats', None)
 
         }
 
@@ -1098,33 +1118,7 @@ def calculate_chart():
 
             logger.info(f"Perfection type: {traditional_factors['perfection_type']}")
 
-        # Attach structured evaluation results
-        try:
-            chart_data = result.get('chart_data')
-            if chart_data:
-                chart_obj = deserialize_chart_for_evaluation(chart_data)
-                evaluation = evaluate_chart(chart_obj, use_dsl=False)
-                ledger = evaluation.get('ledger', [])
-                for entry in ledger:
-                    entry['key'] = token_to_string(entry.get('key'))
-                    if 'polarity' in entry and hasattr(entry['polarity'], 'name'):
-                        entry['polarity'] = entry['polarity'].name
-                result['ledger'] = ledger
-                if use_reasoning_v1:
-                    result['reasoning_v1'] = evaluation.get('rationale', [])
-                else:
-                    result['rationale'] = evaluation.get('rationale', [])
-            else:
-                if use_reasoning_v1:
-                    result['reasoning_v1'] = result.get('reasoning', [])
-                else:
-                    result['rationale'] = result.get('reasoning', [])
-        except Exception as eval_error:
-            logger.warning(f"evaluate_chart failed: {eval_error}")
-            if use_reasoning_v1:
-                result['reasoning_v1'] = result.get('reasoning', [])
-            else:
-                result['rationale'] = result.get('reasoning', [])
+        _attach_evaluation(result, use_reasoning_v1)
 
         return jsonify(result)
 
@@ -1162,6 +1156,220 @@ def calculate_chart():
 
 
 
+_OVERRIDE_FIELDS = {
+    'ignoreRadicality': 'ignore_radicality',
+    'ignoreVoidMoon': 'ignore_void_moon',
+    'ignoreCombustion': 'ignore_combustion',
+    'ignoreSaturn7th': 'ignore_saturn_7th',
+}
+
+
+def _override_matrix_setting(value):
+    """Engine form of a request's ``overrideMatrix`` (``true`` or a list of flag objects)"""
+    if value is None or value is False:
+        return None
+    if value is True:
+        return override_combinations(True)
+    if not isinstance(value, list):
+        raise ValueError('overrideMatrix must be true or a list of override objects')
+    return override_combinations([
+        {_OVERRIDE_FIELDS.get(name, name): flag for name, flag in entry.items()}
+        if isinstance(entry, dict) else entry
+        for entry in value
+    ])
+
+
+@app.route('/api/rejudge', methods=['POST'])
+@timing_decorator('rejudge')
+def rejudge_chart():
+    """Judge a chart from /api/calculate-chart again with new override flags.
+
+    Takes the response's ``chart_id`` plus the same override fields as
+    /api/calculate-chart and reuses the server-side chart and question
+    analysis, so nothing is geocoded, timezone-resolved or recalculated.
+    Returns 404 when the chart is no longer cached; the client should then
+    resubmit the full request. With ``overrideMatrix`` (``true`` for all 16
+    combinations, or a list such as ``[{"ignoreVoidMoon": true}]``) the
+    response holds an ``override_matrix`` of verdicts instead of one judgment.
+    """
+    data = request.get_json(silent=True) or {}
+    chart_id = data.get('chartId') or data.get('chart_id')
+    if not chart_id:
+        return jsonify({
+            'error': 'chartId is required',
+            'judgment': 'ERROR',
+            'confidence': 0,
+            'reasoning': [make_reason('No chart id provided')]
+        }), 400
+
+    settings = {
+        'ignore_radicality': data.get('ignoreRadicality', False),
+        'ignore_void_moon': data.get('ignoreVoidMoon', False),
+        'ignore_combustion': data.get('ignoreCombustion', False),
+        'ignore_saturn_7th': data.get('ignoreSaturn7th', False),
+        'exaltation_confidence_boost': data.get('exaltationConfidenceBoost', 15.0),
+    }
+    try:
+        settings['override_matrix'] = _override_matrix_setting(data.get('overrideMatrix'))
+    except ValueError as e:
+        return jsonify({
+            'error': str(e),
+            'judgment': 'ERROR',
+            'confidence': 0,
+            'reasoning': [make_reason(f'Invalid override matrix: {e}')]
+        }), 400
+    start_time = time.time()
+    try:
+        result = horary_engine.rejudge(str(chart_id), settings)
+    except ChartNotFoundError:
+        return jsonify({
+            'error': 'Chart not found or expired; resubmit the full request',
+            'judgment': 'ERROR',
+            'confidence': 0,
+            'reasoning': [make_reason('Unknown or expired chart id')],
+            'error_type': 'ChartNotFound'
+        }), 404
+    calculation_time = time.time() - start_time
+
+    if result.get('error'):
+        logger.error(f"Rejudge error: {result['error']}")
+        return jsonify(result), 500
+
+    result['calculation_metadata'] = {
+        'calculation_time_seconds': calculation_time,
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'api_version': '2.0.0',
+        'engine_version': 'Enhanced Traditional Horary 2.0',
+        'rejudged': True,
+        'override_flags_applied': {
+            'ignore_radicality': settings['ignore_radicality'],
+            'ignore_void_moon': settings['ignore_void_moon'],
+            'ignore_combustion': settings['ignore_combustion'],
+            'ignore_saturn_7th': settings['ignore_saturn_7th']
+        },
+        'enhanced_parameters': {
+            'exaltation_confidence_boost': settings['exaltation_confidence_boost']
+        },
+        'ephemeris_calls': result.pop('ephemeris_stats', None)
+    }
+    if settings['override_matrix'] is not None:
+        del result['calculation_metadata']['override_flags_applied']
+        logger.info(f"Rejudged chart {chart_id} under {len(settings['override_matrix'])} override combinations in {calculation_time:.3f} seconds")
+        return jsonify(result)
+    logger.info(f"Rejudged chart {chart_id} in {calculation_time:.3f} seconds - Judgment: {result.get('judgment')}")
+    _attach_evaluation(result, _reasoning_v1_requested())
+    return jsonify(result)
+
+
+# Most questions accepted by /api/judge-batch in one request
+MAX_BATCH_QUESTIONS = 50
+
+
+def _parse_manual_houses(text):
+    """House list from a "1,7"-style string; ``ValueError`` when malformed"""
+    try:
+        houses = [int(h.strip()) for h in str(text).split(',') if h.strip()]
+    except ValueError:
+        raise ValueError('Manual houses must be numbers separated by commas (e.g., "1,7")')
+    if len(houses) < 2:
+        raise ValueError('Manual houses must include at least querent and quesited houses (e.g., "1,7")')
+    return houses
+
+
+@app.route('/api/judge-batch', methods=['POST'])
+@timing_decorator('judge_batch')
+def judge_batch():
+    """Judge several questions asked at one moment and place against a single chart.
+
+    Takes the same fields as /api/calculate-chart, with ``questions`` (a list
+    of strings, or of ``{"question": ..., "manualHouses": "1,7"}`` objects)
+    in place of ``question``. The chart is calculated once. Results come back
+    in input order as ``{"results": [...]}``, or one JSON object per line
+    when the client sends ``Accept: application/x-ndjson`` or
+    ``?format=ndjson``.
+    """
+    data = request.get_json(silent=True) or {}
+
+    def bad_request(message):
+        return jsonify({
+            'error': message,
+            'judgment': 'ERROR',
+            'confidence': 0,
+            'reasoning': [make_reason(message)]
+        }), 400
+
+    entries = data.get('questions')
+    if not isinstance(entries, list) or not entries:
+        return bad_request('questions must be a non-empty list')
+    if len(entries) > MAX_BATCH_QUESTIONS:
+        return bad_request(f'At most {MAX_BATCH_QUESTIONS} questions per batch')
+
+    questions = []
+    houses = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            question = entry.get('question')
+            manual_houses = entry.get('manualHouses')
+        else:
+            question, manual_houses = entry, None
+        if not isinstance(question, str) or not question.strip():
+            return bad_request('Every question must be a non-empty string')
+        try:
+            houses.append(_parse_manual_houses(manual_houses) if manual_houses else None)
+        except ValueError as e:
+            return bad_request(str(e))
+        questions.append(question)
+
+    location = data.get('location')
+    if not location:
+        return bad_request('Location is required')
+    use_current_time = data.get('useCurrentTime', True)
+    if not use_current_time and (not data.get('date') or not data.get('time')):
+        return bad_request('Date and time are required when not using current time')
+
+    settings = {
+        'location': location,
+        'date': data.get('date'),
+        'time': data.get('time'),
+        'timezone': data.get('timezone'),
+        'use_current_time': use_current_time,
+        'manual_houses': houses if any(houses) else None,
+        'ignore_radicality': data.get('ignoreRadicality', False),
+        'ignore_void_moon': data.get('ignoreVoidMoon', False),
+        'ignore_combustion': data.get('ignoreCombustion', False),
+        'ignore_saturn_7th': data.get('ignoreSaturn7th', False),
+        'exaltation_confidence_boost': data.get('exaltationConfidenceBoost', 15.0),
+    }
+    use_reasoning_v1 = _reasoning_v1_requested()
+    logger.info(f"Batch judgment request: {len(questions)} questions at {location}")
+
+    def results():
+        for result in horary_engine.judge_batch(questions, settings):
+            if not result.get('error'):
+                _attach_evaluation(result, use_reasoning_v1)
+            yield result
+
+    ndjson = (request.args.get('format') == 'ndjson'
+              or 'application/x-ndjson' in request.headers.get('Accept', ''))
+    if ndjson:
+        lines = (app.json.dumps(result) + '\n' for result in results())
+        return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+
+    start_time = time.time()
+    items = list(results())
+    return jsonify({
+        'results': items,
+        'count': len(items),
+        'calculation_metadata': {
+            'calculation_time_seconds': time.time() - start_time,
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'api_version': '2.0.0',
+            'engine_version': 'Enhanced Traditional Horary 2.0',
+            'shared_chart': True
+        }
+    })
+
+
 @app.route('/api/moon-debug', methods=['POST'])
 
 @timing_decorator('moon_debug')
@@ -1230,6 +1438,101 @@ def moon_debug():
 
 
 
+# Longest date range served by /api/voc in one request
+MAX_VOC_RANGE_DAYS = 366
+
+
+@app.route('/api/voc', methods=['GET'])
+@timing_decorator('voc')
+def get_voc_periods():
+    """Void-of-course Moon periods overlapping a UTC date range.
+
+    Query parameters ``start`` and ``end`` are ISO dates or datetimes (UTC);
+    ``end`` defaults to seven days after ``start``.
+    """
+    try:
+        start_arg = request.args.get('start')
+        if not start_arg:
+            return jsonify({'error': 'start is required (ISO date, UTC)', 'success': False}), 400
+        try:
+            start = datetime.fromisoformat(start_arg)
+            end_arg = request.args.get('end')
+            end = datetime.fromisoformat(end_arg) if end_arg else start + timedelta(days=7)
+        except ValueError as e:
+            return jsonify({'error': f'Invalid date: {e}', 'success': False}), 400
+        start = start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+        end = end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+
+        if end <= start:
+            return jsonify({'error': 'end must be after start', 'success': False}), 400
+        if (end - start).days > MAX_VOC_RANGE_DAYS:
+            return jsonify({
+                'error': f'Date range is limited to {MAX_VOC_RANGE_DAYS} days',
+                'success': False
+            }), 400
+
+        periods = void_periods(julian_day(start), julian_day(end))
+        return jsonify({
+            'success': True,
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'periods': [
+                {
+                    'start': from_julian_day(period_start).isoformat(),
+                    'end': from_julian_day(period_end).isoformat(),
+                    'start_jd': period_start,
+                    'end_jd': period_end,
+                    'moon_enters': list(Sign)[sign].sign_name,
+                }
+                for period_start, period_end, sign in periods
+            ],
+        })
+
+    except Exception as e:
+        logger.error(f"Error in voc endpoint: {str(e)}")
+        return jsonify({'error': str(e), 'success': False}), 500
+
+# Most suggestions /api/locations/suggest returns for one query
+MAX_LOCATION_SUGGESTIONS = 25
+
+
+@app.route('/api/locations/suggest', methods=['GET'])
+@timing_decorator('location_suggest')
+def suggest_locations():
+    """Places from the offline gazetteer whose name starts with ``q``.
+
+    Ranked by population with a boost for exact name matches; ``limit``
+    (default 10) caps the list. Each suggestion's ``display_name`` resolves
+    back to the same place when sent as a request's ``location``. Without a
+    gazetteer the list is empty and ``available`` is false.
+    """
+    query = request.args.get('q', '').strip()
+    try:
+        limit = min(int(request.args.get('limit', 10)), MAX_LOCATION_SUGGESTIONS)
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer', 'success': False}), 400
+
+    gazetteer = get_gazetteer()
+    places = gazetteer.suggest(query, limit) if gazetteer is not None and query else []
+    return jsonify({
+        'success': True,
+        'query': query,
+        'available': gazetteer is not None,
+        'suggestions': [
+            {
+                'name': place.name,
+                'display_name': place.display_name,
+                'latitude': place.latitude,
+                'longitude': place.longitude,
+                'timezone': place.timezone,
+                'country_code': place.country_code,
+                'population': place.population,
+            }
+            for place in places
+        ],
+    })
+
+
 @app.route('/api/metrics', methods=['GET'])
 
 @timing_decorator('metrics')
@@ -1245,6 +1548,12 @@ def get_metrics():
             'status': 'success',
 
             'metrics': metrics.get_stats(),
+            'chart_context': CONTEXT_STATS.as_dict(),
+            'chart_cache': chart_cache().stats(),
+            'result_cache': result_cache().stats(),
+            'geocode_cache': geocode_cache().stats(),
+            'timezone_resolver': timezone_resolver().stats(),
+            'nominatim': nominatim_geocoder().stats(),
 
             'enhanced_engine_stats': {
 
@@ -1596,6 +1905,12 @@ def not_found(error):
 
             '/api/calculate-chart',
 
+            '/api/rejudge',
+
+            '/api/judge-batch',
+
+            '/api/locations/suggest',
+
             '/api/get-timezone',
 
             '/api/current-time',
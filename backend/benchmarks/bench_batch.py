@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Compare batch chart calculation with calling ``calculate_chart`` in a loop.
+
+Computes the same random charts both ways, checks that every row of the
+batch converts back to the chart the per-chart path builds, and reports
+charts per second.
+
+Usage (from the backend directory):
+    python benchmarks/bench_batch.py --charts 5000
+"""
+
+import argparse
+import datetime
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator  # noqa: E402
+
+
+def _comparable(chart) -> dict:
+    fields = dict(chart.__dict__)
+    fields.pop("context", None)
+    fields.pop("ephemeris", None)
+    return fields
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--charts", type=int, default=5000, help="number of charts")
+    parser.add_argument("--verify", type=int, default=200, help="rows converted back and compared")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    epoch = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+    moments = [epoch + datetime.timedelta(days=rng.uniform(0, 9000)) for _ in range(args.charts)]
+    latitudes = [rng.uniform(-60, 60) for _ in range(args.charts)]
+    longitudes = [rng.uniform(-180, 180) for _ in range(args.charts)]
+
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+
+    started = time.perf_counter()
+    charts = [
+        calculator.calculate_chart(dt, dt, "UTC", lat, lon, "")
+        for dt, lat, lon in zip(moments, latitudes, longitudes)
+    ]
+    loop_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = calculator.calculate_charts_batch(moments, latitudes, longitudes)
+    batch_seconds = time.perf_counter() - started
+
+    verify = min(args.verify, args.charts)
+    started = time.perf_counter()
+    mismatches = sum(
+        _comparable(batch.chart(i)) != _comparable(charts[i]) for i in range(verify)
+    )
+    convert_seconds = time.perf_counter() - started
+
+    print(f"{args.charts} charts")
+    print(f"  calculate_chart loop   : {args.charts / loop_seconds:9.0f} charts/s "
+          f"({loop_seconds * 1e6 / args.charts:.0f} us/chart)")
+    print(f"  calculate_charts_batch : {args.charts / batch_seconds:9.0f} charts/s "
+          f"({batch_seconds * 1e6 / args.charts:.0f} us/chart, {loop_seconds / batch_seconds:.1f}x)")
+    print(f"  batch.chart(i)         : {convert_seconds * 1e6 / max(verify, 1):9.0f} us/row")
+    print(f"  {mismatches} of {verify} converted rows differ from calculate_chart")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
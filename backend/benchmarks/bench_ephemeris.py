@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Compare the Swiss Ephemeris and precomputed-table ephemeris backends.
+
+Times ``calc_ut`` for the seven planets at random moments inside the table's
+range and reports the worst disagreement between the two backends.
+
+Usage (from the backend directory):
+    python benchmarks/bench_ephemeris.py --table data/ephemeris_table.bin
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import swisseph as swe  # noqa: E402
+
+from horary_engine.calculation.ephemeris import calc_ut, set_ephemeris_table  # noqa: E402
+from horary_engine.calculation.ephemeris_table import EphemerisTable  # noqa: E402
+
+PLANETS = [swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN]
+
+
+def _time_backend(moments) -> tuple:
+    results = []
+    started = time.perf_counter()
+    for jd in moments:
+        for planet_id in PLANETS:
+            results.append(calc_ut(jd, planet_id)[0])
+    return time.perf_counter() - started, results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--table", default="data/ephemeris_table.bin")
+    parser.add_argument("--charts", type=int, default=20000, help="number of chart moments")
+    args = parser.parse_args(argv)
+
+    table = EphemerisTable(args.table)
+    rng = random.Random(0)
+    moments = [rng.uniform(table.jd_start, table.jd_end) for _ in range(args.charts)]
+    lookups = args.charts * len(PLANETS)
+
+    set_ephemeris_table(None)
+    swe_seconds, expected = _time_backend(moments)
+    set_ephemeris_table(table)
+    table_seconds, actual = _time_backend(moments)
+    set_ephemeris_table(None)
+
+    worst_lon = max(abs((a[0] - e[0] + 180.0) % 360.0 - 180.0) for a, e in zip(actual, expected))
+    worst_speed = max(abs(a[3] - e[3]) for a, e in zip(actual, expected))
+
+    print(f"{lookups} lookups ({args.charts} charts x {len(PLANETS)} planets)")
+    print(f"  swisseph : {swe_seconds * 1e6 / lookups:8.2f} us/lookup")
+    print(f"  table    : {table_seconds * 1e6 / lookups:8.2f} us/lookup "
+          f"({swe_seconds / table_seconds:.1f}x)")
+    print(f"  max |dlon| {worst_lon * 3600:.4f}\"  max |dspeed| {worst_speed:.2e} deg/day")
+    table.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Measure the memory held by cached charts and testimony lists.
+
+Calculates random charts, extracts their DSL testimonies and reports the
+bytes each chart (as a ``HoraryChart`` object graph and packed as
+``ChartArrays``) and each testimony list keeps alive. Sizes come from
+``tracemalloc`` while unpickling copies, so they cover exactly what a cache
+holds; enum members and other shared singletons are not counted. The
+ephemeris snapshot is left out of the chart figures because it is shared
+with the helpers rather than owned by the chart.
+
+Usage (from the backend directory):
+    python benchmarks/bench_memory.py --charts 2000
+"""
+
+import argparse
+import datetime
+import logging
+import pickle
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from horary_engine.chart_arrays import ChartArrays  # noqa: E402
+from horary_engine.engine import (  # noqa: E402
+    EnhancedTraditionalAstrologicalCalculator,
+    extract_testimonies,
+)
+from models import Planet  # noqa: E402
+
+
+def _bytes_per_item(items) -> float:
+    """Average bytes retained by unpickled copies of ``items``."""
+    payloads = [pickle.dumps(item) for item in items]
+    tracemalloc.start()
+    copies = [pickle.loads(payload) for payload in payloads]
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del copies
+    return retained / max(len(items), 1)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--charts", type=int, default=2000, help="number of charts")
+    args = parser.parse_args(argv)
+    logging.disable(logging.CRITICAL)
+
+    rng = random.Random(0)
+    epoch = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    contract = {"querent": Planet.MARS, "quesited": Planet.VENUS}
+
+    charts = []
+    testimonies = []
+    failed = 0
+    for _ in range(args.charts):
+        dt = epoch + datetime.timedelta(days=rng.uniform(0, 9000))
+        chart = calculator.calculate_chart(dt, dt, "UTC", rng.uniform(-60, 60), rng.uniform(-180, 180), "")
+        try:
+            testimonies.append(extract_testimonies(chart, contract))
+        except Exception:
+            failed += 1
+        chart.ephemeris = None
+        charts.append(chart)
+
+    chart_bytes = _bytes_per_item(charts)
+    arrays_bytes = _bytes_per_item([ChartArrays.from_chart(chart) for chart in charts])
+    testimony_bytes = _bytes_per_item(testimonies)
+    primitives = sum(len(items) for items in testimonies) / max(len(testimonies), 1)
+
+    print(f"{args.charts} charts")
+    print(f"  HoraryChart     : {chart_bytes:8.0f} bytes/chart")
+    print(f"  ChartArrays     : {arrays_bytes:8.0f} bytes/chart")
+    print(f"  testimony list  : {testimony_bytes:8.0f} bytes/list "
+          f"({primitives:.1f} primitives, {testimony_bytes / max(primitives, 1):.0f} bytes each)")
+    if failed:
+        print(f"  testimony extraction failed for {failed} charts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -46,6 +46,12 @@ def build_backend():
         "--clean",
         str(app_py)
     ]
+
+    # Bundle the offline gazetteer when it has been built, so packaged
+    # installs resolve common locations without network access
+    gazetteer = backend_dir / "data" / "gazetteer.bin"
+    if gazetteer.exists():
+        pyinstaller_cmd[-1:-1] = ["--add-data", f"{gazetteer};data"]
     
     print("Building backend executable...")
     print(f"Command: {' '.join(pyinstaller_cmd)}")
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Build precomputed ephemeris data files for the horary engine.
+
+The files are generated locally from Swiss Ephemeris and are not checked in.
+Point ``ephemeris.table_path`` in ``horary_constants.yaml`` (or the
+``HORARY_EPHEMERIS_TABLE`` environment variable) at the result.
+
+Usage:
+    python build_ephemeris_data.py table --start-year 1900 --end-year 2100
+    python build_ephemeris_data.py table --verify 20000
+    python build_ephemeris_data.py stations --start-year 1900 --end-year 2100
+    python build_ephemeris_data.py ingresses --start-year 1900 --end-year 2100
+    python build_ephemeris_data.py voc --start-year 1900 --end-year 2100
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import swisseph as swe
+
+from horary_engine.calculation.ephemeris_table import (
+    SEGMENT_LAYOUT,
+    EphemerisTable,
+    accuracy_bound,
+    write_table,
+)
+from horary_engine.calculation.ingress_index import PLANET_IDS, IngressIndex
+from horary_engine.calculation.station_index import STATION_PLANETS, StationIndex
+from horary_engine.calculation.voc_calendar import VocCalendar
+
+DATA_DIR = Path(__file__).parent / "data"
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+def _swe_sample(jd: float, planet_id: int):
+    data, _ = swe.calc_ut(jd, planet_id, FLAGS)
+    return data[0], data[1], data[2]
+
+
+def _swe_speed(jd: float, planet_id: int) -> float:
+    return swe.calc_ut(jd, planet_id, FLAGS)[0][3]
+
+
+def _swe_motion(jd: float, planet_id: int):
+    data, _ = swe.calc_ut(jd, planet_id, FLAGS)
+    return data[0], data[3]
+
+
+def verify_table(path: Path, samples: int) -> int:
+    """Compare random table lookups with Swiss Ephemeris and print worst errors.
+
+    Returns the number of lookups outside the documented accuracy bounds.
+    """
+    table = EphemerisTable(path)
+    rng = random.Random(0)
+    failures = 0
+    for planet_id in SEGMENT_LAYOUT:
+        worst_lon = worst_lat = worst_speed = 0.0
+        for _ in range(samples):
+            jd = rng.uniform(table.jd_start, table.jd_end)
+            expected, _ = swe.calc_ut(jd, planet_id, FLAGS)
+            actual = table.position(jd, planet_id)
+            dlon = abs((actual[0] - expected[0] + 180.0) % 360.0 - 180.0)
+            dlat = abs(actual[1] - expected[1])
+            dspeed = abs(actual[3] - expected[3])
+            sun = swe.calc_ut(jd, swe.SUN, FLAGS)[0][0]
+            position_bound, speed_bound = accuracy_bound(planet_id, (expected[0] - sun + 180.0) % 360.0 - 180.0)
+            if max(dlon, dlat) * 3600 > position_bound or dspeed > speed_bound:
+                failures += 1
+            worst_lon = max(worst_lon, dlon)
+            worst_lat = max(worst_lat, dlat)
+            worst_speed = max(worst_speed, dspeed)
+        print(
+            f"  {swe.get_planet_name(planet_id):<8} max |dlon| {worst_lon * 3600:.5f}\"  "
+            f"max |dlat| {worst_lat * 3600:.5f}\"  max |dspeed| {worst_speed:.2e} deg/day"
+        )
+    table.close()
+    if failures:
+        print(f"✗ {failures} lookups outside the documented accuracy bounds")
+    return failures
+
+
+def build_table(args) -> int:
+    out = Path(args.out)
+    if not args.verify_only:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        jd_start = swe.julday(args.start_year, 1, 1, 0.0)
+        jd_end = swe.julday(args.end_year, 1, 1, 0.0)
+        print(f"Building ephemeris table {out} for {args.start_year}-{args.end_year}...")
+        started = time.time()
+        write_table(out, jd_start, jd_end, _swe_sample)
+        print(f"✓ Wrote {out.stat().st_size / (1024 * 1024):.1f} MB in {time.time() - started:.1f}s")
+    if args.verify:
+        print(f"Verifying {args.verify} random lookups per body against Swiss Ephemeris:")
+        if verify_table(out, args.verify):
+            return 1
+    return 0
+
+
+def build_stations(args) -> int:
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    jd_start = swe.julday(args.start_year, 1, 1, 0.0)
+    jd_end = swe.julday(args.end_year, 1, 1, 0.0)
+    print(f"Building station index {out} for {args.start_year}-{args.end_year}...")
+    started = time.time()
+    index = StationIndex.build(jd_start, jd_end, _swe_speed)
+    index.save(out)
+    for planet_id in STATION_PLANETS:
+        print(f"  {swe.get_planet_name(planet_id):<8} {index.station_count(planet_id)} stations")
+    print(f"✓ Wrote {out.stat().st_size / 1024:.0f} KB in {time.time() - started:.1f}s")
+    return 0
+
+
+def build_ingresses(args) -> int:
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    jd_start = swe.julday(args.start_year, 1, 1, 0.0)
+    jd_end = swe.julday(args.end_year, 1, 1, 0.0)
+    print(f"Building ingress index {out} for {args.start_year}-{args.end_year}...")
+    started = time.time()
+    index = IngressIndex.build(jd_start, jd_end, _swe_motion)
+    index.save(out)
+    for name, planet_id in PLANET_IDS.items():
+        print(f"  {name:<8} {index.ingress_count(planet_id)} ingresses")
+    print(f"✓ Wrote {out.stat().st_size / 1024:.0f} KB in {time.time() - started:.1f}s")
+    return 0
+
+
+def build_voc(args) -> int:
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    jd_start = swe.julday(args.start_year, 1, 1, 0.0)
+    jd_end = swe.julday(args.end_year, 1, 1, 0.0)
+    print(f"Building void-of-course calendar {out} for {args.start_year}-{args.end_year}...")
+    started = time.time()
+    calendar = VocCalendar.build(jd_start, jd_end, _swe_motion)
+    calendar.save(out)
+    print(f"✓ Wrote {len(calendar)} periods ({out.stat().st_size / 1024:.0f} KB) "
+          f"in {time.time() - started:.1f}s")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    table = commands.add_parser("table", help="Chebyshev position/speed table for the seven planets")
+    table.add_argument("--start-year", type=int, default=1900)
+    table.add_argument("--end-year", type=int, default=2100)
+    table.add_argument("--out", default=str(DATA_DIR / "ephemeris_table.bin"))
+    table.add_argument("--verify", type=int, default=0, metavar="N",
+                       help="check N random lookups per body against Swiss Ephemeris")
+    table.add_argument("--verify-only", action="store_true",
+                       help="only verify an existing table")
+    table.set_defaults(func=build_table)
+
+    stations = commands.add_parser("stations", help="retrograde/direct station index")
+    stations.add_argument("--start-year", type=int, default=1900)
+    stations.add_argument("--end-year", type=int, default=2100)
+    stations.add_argument("--out", default=str(DATA_DIR / "stations.bin"))
+    stations.set_defaults(func=build_stations)
+
+    ingresses = commands.add_parser("ingresses", help="sign-ingress index for the seven planets")
+    ingresses.add_argument("--start-year", type=int, default=1900)
+    ingresses.add_argument("--end-year", type=int, default=2100)
+    ingresses.add_argument("--out", default=str(DATA_DIR / "ingresses.bin"))
+    ingresses.set_defaults(func=build_ingresses)
+
+    voc = commands.add_parser("voc", help="void-of-course Moon calendar")
+    voc.add_argument("--start-year", type=int, default=1900)
+    voc.add_argument("--end-year", type=int, default=2100)
+    voc.add_argument("--out", default=str(DATA_DIR / "voc_calendar.bin"))
+    voc.set_defaults(func=build_voc)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Build the offline gazetteer used by safe_geocode and /api/locations/suggest.
+
+The input is a GeoNames cities dump (for example ``cities15000.txt`` or
+``cities5000.txt`` from https://download.geonames.org/export/dump/),
+optionally with ``admin1CodesASCII.txt`` for state/region names and
+``countryInfo.txt`` for country names. The output is written to
+``data/gazetteer.bin``, which ``geocoding.gazetteer_path`` in
+``horary_constants.yaml`` (or the ``HORARY_GAZETTEER`` environment variable)
+points at. The file is not checked in.
+
+Usage:
+    python build_gazetteer.py cities15000.txt --admin1 admin1CodesASCII.txt
+    python build_gazetteer.py cities500.txt --min-population 1000 --alternate-names
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pytz
+
+from horary_engine.services.gazetteer import Gazetteer, GazetteerEntry, write_gazetteer
+
+DATA_DIR = Path(__file__).parent / "data"
+
+# Friendlier names than pytz.country_names for countries people ask about often
+COUNTRY_NAMES = {
+    "GB": "United Kingdom",
+    "US": "United States",
+    "KR": "South Korea",
+    "KP": "North Korea",
+    "RU": "Russia",
+    "IR": "Iran",
+    "SY": "Syria",
+    "VN": "Vietnam",
+    "LA": "Laos",
+    "BO": "Bolivia",
+    "VE": "Venezuela",
+    "TZ": "Tanzania",
+    "MD": "Moldova",
+}
+
+
+def _tsv_rows(path: Path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#") or not line.strip():
+                continue
+            yield line.rstrip("\n").split("\t")
+
+
+def read_country_names(path: Path = None) -> dict:
+    names = {code.upper(): name for code, name in pytz.country_names.items()}
+    if path:
+        for row in _tsv_rows(path):
+            if len(row) > 4:
+                names[row[0]] = row[4]
+    names.update(COUNTRY_NAMES)
+    return names
+
+
+def read_admin1_names(path: Path = None) -> dict:
+    if not path:
+        return {}
+    return {row[0]: row[1] or row[2] for row in _tsv_rows(path) if len(row) > 2}
+
+
+def read_geonames(path: Path, admin1: dict, countries: dict, min_population: int,
+                  alternate_names: bool):
+    """Gazetteer entries from a GeoNames cities file (19 tab-separated columns)."""
+    for row in _tsv_rows(path):
+        if len(row) < 18 or not row[17]:
+            continue
+        population = int(row[14] or 0)
+        if population < min_population:
+            continue
+        names = [row[1], row[2]]
+        if alternate_names and row[3]:
+            names.extend(name for name in row[3].split(",") if name)
+        country = row[8]
+        yield GazetteerEntry(
+            names=names,
+            latitude=float(row[4]),
+            longitude=float(row[5]),
+            population=population,
+            timezone=row[17],
+            country_code=country,
+            admin_name=admin1.get(f"{country}.{row[10]}", ""),
+            admin_code=row[10],
+            country_name=countries.get(country, country),
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cities", type=Path, help="GeoNames cities file")
+    parser.add_argument("--admin1", type=Path, help="GeoNames admin1CodesASCII.txt")
+    parser.add_argument("--countries", type=Path, help="GeoNames countryInfo.txt")
+    parser.add_argument("--min-population", type=int, default=0)
+    parser.add_argument("--alternate-names", action="store_true",
+                        help="index every alternate spelling (larger file)")
+    parser.add_argument("--out", default=str(DATA_DIR / "gazetteer.bin"))
+    args = parser.parse_args(argv)
+
+    print(f"Building gazetteer {args.out} from {args.cities}...")
+    started = time.time()
+    entries = read_geonames(
+        args.cities, read_admin1_names(args.admin1), read_country_names(args.countries),
+        args.min_population, args.alternate_names,
+    )
+    count = write_gazetteer(args.out, entries)
+    gazetteer = Gazetteer(args.out)
+    print(f"✓ Wrote {count} places, {gazetteer.key_count} names, {len(gazetteer.zones)} timezones "
+          f"({Path(args.out).stat().st_size / 1024:.0f} KB) in {time.time() - started:.1f}s")
+    gazetteer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,10 +7,14 @@ Created for horary_engine.py refactor
 
 import os
 import yaml
+import hashlib
+import itertools
+import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Any, Dict, Optional
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Dict, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +24,111 @@ class HoraryError(Exception):
     pass
 
 
+# Aspect config keys (``Aspect.config_key``) with an orb under ``orbs``
+ASPECT_KEYS = ("conjunction", "sextile", "square", "trine", "opposition")
+
+# Traditional planets with a moiety under ``orbs.moieties``
+MOIETY_PLANETS = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn")
+
+# Every snapshot gets a new version, so caches keyed on it never see a reused
+# value the way they could with ``id(cfg())``
+_snapshot_versions = itertools.count(1)
+
+
+@dataclass(frozen=True, slots=True)
+class DignityWeights:
+    """Dignity scoring weights from the ``dignity`` section"""
+    rulership: float
+    exaltation: float
+    triplicity: float
+    detriment: float
+    fall: float
+    joy: float
+    angular: float
+    succedent: float
+    cadent: float
+    speed_bonus: float
+    speed_penalty: float
+    hayz_bonus: float
+    hayz_penalty: float
+
+
+# Every dignity weight is required; a missing one would silently score 0
+DIGNITY_WEIGHT_KEYS = tuple(DignityWeights.__dataclass_fields__)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, SimpleNamespace):
+        return {key: _plain(item) for key, item in vars(value).items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _config_digest(config: SimpleNamespace) -> str:
+    """Content hash of ``config``, independent of load order and process"""
+    text = json.dumps(_plain(config), sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Compiled, read-only view of the values hot loops read on every chart.
+
+    Built once per loaded configuration. ``version`` changes whenever the
+    configuration does, so derived caches can key on it. ``digest`` is a hash
+    of the configuration's content, stable across processes, for caches
+    shared between workers. ``moieties`` is
+    ``None`` when the configuration has no ``orbs.moieties`` section (the
+    legacy per-aspect orb system).
+    """
+    version: int
+    digest: str
+    config: SimpleNamespace
+    aspect_orbs: Mapping[str, float]
+    moieties: Optional[Mapping[str, float]]
+    sun_orb_bonus: float
+    moon_orb_bonus: float
+    dignity: DignityWeights
+
+    @classmethod
+    def compile(cls, config: SimpleNamespace) -> 'ConfigSnapshot':
+        orbs = getattr(config, 'orbs', SimpleNamespace())
+        aspect_orbs = {key: getattr(orbs, key) for key in ASPECT_KEYS if hasattr(orbs, key)}
+
+        moieties = None
+        if hasattr(orbs, 'moieties'):
+            moieties = MappingProxyType({
+                planet: getattr(orbs.moieties, planet)
+                for planet in MOIETY_PLANETS if hasattr(orbs.moieties, planet)
+            })
+
+        dignity = getattr(config, 'dignity', SimpleNamespace())
+        missing = [f"dignity.{name}" for name in DIGNITY_WEIGHT_KEYS if not hasattr(dignity, name)]
+        if missing:
+            raise HoraryError(f"Missing required configuration keys: {missing}")
+        weights = {name: getattr(dignity, name) for name in DIGNITY_WEIGHT_KEYS}
+
+        return cls(
+            version=next(_snapshot_versions),
+            digest=_config_digest(config),
+            config=config,
+            aspect_orbs=MappingProxyType(aspect_orbs),
+            moieties=moieties,
+            sun_orb_bonus=getattr(orbs, 'sun_orb_bonus', 0.0),
+            moon_orb_bonus=getattr(orbs, 'moon_orb_bonus', 0.0),
+            dignity=DignityWeights(**weights),
+        )
+
+
 class HoraryConfig:
     """Lazy singleton configuration loader for horary constants"""
     
     _instance: Optional['HoraryConfig'] = None
     _config: Optional[SimpleNamespace] = None
+    _snapshot: Optional[ConfigSnapshot] = None
+    _paths: Dict[str, Any] = {}
+    _paths_config: Optional[SimpleNamespace] = None
     
     def __new__(cls) -> 'HoraryConfig':
         if cls._instance is None:
@@ -83,6 +187,32 @@ class HoraryConfig:
             self._load_config()
         return self._config
     
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Compiled snapshot of the current configuration"""
+        config = self.config
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.config is not config:
+            snapshot = ConfigSnapshot.compile(config)
+            self._snapshot = snapshot
+        return snapshot
+    
+    def _resolve(self, key_path: str) -> Any:
+        """Resolve a dotted path, caching the result per loaded configuration"""
+        config = self.config
+        if self._paths_config is not config:
+            self._paths = {}
+            self._paths_config = config
+        try:
+            return self._paths[key_path]
+        except KeyError:
+            pass
+        value = config
+        for key in key_path.split('.'):
+            value = getattr(value, key)
+        self._paths[key_path] = value
+        return value
+    
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation path
@@ -95,10 +225,7 @@ class HoraryConfig:
             Configuration value or default
         """
         try:
-            value = self.config
-            for key in key_path.split('.'):
-                value = getattr(value, key)
-            return value
+            return self._resolve(key_path)
         except AttributeError:
             if default is not None:
                 return default
@@ -118,10 +245,7 @@ class HoraryConfig:
             HoraryError: If key is missing
         """
         try:
-            value = self.config
-            for key in key_path.split('.'):
-                value = getattr(value, key)
-            return value
+            return self._resolve(key_path)
         except AttributeError:
             raise HoraryError(f"Required configuration key missing: {key_path}")
     
@@ -135,7 +259,8 @@ class HoraryConfig:
             'confidence.lunar_confidence_caps.favorable',
             'confidence.lunar_confidence_caps.unfavorable',
             'radicality.asc_too_early',
-            'radicality.asc_too_late'
+            'radicality.asc_too_late',
+            *(f'dignity.{name}' for name in DIGNITY_WEIGHT_KEYS),
         ]
         
         missing_keys = []
@@ -153,6 +278,9 @@ class HoraryConfig:
         """Reset singleton for testing"""
         cls._instance = None
         cls._config = None
+        cls._snapshot = None
+        cls._paths = {}
+        cls._paths_config = None
 
 
 # Global configuration instance
@@ -167,6 +295,21 @@ def cfg() -> SimpleNamespace:
     return get_config().config
 
 
+def config_snapshot() -> ConfigSnapshot:
+    """Get the compiled snapshot of the current configuration"""
+    return get_config().snapshot
+
+
+def config_version() -> int:
+    """Version of the current configuration, for keying derived caches"""
+    return get_config().snapshot.version
+
+
+def config_digest() -> str:
+    """Content hash of the current configuration, for keying shared caches"""
+    return get_config().snapshot.digest
+
+
 # Validate configuration on import (unless in test environment)
 if os.environ.get('HORARY_CONFIG_SKIP_VALIDATION') != 'true':
     try:
@@ -4,16 +4,108 @@ from __future__ import annotations
 
 import datetime
 import math
+import threading
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import swisseph as swe
 
-from horary_config import cfg
+from horary_config import ConfigSnapshot, cfg, config_snapshot
 try:
     from ..models import Aspect, AspectInfo, LunarAspect, Planet, PlanetPosition
 except ImportError:  # pragma: no cover - fallback when executed as script
     from models import Aspect, AspectInfo, LunarAspect, Planet, PlanetPosition
-from .calculation.helpers import days_to_sign_exit
+from .calculation.aspect_kernel import AspectKernelResult, aspect_kernel
+from .calculation.helpers import days_to_sign_exit, exact_days_to_sign_exit
+
+
+# Planets and aspects covered by the orb matrix, in matrix order
+ORB_PLANETS: List[Planet] = [
+    Planet.SUN,
+    Planet.MOON,
+    Planet.MERCURY,
+    Planet.VENUS,
+    Planet.MARS,
+    Planet.JUPITER,
+    Planet.SATURN,
+]
+_ORB_INDEX: Dict[Planet, int] = {planet: i for i, planet in enumerate(ORB_PLANETS)}
+ORB_ASPECTS: Tuple[Aspect, ...] = tuple(Aspect)
+ORB_ASPECT_DEGREES = np.array([float(aspect.degrees) for aspect in ORB_ASPECTS])
+
+
+class OrbMatrix:
+    """Maximum orb for every planet pair and aspect under one configuration.
+
+    ``orbs[(planet1 * 7 + planet2) * 5 + aspect]`` is the value
+    :func:`aspect_orb` returns for that pair and aspect, so the aspect loop
+    reads a row of five orbs per pair instead of recomputing moieties.
+    ``grid`` holds the same values as a ``(7, 7, 5)`` array for the
+    vectorized aspect kernel.
+    """
+
+    __slots__ = ("version", "orbs", "grid")
+
+    def __init__(self, version: int, orbs: Tuple[float, ...]) -> None:
+        self.version = version
+        self.orbs = orbs
+        self.grid = np.array(orbs, dtype=float).reshape(
+            len(ORB_PLANETS), len(ORB_PLANETS), len(ORB_ASPECTS)
+        )
+
+    @classmethod
+    def build(cls, snapshot: ConfigSnapshot) -> "OrbMatrix":
+        orbs = tuple(
+            aspect_orb(planet1, planet2, aspect_type, snapshot)
+            for planet1 in ORB_PLANETS
+            for planet2 in ORB_PLANETS
+            for aspect_type in ORB_ASPECTS
+        )
+        return cls(snapshot.version, orbs)
+
+    def row(self, planet1: Planet, planet2: Planet) -> Optional[Tuple[float, ...]]:
+        """Orbs for every aspect in ``ORB_ASPECTS`` order (``None`` off the matrix)."""
+        i = _ORB_INDEX.get(planet1)
+        j = _ORB_INDEX.get(planet2)
+        if i is None or j is None:
+            return None
+        start = (i * len(ORB_PLANETS) + j) * len(ORB_ASPECTS)
+        return self.orbs[start:start + len(ORB_ASPECTS)]
+
+    def orb(self, planet1: Planet, planet2: Planet, aspect_type: Aspect) -> float:
+        row = self.row(planet1, planet2)
+        if row is None:
+            return aspect_orb(planet1, planet2, aspect_type)
+        return row[ORB_ASPECTS.index(aspect_type)]
+
+    def grid_for(self, planets: List[Planet]) -> np.ndarray:
+        """``(n, n, 5)`` orbs for an arbitrary planet list."""
+        if planets == ORB_PLANETS:
+            return self.grid
+        indices = [_ORB_INDEX.get(planet) for planet in planets]
+        if None not in indices:
+            return self.grid[np.ix_(indices, indices)]
+        return np.array([
+            [self.row(p1, p2) or tuple(aspect_orb(p1, p2, a) for a in ORB_ASPECTS) for p2 in planets]
+            for p1 in planets
+        ], dtype=float)
+
+
+_orb_matrix: Optional[OrbMatrix] = None
+_orb_matrix_lock = threading.Lock()
+
+
+def orb_matrix() -> OrbMatrix:
+    """The orb matrix for the active configuration, rebuilt when its version changes."""
+    global _orb_matrix
+    snapshot = config_snapshot()
+    matrix = _orb_matrix
+    if matrix is not None and matrix.version == snapshot.version:
+        return matrix
+    with _orb_matrix_lock:
+        if _orb_matrix is None or _orb_matrix.version != snapshot.version:
+            _orb_matrix = OrbMatrix.build(snapshot)
+        return _orb_matrix
 
 
 def _signed_longitude_delta(lon1: float, lon2: float) -> float:
@@ -97,7 +189,7 @@ def calculate_moon_last_aspect(
 
 def calculate_moon_next_aspect(
     planets: Dict[Planet, PlanetPosition],
-    _jd_ut: float,
+    jd_ut: float,
     ignore_orb_for_voc: bool = False,
 ) -> Optional[LunarAspect]:
     """Calculate Moon's next applying aspect.
@@ -148,7 +240,7 @@ def calculate_moon_next_aspect(
                 t = time_to_perfection(moon_pos, planet_pos, aspect_type)
                 if t > 0:
                     within_sign = _will_perfect_before_sign_exit(
-                        moon_pos, planet_pos, aspect_type, t
+                        moon_pos, planet_pos, aspect_type, t, jd_ut
                     )
 
                     # Skip aspects that perfect after either planet leaves its current sign
@@ -216,85 +308,107 @@ def format_timing_description(days: float) -> str:
 def calculate_enhanced_aspects(
     planets: Dict[Planet, PlanetPosition], jd_ut: float
 ) -> List[AspectInfo]:
-    """Enhanced aspect calculation with configuration"""
-    aspects: List[AspectInfo] = []
+    """Enhanced aspect calculation with configuration
+
+    Every pair and aspect is evaluated in one pass by the vectorized kernel;
+    ``AspectInfo`` objects are built only for the tightest in-orb aspect of
+    each pair.
+    """
     planet_list = list(planets.keys())
-    config = cfg()
+    if len(planet_list) < 2:
+        return []
+    positions = [planets[planet] for planet in planet_list]
 
-    for i, planet1 in enumerate(planet_list):
-        for planet2 in planet_list[i + 1 :]:
-            pos1 = planets[planet1]
-            pos2 = planets[planet2]
+    exits = [exact_days_to_sign_exit(planet, jd_ut) for planet in planet_list]
+    result = aspect_kernel(
+        [pos.longitude for pos in positions],
+        [pos.speed for pos in positions],
+        orb_matrix().grid_for(planet_list),
+        exact_exits=np.array([math.nan if e is None else e for e in exits]),
+        aspect_degrees=ORB_ASPECT_DEGREES,
+    )
 
-            # Calculate angular separation using signed delta
-            angle_diff = abs(_signed_longitude_delta(pos1.longitude, pos2.longitude))
+    return aspects_from_kernel(result, planet_list, positions, jd_ut)
 
-            # Check each traditional aspect
-            aspect_candidates: List[AspectInfo] = []
-            for aspect_type in Aspect:
-                orb_diff = abs(angle_diff - aspect_type.degrees)
 
-                # ENHANCED: Traditional moiety-based orb calculation
-                max_orb = calculate_moiety_based_orb(
-                    planet1, planet2, aspect_type, config
-                )
+def aspects_from_kernel(
+    result: AspectKernelResult, planet_list: List[Planet],
+    positions: List[PlanetPosition], jd_ut: float,
+) -> List[AspectInfo]:
+    """``AspectInfo`` for the tightest in-orb aspect of each pair of one chart."""
+    aspects: List[AspectInfo] = []
+    survivors = np.flatnonzero(result.best >= 0)
+    best = result.best[survivors]
+    pairs = result.pairs[survivors].tolist()
+    orbs = result.orb[survivors, best].tolist()
+    times = result.time_to_perfection[survivors, best].tolist()
+    applying = result.applying[survivors, best].tolist()
+    within_sign = result.within_sign[survivors, best].tolist()
+
+    for n, ((i, j), a) in enumerate(zip(pairs, best.tolist())):
+        pos1, pos2 = positions[i], positions[j]
+        aspect_type = ORB_ASPECTS[a]
+        t = times[n]
+
+        degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(
+            pos1, pos2, aspect_type, jd_ut, t
+        )
 
-                # Fallback to configured orbs if moiety system disabled
-                if max_orb == 0:
-                    max_orb = aspect_type.orb
-                    # Luminary bonuses (legacy)
-                    if Planet.SUN in [planet1, planet2]:
-                        max_orb += config.orbs.sun_orb_bonus
-                    if Planet.MOON in [planet1, planet2]:
-                        max_orb += config.orbs.moon_orb_bonus
-
-                if orb_diff <= max_orb:
-                    t = time_to_perfection(pos1, pos2, aspect_type)
-                    applying = t > 0 and math.isfinite(t)
-                    if applying:
-                        within_sign = _will_perfect_before_sign_exit(
-                            pos1, pos2, aspect_type, t
-                        )
-                    else:
-                        within_sign = False
+        aspects.append(
+            AspectInfo(
+                planet1=planet_list[i],
+                planet2=planet_list[j],
+                aspect=aspect_type,
+                orb=orbs[n],
+                applying=applying[n],
+                time_to_perfection=t,
+                perfection_within_sign=within_sign[n],
+                exact_time=exact_time,
+                degrees_to_exact=degrees_to_exact,
+            )
+        )
 
-                    degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(
-                        pos1, pos2, aspect_type, jd_ut, t
-                    )
+    return aspects
 
-                    aspect_candidates.append(
-                        AspectInfo(
-                            planet1=planet1,
-                            planet2=planet2,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            applying=applying,
-                            time_to_perfection=t,
-                            perfection_within_sign=within_sign,
-                            exact_time=exact_time,
-                            degrees_to_exact=degrees_to_exact,
-                        )
-                    )
 
-            if aspect_candidates:
-                # Choose candidate with smallest orb difference
-                best_aspect = min(aspect_candidates, key=lambda x: x.orb)
-                aspects.append(best_aspect)
+def aspect_orb(
+    planet1: Planet, planet2: Planet, aspect_type: Aspect,
+    snapshot: Optional[ConfigSnapshot] = None,
+) -> float:
+    """Maximum orb for ``aspect_type`` between two planets.
 
-    return aspects
+    Moiety-based, falling back to the configured per-aspect orb plus the
+    legacy Sun and Moon bonuses when the moiety system yields nothing.
+    """
+    snapshot = snapshot or config_snapshot()
+
+    # ENHANCED: Traditional moiety-based orb calculation
+    max_orb = calculate_moiety_based_orb(planet1, planet2, aspect_type, snapshot)
+
+    # Fallback to configured orbs if moiety system disabled
+    if max_orb == 0:
+        max_orb = aspect_type.orb
+        # Luminary bonuses (legacy)
+        if Planet.SUN in [planet1, planet2]:
+            max_orb += snapshot.sun_orb_bonus
+        if Planet.MOON in [planet1, planet2]:
+            max_orb += snapshot.moon_orb_bonus
+    return max_orb
 
 
 def calculate_moiety_based_orb(
-    planet1: Planet, planet2: Planet, aspect_type: Aspect, config
+    planet1: Planet, planet2: Planet, aspect_type: Aspect,
+    snapshot: Optional[ConfigSnapshot] = None,
 ) -> float:
     """Calculate traditional moiety-based orb for two planets (ENHANCED)"""
 
-    if not hasattr(config.orbs, "moieties"):
+    moieties = (snapshot or config_snapshot()).moieties
+    if moieties is None:
         return 0  # Fallback to legacy system
 
     # Get planetary full orb values and convert to moieties (half-orbs)
-    full_orb1 = getattr(config.orbs.moieties, planet1.value, 0.0)
-    full_orb2 = getattr(config.orbs.moieties, planet2.value, 0.0)
+    full_orb1 = moieties.get(planet1.value, 0.0)
+    full_orb2 = moieties.get(planet2.value, 0.0)
 
     moiety1 = full_orb1 / 2.0
     moiety2 = full_orb2 / 2.0
@@ -331,7 +445,7 @@ def is_applying_enhanced(
     applying = t > 0 and math.isfinite(t)
     if applying:
         perfection_within_sign = _will_perfect_before_sign_exit(
-            pos1, pos2, aspect, t
+            pos1, pos2, aspect, t, jd_ut
         )
     else:
         perfection_within_sign = False
@@ -377,13 +491,26 @@ def _calculate_orb_to_aspect_at_time(pos1: PlanetPosition, pos2: PlanetPosition,
 
 
 def _will_perfect_before_sign_exit(
-    pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect, t: float
+    pos1: PlanetPosition,
+    pos2: PlanetPosition,
+    aspect: Aspect,
+    t: float,
+    jd_ut: Optional[float] = None,
 ) -> bool:
-    """Check if aspect will perfect before either planet exits its current sign"""
+    """Check if aspect will perfect before either planet exits its current sign
+
+    With ``jd_ut`` the sign exits come from the ingress index (real motion)
+    where it covers the chart; otherwise they are projected from current speed.
+    """
 
     if t <= 0 or not math.isfinite(t):
         return False
 
+    exact_exit1 = exact_days_to_sign_exit(pos1.planet, jd_ut)
+    exact_exit2 = exact_days_to_sign_exit(pos2.planet, jd_ut)
+    if exact_exit1 is not None and exact_exit2 is not None:
+        return t <= exact_exit1 and t <= exact_exit2
+
     pos1_days_to_exit = days_to_sign_exit(pos1.longitude, pos1.speed)
     pos2_days_to_exit = days_to_sign_exit(pos2.longitude, pos2.speed)
 
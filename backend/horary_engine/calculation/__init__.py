@@ -5,6 +5,7 @@ from .helpers import (
     calculate_future_longitude,
     calculate_sign_boundary_longitude,
     days_to_sign_exit,
+    exact_days_to_sign_exit,
     is_within_sign_change,
     calculate_elongation,
     is_planet_oriental,
@@ -14,12 +15,15 @@ from .helpers import (
     normalize_longitude,
     degrees_to_dms,
 )
+from .ephemeris import EphemerisSnapshot, count_swe_calls
+from .aspect_kernel import AspectKernelResult, aspect_kernel
 
 __all__ = [
     "calculate_next_station_time",
     "calculate_future_longitude",
     "calculate_sign_boundary_longitude",
     "days_to_sign_exit",
+    "exact_days_to_sign_exit",
     "is_within_sign_change",
     "calculate_elongation",
     "is_planet_oriental",
@@ -28,4 +32,8 @@ __all__ = [
     "check_aspect_separation_order",
     "normalize_longitude",
     "degrees_to_dms",
+    "EphemerisSnapshot",
+    "count_swe_calls",
+    "AspectKernelResult",
+    "aspect_kernel",
 ]
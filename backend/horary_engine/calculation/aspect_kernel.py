@@ -0,0 +1,160 @@
+"""
+Vectorized all-pairs aspect kernel.
+
+Computes, for every planet pair and every Ptolemaic aspect at once, the
+quantities :func:`horary_engine.aspects.calculate_enhanced_aspects` needs:
+the orb from exact, whether the pair is within its allowed orb, the
+analytical time to perfection, whether the aspect is applying and whether it
+perfects before either planet leaves its sign. The arithmetic mirrors the
+scalar helpers (``time_to_perfection``, ``_will_perfect_before_sign_exit``,
+``days_to_sign_exit``) operation for operation, so results are identical.
+
+Inputs may carry any number of leading batch dimensions (``(..., planets)``),
+so scanning thousands of moments is a handful of array operations rather
+than a Python loop per pair, aspect and moment.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Ptolemaic aspect angles in ``Aspect`` enum order
+ASPECT_DEGREES = np.array([0.0, 60.0, 90.0, 120.0, 180.0])
+
+# Speeds below this (degrees/day) have no projected sign exit, as in
+# ``helpers.days_to_sign_exit``
+STATIONARY_SPEED = 0.001
+
+# A retrograde planet this close to the start of its sign has already
+# reached that boundary and heads for the previous one
+_BOUNDARY_EPSILON = 1e-6
+
+
+@dataclass
+class AspectKernelResult:
+    """All-pairs aspect quantities.
+
+    ``pairs`` holds the ``(i, j)`` planet indices (``i < j``) of each pair,
+    in nested-loop order. Per-aspect arrays have shape ``(..., pairs, aspects)``
+    and ``best`` has shape ``(..., pairs)``: the index of the in-orb aspect
+    with the smallest orb (the first such aspect on ties), or -1 when the
+    pair has no aspect in orb.
+    """
+    pairs: np.ndarray
+    orb: np.ndarray
+    in_orb: np.ndarray
+    time_to_perfection: np.ndarray
+    applying: np.ndarray
+    within_sign: np.ndarray
+    best: np.ndarray
+
+    def row(self, index) -> "AspectKernelResult":
+        """Result for one moment of a batched evaluation."""
+        return AspectKernelResult(
+            pairs=self.pairs,
+            orb=self.orb[index],
+            in_orb=self.in_orb[index],
+            time_to_perfection=self.time_to_perfection[index],
+            applying=self.applying[index],
+            within_sign=self.within_sign[index],
+            best=self.best[index],
+        )
+
+
+@lru_cache(maxsize=16)
+def _pair_indices(n_planets: int) -> Tuple[np.ndarray, np.ndarray]:
+    return np.triu_indices(n_planets, 1)
+
+
+def linear_days_to_sign_exit(longitudes: np.ndarray, speeds: np.ndarray) -> np.ndarray:
+    """Days to the next sign boundary in the direction of motion at current speed.
+
+    NaN where a planet is (nearly) stationary.
+    """
+    longitudes = np.asarray(longitudes, dtype=float) % 360
+    speeds = np.asarray(speeds, dtype=float)
+    sign_start = (longitudes // 30) * 30
+    forward = sign_start + 30 - longitudes
+    backward = longitudes - sign_start
+    backward = np.where(np.abs(backward) < _BOUNDARY_EPSILON, backward + 30, backward)
+    degrees = np.where(speeds > 0, forward, backward)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        days = degrees / np.abs(speeds)
+    return np.where(np.abs(speeds) < STATIONARY_SPEED, np.nan, days)
+
+
+def aspect_kernel(longitudes: Sequence[float], speeds: Sequence[float], max_orbs: np.ndarray,
+                  exact_exits: Optional[np.ndarray] = None,
+                  aspect_degrees: np.ndarray = ASPECT_DEGREES) -> AspectKernelResult:
+    """Evaluate every pair and aspect for one or many moments.
+
+    Args:
+        longitudes: Ecliptic longitudes, shape ``(..., planets)``
+        speeds: Longitudinal speeds in degrees/day, same shape
+        max_orbs: Allowed orb per ordered pair and aspect,
+            shape ``(planets, planets, aspects)``
+        exact_exits: Optional days until each planet really changes sign
+            (from the ingress index), same shape as ``longitudes``; NaN where
+            unknown. A pair uses exact exits only when both are known and
+            falls back to projecting current speed otherwise.
+        aspect_degrees: Aspect angles, shape ``(aspects,)``
+
+    Returns:
+        :class:`AspectKernelResult`
+    """
+    longitudes = np.asarray(longitudes, dtype=float)
+    speeds = np.asarray(speeds, dtype=float)
+    n_planets = longitudes.shape[-1]
+    first, second = _pair_indices(n_planets)
+
+    lon1 = longitudes[..., first, None]
+    lon2 = longitudes[..., second, None]
+    speed1 = speeds[..., first, None]
+    speed2 = speeds[..., second, None]
+
+    separation = np.abs((lon1 - lon2 + 180) % 360 - 180)
+    orb = np.abs(separation - aspect_degrees)
+    in_orb = orb <= np.asarray(max_orbs, dtype=float)[first, second]
+
+    # Time to perfection: minimal signed offset from exact over relative speed
+    delta = ((lon1 - lon2 - aspect_degrees + 180) % 360) - 180
+    relative_speed = speed1 - speed2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(relative_speed == 0, np.inf, -delta / relative_speed)
+    applying = (t > 0) & np.isfinite(t)
+
+    # Perfection before either planet leaves its sign
+    linear_exits = linear_days_to_sign_exit(longitudes, speeds)
+    linear1 = linear_exits[..., first, None]
+    linear2 = linear_exits[..., second, None]
+    with np.errstate(invalid="ignore"):
+        projected = (
+            ~(t > linear1)
+            & ~(t > linear2)
+            & ((lon1 // 30) == (((lon1 + speed1 * t) % 360) // 30))
+            & ((lon2 // 30) == (((lon2 + speed2 * t) % 360) // 30))
+        )
+    if exact_exits is not None:
+        exact_exits = np.asarray(exact_exits, dtype=float)
+        exact1 = exact_exits[..., first, None]
+        exact2 = exact_exits[..., second, None]
+        both_exact = ~np.isnan(exact1) & ~np.isnan(exact2)
+        with np.errstate(invalid="ignore"):
+            exact = (t <= exact1) & (t <= exact2)
+        projected = np.where(both_exact, exact, projected)
+    within_sign = applying & projected
+
+    masked = np.where(in_orb, orb, np.inf)
+    best = np.where(in_orb.any(axis=-1), np.argmin(masked, axis=-1), -1)
+
+    return AspectKernelResult(
+        pairs=np.stack([first, second], axis=-1),
+        orb=orb,
+        in_orb=in_orb,
+        time_to_perfection=t,
+        applying=applying,
+        within_sign=within_sign,
+        best=best,
+    )
@@ -0,0 +1,251 @@
+"""
+Swiss Ephemeris access for the horary engine.
+
+All ephemeris reads go through :func:`calc_ut` so that the number of calls
+made while serving a request can be counted, and every chart carries an
+immutable :class:`EphemerisSnapshot` holding the positions computed for its
+Julian day. Helpers that need the Sun or Moon at the chart moment read the
+snapshot instead of asking Swiss Ephemeris again.
+
+When a precomputed table is configured (``ephemeris.backend: table`` in
+``horary_constants.yaml`` or the ``HORARY_EPHEMERIS_TABLE`` environment
+variable), position lookups inside its date range are answered from the
+memory-mapped table and everything else falls through to Swiss Ephemeris.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+import swisseph as swe
+
+from horary_config import cfg
+from .ephemeris_table import EphemerisTable, EphemerisTableError
+
+
+logger = logging.getLogger(__name__)
+
+# Flags used for every position lookup (ecliptic position plus daily speed)
+EPHEMERIS_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+class SweCallCounter:
+    """Number of Swiss Ephemeris calls made while the counter is active.
+
+    Lookups answered by the precomputed table are listed under ``"table"`` in
+    ``by_function`` but are not Swiss Ephemeris calls, so ``calls`` skips them.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.by_function: Dict[str, int] = defaultdict(int)
+
+    def record(self, function_name: str) -> None:
+        if function_name != "table":
+            self.calls += 1
+        self.by_function[function_name] += 1
+
+    def merge(self, other: "SweCallCounter") -> None:
+        self.calls += other.calls
+        for name, count in other.by_function.items():
+            self.by_function[name] += count
+
+    def as_dict(self) -> Dict[str, object]:
+        return {"calls": self.calls, "by_function": dict(self.by_function)}
+
+
+_active_counter: ContextVar[Optional[SweCallCounter]] = ContextVar(
+    "swe_call_counter", default=None
+)
+
+
+@contextmanager
+def count_swe_calls() -> Iterator[SweCallCounter]:
+    """Count Swiss Ephemeris calls made inside the ``with`` block.
+
+    Counters are context-local, so concurrent requests served by different
+    threads each see only their own calls.
+    """
+    counter = SweCallCounter()
+    token = _active_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _active_counter.reset(token)
+
+
+def _record(function_name: str) -> None:
+    counter = _active_counter.get()
+    if counter is not None:
+        counter.record(function_name)
+
+
+_table: Optional[EphemerisTable] = None
+_table_resolved = False
+_table_lock = threading.Lock()
+
+
+def resolve_data_path(env_var: str, setting: str) -> Optional[Path]:
+    """Path of a precomputed data file from ``env_var`` or ``ephemeris.<setting>``.
+
+    Relative config paths are resolved against the backend directory.
+    """
+    env_path = os.environ.get(env_var)
+    if env_path:
+        return Path(env_path)
+    value = getattr(getattr(cfg(), "ephemeris", None), setting, None)
+    if not value:
+        return None
+    path = Path(value)
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parents[2] / path
+    return path
+
+
+def _configured_table_path() -> Optional[Path]:
+    backend = getattr(getattr(cfg(), "ephemeris", None), "backend", "swisseph")
+    if backend != "table" and not os.environ.get("HORARY_EPHEMERIS_TABLE"):
+        return None
+    return resolve_data_path("HORARY_EPHEMERIS_TABLE", "table_path")
+
+
+def get_ephemeris_table() -> Optional[EphemerisTable]:
+    """Return the configured precomputed table, loading it on first use."""
+    global _table, _table_resolved
+    if _table_resolved:
+        return _table
+    with _table_lock:
+        if not _table_resolved:
+            path = _configured_table_path()
+            if path is not None:
+                try:
+                    _table = EphemerisTable(path)
+                except EphemerisTableError as e:
+                    logger.warning(f"{e} - falling back to Swiss Ephemeris")
+            _table_resolved = True
+    return _table
+
+
+def set_ephemeris_table(table: Optional[EphemerisTable]) -> None:
+    """Install ``table`` as the active backend (``None`` forces Swiss Ephemeris)."""
+    global _table, _table_resolved
+    with _table_lock:
+        _table = table
+        _table_resolved = True
+
+
+def calc_ut(jd_ut: float, planet_id: int, flags: int = EPHEMERIS_FLAGS):
+    """Counted wrapper around ``swe.calc_ut``.
+
+    Plain geocentric lookups inside the precomputed table's range are served
+    from the table; any other flags always go to Swiss Ephemeris.
+    """
+    table = get_ephemeris_table()
+    if table is not None and not (flags & ~EPHEMERIS_FLAGS) and table.covers(jd_ut, planet_id):
+        _record("table")
+        return table.position(jd_ut, planet_id), flags
+    _record("calc_ut")
+    return swe.calc_ut(jd_ut, planet_id, flags)
+
+
+def houses(jd_ut: float, lat: float, lon: float, house_system: bytes = b'R'):
+    """Counted wrapper around ``swe.houses`` (Regiomontanus by default)."""
+    _record("houses")
+    return swe.houses(jd_ut, lat, lon, house_system)
+
+
+def azalt(jd_ut: float, lat: float, lon: float, ecliptic_position: Tuple[float, float, float]):
+    """Counted wrapper around ``swe.azalt`` for an ecliptic position."""
+    _record("azalt")
+    geopos = (lon, lat, 0)  # Observer position (east positive)
+    return swe.azalt(
+        jd_ut,
+        swe.ECL2HOR,
+        geopos,
+        0,  # Atmospheric pressure (ignored)
+        0,  # Atmospheric temperature (ignored)
+        ecliptic_position,
+    )
+
+
+@dataclass(frozen=True)
+class EphemerisSnapshot:
+    """Immutable ephemeris data for one chart moment and location.
+
+    ``bodies`` maps Swiss Ephemeris planet ids to the raw ``calc_ut`` tuple
+    ``(longitude, latitude, distance, speed_lon, speed_lat, speed_dist)``.
+    ``swe_calls`` records how many ephemeris calls were needed to build it.
+    """
+
+    jd_ut: float
+    latitude: float
+    longitude: float
+    bodies: Mapping[int, Tuple[float, ...]] = field(default_factory=dict)
+    sun_altitude: Optional[float] = None
+    swe_calls: int = 0
+
+    @classmethod
+    def capture(cls, jd_ut: float, lat: float, lon: float,
+                planet_ids: Iterable[int]) -> "EphemerisSnapshot":
+        """Compute every requested body once, plus the Sun's altitude."""
+        with count_swe_calls() as counter:
+            bodies: Dict[int, Tuple[float, ...]] = {}
+            for planet_id in planet_ids:
+                try:
+                    data, _ = calc_ut(jd_ut, planet_id)
+                    bodies[planet_id] = tuple(data)
+                except Exception as e:
+                    logger.error(f"Ephemeris lookup failed for body {planet_id}: {e}")
+
+            sun_altitude = None
+            sun = bodies.get(swe.SUN)
+            if sun is not None:
+                try:
+                    _, altitude, _ = azalt(jd_ut, lat, lon, sun[:3])
+                    sun_altitude = float(altitude)
+                except Exception as e:
+                    logger.warning(f"Sun altitude calculation failed: {e}")
+
+        # Fold the snapshot's own calls into any enclosing request counter
+        outer = _active_counter.get()
+        if outer is not None:
+            outer.merge(counter)
+
+        return cls(
+            jd_ut=jd_ut,
+            latitude=lat,
+            longitude=lon,
+            bodies=MappingProxyType(bodies),
+            sun_altitude=sun_altitude,
+            swe_calls=counter.calls,
+        )
+
+    def __reduce__(self):
+        # MappingProxyType does not pickle; rebuild it from a plain dict
+        return (_restore_snapshot, (self.jd_ut, self.latitude, self.longitude,
+                                    dict(self.bodies), self.sun_altitude, self.swe_calls))
+
+    def covers(self, jd_ut: float) -> bool:
+        """True when the snapshot was taken at ``jd_ut``."""
+        return self.jd_ut == jd_ut
+
+    def body(self, planet_id: int) -> Optional[Tuple[float, ...]]:
+        """Raw ``calc_ut`` tuple for ``planet_id`` or ``None`` if unavailable."""
+        return self.bodies.get(planet_id)
+
+    def speed(self, planet_id: int) -> Optional[float]:
+        """Daily longitudinal speed for ``planet_id`` (signed)."""
+        data = self.bodies.get(planet_id)
+        return data[3] if data is not None else None
+
+
+def _restore_snapshot(jd_ut: float, latitude: float, longitude: float, bodies: Dict[int, Tuple[float, ...]],
+                      sun_altitude: Optional[float], swe_calls: int) -> EphemerisSnapshot:
+    return EphemerisSnapshot(jd_ut, latitude, longitude, MappingProxyType(bodies), sun_altitude, swe_calls)
@@ -0,0 +1,247 @@
+"""
+Precomputed Chebyshev ephemeris table for the seven traditional planets.
+
+The table is a flat binary file produced by ``build_ephemeris_data.py table``
+from Swiss Ephemeris. Each planet's motion over the covered date range is
+split into fixed-length segments and every segment stores Chebyshev
+coefficients for ecliptic longitude, latitude and distance. Daily speeds are
+the analytic derivatives of the same series, so a lookup returns the same
+``(lon, lat, dist, speed_lon, speed_lat, speed_dist)`` tuple as
+``swe.calc_ut`` with ``FLG_SPEED``.
+
+The file is opened with ``mmap`` in read-only mode, so every worker process
+maps the same pages from the OS page cache instead of holding a private copy.
+
+File layout (little-endian)::
+
+    header   : magic "HRYEPH01", version u32, body count u32,
+               jd_start f64, jd_end f64
+    directory: per body -> planet id i32, coefficient count u32,
+               segment days f64, segment count u32, padding u32,
+               data offset u64
+    data     : per segment -> 3 x coefficient count f64
+               (longitude, latitude, distance)
+
+Accuracy against Swiss Ephemeris, measured over 1900-2100 with dense samples
+around every solar conjunction and station (worst case, rounded up; see
+:data:`ACCURACY` and :func:`accuracy_bound`):
+
+    Sun, Moon                    : position within 0.001", speed within 2e-4 deg/day
+    Mercury - Saturn, > 5 deg from
+    the Sun (stations included)  : position within 0.5", speed within 5e-4 deg/day
+    Mercury - Saturn, within 5 deg
+    of the Sun                   : position within 6", speed within 0.15 deg/day
+
+The conjunction case is set by solar light deflection, which Swiss Ephemeris
+switches on sharply as a planet nears the solar limb; no segment length the
+table can afford follows that kink, so the speed error there reaches about
+0.12 deg/day for Mercury and 0.03 deg/day for Jupiter and Saturn. Positions
+stay far below anything the judgment rules can see (the tightest orb is
+measured in minutes of arc); callers that compare speeds of a planet
+combust or under the beams should allow for the conjunction bound.
+"""
+
+import logging
+import math
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"HRYEPH01"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIdd")
+_DIRECTORY_ENTRY = struct.Struct("<iIdIIQ")
+
+# Segment length (days) and Chebyshev coefficient count per Swiss Ephemeris id.
+# Halving the planetary segments barely moves the conjunction bound (it is set
+# by light deflection near the solar limb), so the longer spans are kept.
+SEGMENT_LAYOUT: Dict[int, Tuple[float, int]] = {
+    0: (16.0, 14),  # Sun
+    1: (8.0, 14),   # Moon
+    2: (8.0, 14),   # Mercury
+    3: (16.0, 14),  # Venus
+    4: (16.0, 14),  # Mars
+    5: (32.0, 12),  # Jupiter
+    6: (32.0, 12),  # Saturn
+}
+
+
+# Documented worst-case |table - swe.calc_ut| as (position in arc-seconds,
+# longitude speed in deg/day), keyed by regime. ``conjunction`` applies to
+# Mercury - Saturn within CONJUNCTION_ELONGATION degrees of the Sun.
+ACCURACY: Dict[str, Tuple[float, float]] = {
+    "luminaries": (0.001, 2e-4),
+    "planets": (0.5, 5e-4),
+    "conjunction": (6.0, 0.15),
+}
+CONJUNCTION_ELONGATION = 5.0
+
+
+def accuracy_bound(planet_id: int, elongation: float) -> Tuple[float, float]:
+    """Documented error bound for ``planet_id`` at ``elongation`` degrees from the Sun."""
+    if planet_id in (0, 1):
+        return ACCURACY["luminaries"]
+    if abs(elongation) <= CONJUNCTION_ELONGATION:
+        return ACCURACY["conjunction"]
+    return ACCURACY["planets"]
+
+
+class EphemerisTableError(Exception):
+    """Raised when an ephemeris table file is missing or malformed."""
+    pass
+
+
+def chebyshev_nodes(count: int):
+    """Chebyshev points of the first kind on [-1, 1]."""
+    return [math.cos(math.pi * (j + 0.5) / count) for j in range(count)]
+
+
+def chebyshev_fit(samples) -> list:
+    """Coefficients interpolating ``samples`` taken at :func:`chebyshev_nodes`."""
+    count = len(samples)
+    coeffs = []
+    for k in range(count):
+        total = 0.0
+        for j, value in enumerate(samples):
+            total += value * math.cos(math.pi * k * (j + 0.5) / count)
+        coeffs.append(2.0 * total / count)
+    coeffs[0] /= 2.0
+    return coeffs
+
+
+def _evaluate(coeffs, x: float) -> Tuple[float, float]:
+    """Clenshaw evaluation of a Chebyshev series and its derivative at ``x``."""
+    b1 = b2 = 0.0
+    d1 = d2 = 0.0
+    for c in reversed(coeffs[1:]):
+        # T-series recurrence and its derivative with respect to x
+        d1, d2 = 2.0 * b1 + 2.0 * x * d1 - d2, d1
+        b1, b2 = 2.0 * x * b1 - b2 + c, b1
+    value = x * b1 - b2 + coeffs[0]
+    derivative = b1 + x * d1 - d2
+    return value, derivative
+
+
+class _BodyTable:
+    __slots__ = ("planet_id", "coefficients", "segment_days", "segments",
+                 "offset", "_segment_struct")
+
+    def __init__(self, planet_id: int, coefficients: int, segment_days: float,
+                 segments: int, offset: int) -> None:
+        self.planet_id = planet_id
+        self.coefficients = coefficients
+        self.segment_days = segment_days
+        self.segments = segments
+        self.offset = offset
+        self._segment_struct = struct.Struct(f"<{3 * coefficients}d")
+
+    @property
+    def segment_bytes(self) -> int:
+        return self._segment_struct.size
+
+
+class EphemerisTable:
+    """Read-only, memory-mapped Chebyshev ephemeris table."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise EphemerisTableError(f"Cannot open ephemeris table {self.path}: {e}")
+
+        try:
+            magic, version, count, jd_start, jd_end = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error as e:
+            raise EphemerisTableError(f"Truncated ephemeris table {self.path}: {e}")
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise EphemerisTableError(
+                f"Unsupported ephemeris table {self.path} (magic={magic!r}, version={version})"
+            )
+
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self._bodies: Dict[int, _BodyTable] = {}
+        position = _HEADER.size
+        for _ in range(count):
+            planet_id, coeffs, seg_days, segs, _pad, offset = _DIRECTORY_ENTRY.unpack_from(
+                self._mmap, position
+            )
+            position += _DIRECTORY_ENTRY.size
+            body = _BodyTable(planet_id, coeffs, seg_days, segs, offset)
+            if offset + segs * body.segment_bytes > len(self._mmap):
+                raise EphemerisTableError(f"Ephemeris table {self.path} is truncated")
+            self._bodies[planet_id] = body
+
+        logger.info(
+            f"Loaded ephemeris table {self.path} covering JD {jd_start:.1f}-{jd_end:.1f} "
+            f"for {len(self._bodies)} bodies"
+        )
+
+    def covers(self, jd_ut: float, planet_id: int) -> bool:
+        """True when ``planet_id`` at ``jd_ut`` can be answered from the table."""
+        return planet_id in self._bodies and self.jd_start <= jd_ut < self.jd_end
+
+    def position(self, jd_ut: float, planet_id: int) -> Tuple[float, float, float, float, float, float]:
+        """Return ``(lon, lat, dist, speed_lon, speed_lat, speed_dist)`` like ``swe.calc_ut``."""
+        body = self._bodies.get(planet_id)
+        if body is None or not (self.jd_start <= jd_ut < self.jd_end):
+            raise EphemerisTableError(f"JD {jd_ut} for body {planet_id} is outside the table")
+
+        elapsed = jd_ut - self.jd_start
+        index = min(int(elapsed // body.segment_days), body.segments - 1)
+        seg_start = index * body.segment_days
+        x = 2.0 * (elapsed - seg_start) / body.segment_days - 1.0
+        scale = 2.0 / body.segment_days  # d(x)/d(jd)
+
+        values = body._segment_struct.unpack_from(
+            self._mmap, body.offset + index * body.segment_bytes
+        )
+        n = body.coefficients
+        lon, dlon = _evaluate(values[0:n], x)
+        lat, dlat = _evaluate(values[n:2 * n], x)
+        dist, ddist = _evaluate(values[2 * n:3 * n], x)
+        return (lon % 360.0, lat, dist, dlon * scale, dlat * scale, ddist * scale)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def write_table(path: Union[str, Path], jd_start: float, jd_end: float,
+                sample, layout: Optional[Dict[int, Tuple[float, int]]] = None) -> None:
+    """Build a table file by sampling ``sample(jd, planet_id) -> (lon, lat, dist)``.
+
+    Longitudes are unwrapped around each segment's midpoint so that segments
+    crossing 0 Aries stay continuous.
+    """
+    layout = layout or SEGMENT_LAYOUT
+    span = jd_end - jd_start
+    bodies = []
+    offset = _HEADER.size + _DIRECTORY_ENTRY.size * len(layout)
+    for planet_id, (seg_days, coeffs) in layout.items():
+        segments = int(math.ceil(span / seg_days))
+        bodies.append((planet_id, coeffs, seg_days, segments, offset))
+        offset += segments * 3 * coeffs * 8
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(bodies), jd_start, jd_end))
+        for planet_id, coeffs, seg_days, segments, data_offset in bodies:
+            f.write(_DIRECTORY_ENTRY.pack(planet_id, coeffs, seg_days, segments, 0, data_offset))
+        for planet_id, coeffs, seg_days, segments, _ in bodies:
+            nodes = chebyshev_nodes(coeffs)
+            packer = struct.Struct(f"<{3 * coeffs}d")
+            for index in range(segments):
+                a = jd_start + index * seg_days
+                mid_lon = sample(a + seg_days / 2.0, planet_id)[0]
+                lons, lats, dists = [], [], []
+                for x in nodes:
+                    lon, lat, dist = sample(a + (x + 1.0) * seg_days / 2.0, planet_id)
+                    lons.append(mid_lon + (lon - mid_lon + 180.0) % 360.0 - 180.0)
+                    lats.append(lat)
+                    dists.append(dist)
+                f.write(packer.pack(*chebyshev_fit(lons), *chebyshev_fit(lats), *chebyshev_fit(dists)))
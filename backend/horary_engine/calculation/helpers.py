@@ -18,12 +18,19 @@ import datetime
 from typing import Tuple, Optional, Dict, Any
 import swisseph as swe
 
+from .ephemeris import EphemerisSnapshot, azalt, calc_ut
+from .ingress_index import PLANET_IDS, next_sign_ingress
+from .station_index import STATION_PLANETS, find_next_station, get_station_index
+
 
 def calculate_next_station_time(planet_id: int, jd_start: float, 
                                max_days: int = 365) -> Optional[float]:
     """
     Calculate when a planet will next station (turn retrograde/direct)
     using Swiss Ephemeris.
+    
+    Dates inside the precomputed station index are answered by binary search;
+    beyond it the planet's speed is bracketed and refined with a root finder.
     
     Args:
         planet_id: Swiss Ephemeris planet ID
@@ -35,69 +42,28 @@ def calculate_next_station_time(planet_id: int, jd_start: float,
     
     Classical source: Lilly III Chap. XXI - "Of the frustration of Planets"
     """
-    step_size = 0.1  # Check every 0.1 days
+    if planet_id not in STATION_PLANETS:
+        return None  # Sun and Moon never station
+    
+    max_jd = jd_start + max_days
+    search_from = jd_start
     
     try:
-        # Get initial speed
-        initial_data, _ = swe.calc_ut(jd_start, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-        initial_speed = initial_data[3]
-        
-        # Search forward in time
-        current_jd = jd_start + step_size
-        max_jd = jd_start + max_days
+        index = get_station_index()
+        if index is not None and index.covers(jd_start, planet_id):
+            station = index.next_station(planet_id, jd_start)
+            if station is not None:
+                return station[0] if station[0] < max_jd else None
+            # No station left in the index - continue searching past its end
+            search_from = index.jd_end
+            if search_from >= max_jd:
+                return None
         
-        previous_speed = initial_speed
-        
-        while current_jd < max_jd:
-            try:
-                planet_data, _ = swe.calc_ut(current_jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-                current_speed = planet_data[3]
-                
-                # Check for sign change in speed (station)
-                if (previous_speed > 0 and current_speed < 0) or (previous_speed < 0 and current_speed > 0):
-                    # Found a station, refine the timing
-                    return _refine_station_time(planet_id, current_jd - step_size, current_jd)
-                
-                previous_speed = current_speed
-                current_jd += step_size
-                
-            except Exception:
-                # Skip errors and continue
-                current_jd += step_size
-                continue
+        found = find_next_station(lambda jd: calc_ut(jd, planet_id)[0][3], search_from, max_jd)
+        return found[0] if found is not None else None
     
     except Exception:
-        pass
-    
-    return None
-
-
-def _refine_station_time(planet_id: int, jd_before: float, jd_after: float) -> float:
-    """Refine station time to higher precision using binary search"""
-    tolerance = 0.001  # About 1.5 minutes
-    
-    while (jd_after - jd_before) > tolerance:
-        jd_mid = (jd_before + jd_after) / 2
-        
-        try:
-            data_before, _ = swe.calc_ut(jd_before, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            data_mid, _ = swe.calc_ut(jd_mid, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            
-            speed_before = data_before[3]
-            speed_mid = data_mid[3]
-            
-            # Check which side of midpoint the station is on
-            if (speed_before > 0 and speed_mid > 0) or (speed_before < 0 and speed_mid < 0):
-                # Station is after midpoint
-                jd_before = jd_mid
-            else:
-                # Station is before midpoint
-                jd_after = jd_mid
-                
-        except Exception:
-            break
-    
-    return (jd_before + jd_after) / 2
+        return None
 
 
 def calculate_future_longitude(longitude: float, speed: float, days: float) -> float:
@@ -150,19 +116,47 @@ def calculate_sign_boundary_longitude(current_longitude: float, direction: int)
     return next_boundary
 
 
-def days_to_sign_exit(longitude: float, speed: float) -> Optional[float]:
+def exact_days_to_sign_exit(planet: Any, jd_ut: Optional[float]) -> Optional[float]:
+    """
+    Days until ``planet`` really changes sign after ``jd_ut``, from the
+    precomputed ingress index.
+    
+    Returns None when either argument is missing or the index does not
+    cover the moment, so callers can fall back to :func:`days_to_sign_exit`.
+    """
+    if planet is None or jd_ut is None:
+        return None
+    planet_id = PLANET_IDS.get(getattr(planet, "value", planet))
+    if planet_id is None:
+        return None
+    ingress_jd = next_sign_ingress(planet_id, jd_ut)
+    return ingress_jd - jd_ut if ingress_jd is not None else None
+
+
+def days_to_sign_exit(longitude: float, speed: float, planet: Any = None,
+                      jd_ut: Optional[float] = None) -> Optional[float]:
     """
     Calculate days until planet exits current sign based on motion direction.
+    
+    When ``planet`` and ``jd_ut`` are given and the ingress index covers that
+    moment, the exact time of the planet's next sign change is returned. The
+    linear estimate from current speed is used otherwise.
     
     Args:
         longitude: Current longitude in degrees
         speed: Speed in degrees per day (negative for retrograde)
+        planet: Planet enum (or its name) for an exact ingress lookup
+        jd_ut: Julian Day of ``longitude``/``speed``
     
     Returns:
         Days until sign exit, or None if stationary
     
     Classical source: Lilly III Chap. XXV - "Of timing in horary questions"
     """
+    exact = exact_days_to_sign_exit(planet, jd_ut)
+    if exact is not None:
+        return exact
+    
     if abs(speed) < 0.001:  # Nearly stationary
         return None
     
@@ -263,7 +257,8 @@ def is_planet_oriental(planet_longitude: float, sun_longitude: float) -> bool:
 
 
 def sun_altitude_at_civil_twilight(latitude: float, longitude: float, 
-                                  jd_ut: float) -> float:
+                                  jd_ut: float,
+                                  snapshot: Optional[EphemerisSnapshot] = None) -> float:
     """
     Calculate Sun's altitude at civil twilight for visibility calculations.
     
@@ -271,28 +266,28 @@ def sun_altitude_at_civil_twilight(latitude: float, longitude: float,
         latitude: Observer latitude in degrees
         longitude: Observer longitude in degrees  
         jd_ut: Julian Day (UT)
+        snapshot: Chart ephemeris snapshot; reused when it covers ``jd_ut``
     
     Returns:
         Sun's altitude in degrees (negative below horizon)
 
     Classical source: Al-Biruni - planetary visibility and heliacal risings
     """
+    if (snapshot is not None and snapshot.covers(jd_ut)
+            and snapshot.sun_altitude is not None
+            and (snapshot.latitude, snapshot.longitude) == (latitude, longitude)):
+        return snapshot.sun_altitude
+
     try:
         # Calculate ecliptic position of the Sun
-        sun_data, _ = swe.calc_ut(jd_ut, swe.SUN, swe.FLG_SWIEPH)
+        sun_data, _ = calc_ut(jd_ut, swe.SUN, swe.FLG_SWIEPH)
         sun_longitude = sun_data[0]
         sun_latitude = sun_data[1]
         sun_distance = sun_data[2]
 
         # Convert ecliptic coordinates to altitude/azimuth
-        geopos = (longitude, latitude, 0)  # Observer position (east positive)
-        _, altitude, _ = swe.azalt(
-            jd_ut,
-            swe.ECL2HOR,
-            geopos,
-            0,  # Atmospheric pressure (ignored)
-            0,  # Atmospheric temperature (ignored)
-            (sun_longitude, sun_latitude, sun_distance),
+        _, altitude, _ = azalt(
+            jd_ut, latitude, longitude, (sun_longitude, sun_latitude, sun_distance)
         )
 
         return float(altitude)
@@ -302,20 +297,27 @@ def sun_altitude_at_civil_twilight(latitude: float, longitude: float,
         return -8.0
 
 
-def calculate_moon_variable_speed(jd_ut: float) -> float:
+def calculate_moon_variable_speed(jd_ut: float,
+                                  snapshot: Optional[EphemerisSnapshot] = None) -> float:
     """
     Get Moon's current speed from ephemeris for variable timing calculations.
     
     Args:
         jd_ut: Julian Day (UT)
+        snapshot: Chart ephemeris snapshot; reused when it covers ``jd_ut``
     
     Returns:
         Moon's speed in degrees per day
     
     Classical source: Lilly III Chap. XXV - Moon's variable motion in timing
     """
+    if snapshot is not None and snapshot.covers(jd_ut):
+        moon_speed = snapshot.speed(swe.MOON)
+        if moon_speed is not None:
+            return abs(moon_speed)
+
     try:
-        moon_data, _ = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        moon_data, _ = calc_ut(jd_ut, swe.MOON)
         return abs(moon_data[3])  # Return absolute speed
     except Exception:
         return 13.0  # Classical average fallback
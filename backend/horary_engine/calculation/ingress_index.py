@@ -0,0 +1,220 @@
+"""
+Precomputed index of sign ingresses.
+
+Every time one of the seven planets changes sign over a long date range is
+stored as a sorted list of Julian days per planet, so the exact moment a
+planet leaves its current sign is a binary search instead of an estimate
+from its current speed. This matters for the Moon, whose speed varies by
+several degrees a day, and for planets close to a station, which a linear
+estimate sends out of sign long before (or long after) they really leave.
+
+The index is built by ``build_ephemeris_data.py ingresses`` and loaded from
+``ephemeris.ingress_index_path`` (or the ``HORARY_INGRESS_INDEX``
+environment variable) when the file exists. Lookups go through a small LRU
+because the perfection pipeline asks for the same planet at the same chart
+moment many times.
+
+File layout (little-endian)::
+
+    header : magic "HRYING01", version u32, body count u32,
+             jd_start f64, jd_end f64
+    bodies : per body -> planet id i32, ingress count u32,
+             ingress count x f64 Julian day,
+             ingress count x u8 sign entered (0 = Aries ... 11 = Pisces)
+"""
+
+import logging
+import struct
+import threading
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .ephemeris import resolve_data_path
+from .station_index import refine_root
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"HRYING01"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIdd")
+_BODY = struct.Struct("<iI")
+
+# Swiss Ephemeris ids by planet name (``Planet.value``)
+PLANET_IDS: Dict[str, int] = {
+    "Sun": 0,
+    "Moon": 1,
+    "Mercury": 2,
+    "Venus": 3,
+    "Mars": 4,
+    "Jupiter": 5,
+    "Saturn": 6,
+}
+
+# Scan step in days per body: short enough that no body crosses two sign
+# boundaries in one step. Steps containing a station are rescanned at a
+# tenth of this so brief excursions over a boundary are not missed.
+INGRESS_SCAN_STEP: Dict[int, float] = {0: 1.0, 1: 0.25, 2: 0.5, 3: 1.0, 4: 1.0, 5: 2.0, 6: 2.0}
+
+# Root-finder tolerance in days (under a second)
+INGRESS_TOLERANCE = 1e-5
+
+INGRESS_CACHE_SIZE = 4096
+
+
+class IngressIndexError(Exception):
+    """Raised when an ingress index file is missing or malformed."""
+    pass
+
+
+def _boundary_offset(longitude: float, boundary: float) -> float:
+    return (longitude - boundary + 180.0) % 360.0 - 180.0
+
+
+def scan_ingresses(sample: Callable[[float], Tuple[float, float]], jd_start: float,
+                    jd_end: float, step: float, out: List[Tuple[float, int]],
+                    subdivide: bool = True) -> None:
+    """Append ``(jd, sign entered)`` for every sign change in ``[jd_start, jd_end)``."""
+    jd = jd_start
+    lon, speed = sample(jd)
+    while jd < jd_end:
+        next_jd = min(jd + step, jd_end)
+        next_lon, next_speed = sample(next_jd)
+        if subdivide and speed * next_speed < 0:
+            # A station inside this step - rescan it finely
+            scan_ingresses(sample, jd, next_jd, step / 10.0, out, subdivide=False)
+        else:
+            sign, next_sign = int(lon // 30) % 12, int(next_lon // 30) % 12
+            if sign != next_sign:
+                direct = _boundary_offset(next_lon, lon) > 0
+                boundary = ((sign + 1) % 12) * 30.0 if direct else sign * 30.0
+
+                def offset_at(t: float) -> float:
+                    return _boundary_offset(sample(t)[0], boundary)
+
+                crossing = refine_root(
+                    offset_at, jd, _boundary_offset(lon, boundary),
+                    next_jd, _boundary_offset(next_lon, boundary), INGRESS_TOLERANCE,
+                )
+                out.append((crossing, next_sign))
+        jd, lon, speed = next_jd, next_lon, next_speed
+
+
+class IngressIndex:
+    """Sorted sign-ingress times per planet over ``[jd_start, jd_end)``."""
+
+    def __init__(self, jd_start: float, jd_end: float,
+                 ingresses: Dict[int, Tuple[array, array]]) -> None:
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self._ingresses = ingresses
+
+    @classmethod
+    def build(cls, jd_start: float, jd_end: float,
+              sample: Callable[[float, int], Tuple[float, float]],
+              planet_ids: Iterable[int] = tuple(PLANET_IDS.values())) -> "IngressIndex":
+        """Find every ingress using ``sample(jd, planet_id) -> (longitude, speed)``."""
+        ingresses: Dict[int, Tuple[array, array]] = {}
+        for planet_id in planet_ids:
+            found: List[Tuple[float, int]] = []
+            scan_ingresses(lambda t: sample(t, planet_id), jd_start, jd_end,
+                            INGRESS_SCAN_STEP.get(planet_id, 1.0), found)
+            ingresses[planet_id] = (array("d", (jd for jd, _ in found)),
+                                    array("B", (sign for _, sign in found)))
+        return cls(jd_start, jd_end, ingresses)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "IngressIndex":
+        try:
+            data = Path(path).read_bytes()
+        except OSError as e:
+            raise IngressIndexError(f"Cannot open ingress index {path}: {e}")
+        try:
+            magic, version, count, jd_start, jd_end = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise IngressIndexError(
+                    f"Unsupported ingress index {path} (magic={magic!r}, version={version})"
+                )
+            position = _HEADER.size
+            ingresses: Dict[int, Tuple[array, array]] = {}
+            for _ in range(count):
+                planet_id, n = _BODY.unpack_from(data, position)
+                position += _BODY.size
+                jds = array("d", struct.unpack_from(f"<{n}d", data, position))
+                position += 8 * n
+                signs = array("B", struct.unpack_from(f"<{n}B", data, position))
+                position += n
+                ingresses[planet_id] = (jds, signs)
+        except struct.error as e:
+            raise IngressIndexError(f"Truncated ingress index {path}: {e}")
+        return cls(jd_start, jd_end, ingresses)
+
+    def save(self, path: Union[str, Path]) -> None:
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(self._ingresses), self.jd_start, self.jd_end))
+            for planet_id, (jds, signs) in self._ingresses.items():
+                f.write(_BODY.pack(planet_id, len(jds)))
+                f.write(struct.pack(f"<{len(jds)}d", *jds))
+                f.write(struct.pack(f"<{len(signs)}B", *signs))
+
+    def covers(self, jd_ut: float, planet_id: int) -> bool:
+        return planet_id in self._ingresses and self.jd_start <= jd_ut < self.jd_end
+
+    def ingress_count(self, planet_id: int) -> int:
+        return len(self._ingresses.get(planet_id, ((), ()))[0])
+
+    def next_ingress(self, planet_id: int, jd_ut: float) -> Optional[Tuple[float, int]]:
+        """First indexed ``(jd, sign entered)`` strictly after ``jd_ut``, or ``None``."""
+        jds, signs = self._ingresses[planet_id]
+        i = bisect_right(jds, jd_ut)
+        if i == len(jds):
+            return None
+        return jds[i], signs[i]
+
+
+_index: Optional[IngressIndex] = None
+_index_resolved = False
+_index_lock = threading.Lock()
+
+
+def get_ingress_index() -> Optional[IngressIndex]:
+    """Return the configured ingress index, loading it on first use."""
+    global _index, _index_resolved
+    if _index_resolved:
+        return _index
+    with _index_lock:
+        if not _index_resolved:
+            path = resolve_data_path("HORARY_INGRESS_INDEX", "ingress_index_path")
+            if path is not None and path.exists():
+                try:
+                    _index = IngressIndex.load(path)
+                    logger.info(f"Loaded ingress index {path}")
+                except IngressIndexError as e:
+                    logger.warning(f"{e} - sign exits will be estimated from speed")
+            _index_resolved = True
+    return _index
+
+
+def set_ingress_index(index: Optional[IngressIndex]) -> None:
+    """Install ``index`` (``None`` falls back to speed-based estimates)."""
+    global _index, _index_resolved
+    with _index_lock:
+        _index = index
+        _index_resolved = True
+    next_sign_ingress.cache_clear()
+
+
+@lru_cache(maxsize=INGRESS_CACHE_SIZE)
+def next_sign_ingress(planet_id: int, jd_ut: float) -> Optional[float]:
+    """Julian day ``planet_id`` next changes sign after ``jd_ut``.
+
+    Returns ``None`` when no index is loaded or ``jd_ut`` is outside it.
+    """
+    index = get_ingress_index()
+    if index is None or not index.covers(jd_ut, planet_id):
+        return None
+    found = index.next_ingress(planet_id, jd_ut)
+    return found[0] if found is not None else None
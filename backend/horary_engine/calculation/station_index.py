@@ -0,0 +1,214 @@
+"""
+Precomputed index of planetary stations.
+
+Every retrograde and direct station of Mercury through Saturn over a long
+date range is stored as a sorted list of Julian days per planet, so "next
+station after jd" is a binary search instead of an ephemeris scan. The index
+is built by ``build_ephemeris_data.py stations`` and loaded from
+``ephemeris.station_index_path`` (or the ``HORARY_STATION_INDEX`` environment
+variable) when the file exists. Outside the indexed range the bracketed root
+finder :func:`find_next_station` is used on the planet's speed.
+
+File layout (little-endian)::
+
+    header : magic "HRYSTA01", version u32, body count u32,
+             jd_start f64, jd_end f64
+    bodies : per body -> planet id i32, station count u32,
+             station count x f64 Julian day,
+             station count x i8 direction (-1 turns retrograde, +1 turns direct)
+"""
+
+import logging
+import struct
+import threading
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+from .ephemeris import resolve_data_path
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"HRYSTA01"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIdd")
+_BODY = struct.Struct("<iI")
+
+# Swiss Ephemeris ids of the planets that station (Sun and Moon never do)
+STATION_PLANETS = (2, 3, 4, 5, 6)
+
+# Coarse scan step for bracketing a change in the sign of speed. Consecutive
+# stations are never closer than Mercury's ~20 day retrograde, so no station
+# pair can hide inside one step.
+STATION_SCAN_STEP = 2.0
+
+# Root-finder tolerance in days (about 1.5 minutes)
+STATION_TOLERANCE = 0.001
+
+
+class StationIndexError(Exception):
+    """Raised when a station index file is missing or malformed."""
+    pass
+
+
+def refine_root(f: Callable[[float], float], a: float, fa: float,
+                b: float, fb: float, tolerance: float) -> float:
+    """Illinois false-position refinement of a root of ``f`` bracketed by ``[a, b]``.
+
+    ``fa`` and ``fb`` are ``f(a)`` and ``f(b)`` and must have opposite signs;
+    only interior points are evaluated.
+    """
+    side = 0
+    estimate = None
+    for _ in range(50):
+        previous = estimate
+        estimate = (a * fb - b * fa) / (fb - fa)
+        if b - a <= tolerance or (previous is not None and abs(estimate - previous) <= tolerance / 2):
+            break
+        fc = f(estimate)
+        if fc == 0:
+            break
+        if (fc > 0) == (fb > 0):
+            b, fb = estimate, fc
+            if side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = estimate, fc
+            if side == 1:
+                fb /= 2
+            side = 1
+    return estimate
+
+
+def find_next_station(speed_at: Callable[[float], float], jd_start: float, jd_end: float,
+                      step: float = STATION_SCAN_STEP,
+                      tolerance: float = STATION_TOLERANCE) -> Optional[Tuple[float, int]]:
+    """First station after ``jd_start`` and before ``jd_end`` from ``speed_at(jd)``.
+
+    Returns ``(jd, direction)`` where direction is -1 when the planet turns
+    retrograde and +1 when it turns direct, or ``None`` if speed keeps its sign.
+    """
+    previous_jd = jd_start
+    previous_speed = speed_at(jd_start)
+    while previous_jd < jd_end:
+        jd = min(previous_jd + step, jd_end)
+        speed = speed_at(jd)
+        if previous_speed * speed < 0:
+            station = refine_root(speed_at, previous_jd, previous_speed, jd, speed, tolerance)
+            return station, (1 if speed > 0 else -1)
+        if speed != 0:
+            previous_speed = speed
+        previous_jd = jd
+    return None
+
+
+class StationIndex:
+    """Sorted station times per planet over ``[jd_start, jd_end)``."""
+
+    def __init__(self, jd_start: float, jd_end: float,
+                 stations: Dict[int, Tuple[array, array]]) -> None:
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self._stations = stations
+
+    @classmethod
+    def build(cls, jd_start: float, jd_end: float, speed_at: Callable[[float, int], float],
+              planet_ids: Iterable[int] = STATION_PLANETS) -> "StationIndex":
+        """Find every station in the range using ``speed_at(jd, planet_id)``."""
+        stations: Dict[int, Tuple[array, array]] = {}
+        for planet_id in planet_ids:
+            jds, directions = array("d"), array("b")
+            jd = jd_start
+            while True:
+                found = find_next_station(lambda t: speed_at(t, planet_id), jd, jd_end)
+                if found is None:
+                    break
+                station, direction = found
+                jds.append(station)
+                directions.append(direction)
+                # Resume just past the station so the same sign change is not found twice
+                jd = station + STATION_TOLERANCE
+            stations[planet_id] = (jds, directions)
+        return cls(jd_start, jd_end, stations)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "StationIndex":
+        try:
+            data = Path(path).read_bytes()
+        except OSError as e:
+            raise StationIndexError(f"Cannot open station index {path}: {e}")
+        try:
+            magic, version, count, jd_start, jd_end = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise StationIndexError(
+                    f"Unsupported station index {path} (magic={magic!r}, version={version})"
+                )
+            position = _HEADER.size
+            stations: Dict[int, Tuple[array, array]] = {}
+            for _ in range(count):
+                planet_id, n = _BODY.unpack_from(data, position)
+                position += _BODY.size
+                jds = array("d", struct.unpack_from(f"<{n}d", data, position))
+                position += 8 * n
+                directions = array("b", struct.unpack_from(f"<{n}b", data, position))
+                position += n
+                stations[planet_id] = (jds, directions)
+        except struct.error as e:
+            raise StationIndexError(f"Truncated station index {path}: {e}")
+        return cls(jd_start, jd_end, stations)
+
+    def save(self, path: Union[str, Path]) -> None:
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(self._stations), self.jd_start, self.jd_end))
+            for planet_id, (jds, directions) in self._stations.items():
+                f.write(_BODY.pack(planet_id, len(jds)))
+                f.write(struct.pack(f"<{len(jds)}d", *jds))
+                f.write(struct.pack(f"<{len(directions)}b", *directions))
+
+    def covers(self, jd_ut: float, planet_id: int) -> bool:
+        return planet_id in self._stations and self.jd_start <= jd_ut < self.jd_end
+
+    def station_count(self, planet_id: int) -> int:
+        return len(self._stations.get(planet_id, ((), ()))[0])
+
+    def next_station(self, planet_id: int, jd_ut: float) -> Optional[Tuple[float, int]]:
+        """First indexed ``(jd, direction)`` strictly after ``jd_ut``, or ``None``."""
+        jds, directions = self._stations[planet_id]
+        i = bisect_right(jds, jd_ut)
+        if i == len(jds):
+            return None
+        return jds[i], directions[i]
+
+
+_index: Optional[StationIndex] = None
+_index_resolved = False
+_index_lock = threading.Lock()
+
+
+def get_station_index() -> Optional[StationIndex]:
+    """Return the configured station index, loading it on first use."""
+    global _index, _index_resolved
+    if _index_resolved:
+        return _index
+    with _index_lock:
+        if not _index_resolved:
+            path = resolve_data_path("HORARY_STATION_INDEX", "station_index_path")
+            if path is not None and path.exists():
+                try:
+                    _index = StationIndex.load(path)
+                    logger.info(f"Loaded station index {path}")
+                except StationIndexError as e:
+                    logger.warning(f"{e} - stations will be searched on demand")
+            _index_resolved = True
+    return _index
+
+
+def set_station_index(index: Optional[StationIndex]) -> None:
+    """Install ``index`` (``None`` forces the on-demand root finder)."""
+    global _index, _index_resolved
+    with _index_lock:
+        _index = index
+        _index_resolved = True
@@ -0,0 +1,268 @@
+"""
+Void-of-course Moon calendar.
+
+The Moon is void of course from its last exact Ptolemaic aspect
+(conjunction, sextile, square, trine, opposition) to the Sun, Mercury,
+Venus, Mars, Jupiter or Saturn until it leaves its sign. The calendar holds
+those periods as sorted ``(start, end)`` Julian-day pairs computed from
+exact ephemeris motion, so "is the Moon void at jd" is one binary search.
+Consecutive periods are merged when the Moon crosses a whole sign without
+perfecting any aspect.
+
+The calendar is built by ``build_ephemeris_data.py voc`` and loaded from
+``ephemeris.voc_calendar_path`` (or the ``HORARY_VOC_CALENDAR`` environment
+variable) when the file exists. :func:`void_periods` falls back to building
+a short calendar on demand for ranges the file does not cover.
+
+File layout (little-endian)::
+
+    header  : magic "HRYVOC01", version u32, period count u32,
+              jd_start f64, jd_end f64
+    periods : period count x f64 start, period count x f64 end,
+              period count x u8 sign the Moon enters at the end
+"""
+
+import datetime
+import logging
+import struct
+import threading
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .ephemeris import calc_ut, resolve_data_path
+from .ingress_index import INGRESS_SCAN_STEP, scan_ingresses
+from .station_index import refine_root
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"HRYVOC01"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIdd")
+
+MOON = 1
+
+# Bodies the Moon must aspect (Swiss Ephemeris ids: Sun, Mercury-Saturn)
+ASPECT_PLANETS = (0, 2, 3, 4, 5, 6)
+
+# Moon-minus-planet elongations at which a Ptolemaic aspect is exact
+ASPECT_ELONGATIONS = (0.0, 60.0, 90.0, 120.0, 180.0, 240.0, 270.0, 300.0)
+
+# The Moon gains at most ~16 degrees a day on any planet, so half a day can
+# never carry it across two aspect points 30 degrees apart.
+VOC_SCAN_STEP = 0.5
+
+VOC_TOLERANCE = 1e-5
+
+# Days of padding added around on-demand ranges so the periods touching
+# the requested edges are complete (a Moon sign stay is under three days).
+_ON_DEMAND_PADDING_DAYS = 3.0
+
+VocPeriod = Tuple[float, float, int]
+
+_J2000 = datetime.datetime(2000, 1, 1, 12, tzinfo=datetime.timezone.utc)
+_J2000_JD = 2451545.0
+
+
+class VocCalendarError(Exception):
+    """Raised when a void-of-course calendar file is missing or malformed."""
+    pass
+
+
+def julian_day(moment: datetime.datetime) -> float:
+    """UT Julian day of an aware (or UTC-naive) datetime."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return _J2000_JD + (moment - _J2000).total_seconds() / 86400.0
+
+
+def from_julian_day(jd_ut: float) -> datetime.datetime:
+    """UTC datetime of a UT Julian day."""
+    return _J2000 + datetime.timedelta(days=jd_ut - _J2000_JD)
+
+
+def _signed(angle: float) -> float:
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def last_moon_aspect(sample: Callable[[float, int], Tuple[float, float]],
+                     jd_start: float, jd_end: float) -> Optional[float]:
+    """Time of the Moon's last exact aspect in ``[jd_start, jd_end]``, or ``None``.
+
+    ``sample(jd, planet_id)`` returns ``(longitude, speed)``. The range is
+    scanned backwards from ``jd_end`` so only the final aspect is refined.
+    """
+    def elongations(jd: float) -> Dict[int, float]:
+        moon = sample(jd, MOON)[0]
+        return {pid: (moon - sample(jd, pid)[0]) % 360.0 for pid in ASPECT_PLANETS}
+
+    b = jd_end
+    eb = elongations(b)
+    while b > jd_start:
+        a = max(b - VOC_SCAN_STEP, jd_start)
+        ea = elongations(a)
+        found = []
+        for pid in ASPECT_PLANETS:
+            start = ea[pid]
+            end = start + (eb[pid] - start) % 360.0  # relative motion is always forward
+            for elongation in ASPECT_ELONGATIONS:
+                for target in (elongation, elongation + 360.0):
+                    if start < target <= end:
+                        def offset_at(t: float, pid=pid, elongation=elongation) -> float:
+                            return _signed(sample(t, MOON)[0] - sample(t, pid)[0] - elongation)
+
+                        found.append(refine_root(
+                            offset_at, a, _signed(start - elongation),
+                            b, _signed(end - elongation), VOC_TOLERANCE,
+                        ))
+        if found:
+            return max(found)
+        b, eb = a, ea
+    return None
+
+
+class VocCalendar:
+    """Sorted void-of-course periods over ``[jd_start, jd_end)``."""
+
+    def __init__(self, jd_start: float, jd_end: float,
+                 starts: array, ends: array, signs: array) -> None:
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self._starts = starts
+        self._ends = ends
+        self._signs = signs
+
+    @classmethod
+    def build(cls, jd_start: float, jd_end: float,
+              sample: Callable[[float, int], Tuple[float, float]]) -> "VocCalendar":
+        """Compute every period between the Moon's first and last ingress in the range."""
+        ingresses: List[Tuple[float, int]] = []
+        scan_ingresses(lambda t: sample(t, MOON), jd_start, jd_end, INGRESS_SCAN_STEP[MOON], ingresses)
+
+        starts, ends, signs = array("d"), array("d"), array("B")
+        for (entered, _), (left, next_sign) in zip(ingresses, ingresses[1:]):
+            last_aspect = last_moon_aspect(sample, entered, left)
+            if last_aspect is None and ends and ends[-1] == entered:
+                # No aspect in the whole sign - the previous period carries on
+                ends[-1] = left
+                signs[-1] = next_sign
+                continue
+            starts.append(last_aspect if last_aspect is not None else entered)
+            ends.append(left)
+            signs.append(next_sign)
+
+        if len(ingresses) < 2:
+            return cls(jd_start, jd_start, starts, ends, signs)
+        return cls(ingresses[0][0], ingresses[-1][0], starts, ends, signs)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "VocCalendar":
+        try:
+            data = Path(path).read_bytes()
+        except OSError as e:
+            raise VocCalendarError(f"Cannot open VOC calendar {path}: {e}")
+        try:
+            magic, version, n, jd_start, jd_end = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise VocCalendarError(
+                    f"Unsupported VOC calendar {path} (magic={magic!r}, version={version})"
+                )
+            position = _HEADER.size
+            starts = array("d", struct.unpack_from(f"<{n}d", data, position))
+            position += 8 * n
+            ends = array("d", struct.unpack_from(f"<{n}d", data, position))
+            position += 8 * n
+            signs = array("B", struct.unpack_from(f"<{n}B", data, position))
+        except struct.error as e:
+            raise VocCalendarError(f"Truncated VOC calendar {path}: {e}")
+        return cls(jd_start, jd_end, starts, ends, signs)
+
+    def save(self, path: Union[str, Path]) -> None:
+        n = len(self._starts)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, n, self.jd_start, self.jd_end))
+            f.write(struct.pack(f"<{n}d", *self._starts))
+            f.write(struct.pack(f"<{n}d", *self._ends))
+            f.write(struct.pack(f"<{n}B", *self._signs))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def covers(self, jd_ut: float) -> bool:
+        return self.jd_start <= jd_ut < self.jd_end
+
+    def period_at(self, jd_ut: float) -> Optional[VocPeriod]:
+        """The ``(start, end, sign entered)`` period containing ``jd_ut``, if void."""
+        i = bisect_right(self._starts, jd_ut) - 1
+        if i >= 0 and jd_ut < self._ends[i]:
+            return self._starts[i], self._ends[i], self._signs[i]
+        return None
+
+    def next_period(self, jd_ut: float) -> Optional[VocPeriod]:
+        """First period starting after ``jd_ut``."""
+        i = bisect_right(self._starts, jd_ut)
+        if i == len(self._starts):
+            return None
+        return self._starts[i], self._ends[i], self._signs[i]
+
+    def periods_between(self, jd_start: float, jd_end: float) -> List[VocPeriod]:
+        """Every period overlapping ``[jd_start, jd_end)``."""
+        i = max(bisect_right(self._starts, jd_start) - 1, 0)
+        periods = []
+        while i < len(self._starts) and self._starts[i] < jd_end:
+            if self._ends[i] > jd_start:
+                periods.append((self._starts[i], self._ends[i], self._signs[i]))
+            i += 1
+        return periods
+
+
+_calendar: Optional[VocCalendar] = None
+_calendar_resolved = False
+_calendar_lock = threading.Lock()
+
+
+def get_voc_calendar() -> Optional[VocCalendar]:
+    """Return the configured VOC calendar, loading it on first use."""
+    global _calendar, _calendar_resolved
+    if _calendar_resolved:
+        return _calendar
+    with _calendar_lock:
+        if not _calendar_resolved:
+            path = resolve_data_path("HORARY_VOC_CALENDAR", "voc_calendar_path")
+            if path is not None and path.exists():
+                try:
+                    _calendar = VocCalendar.load(path)
+                    logger.info(f"Loaded VOC calendar {path} ({len(_calendar)} periods)")
+                except VocCalendarError as e:
+                    logger.warning(f"{e} - void of course will be computed per chart")
+            _calendar_resolved = True
+    return _calendar
+
+
+def set_voc_calendar(calendar: Optional[VocCalendar]) -> None:
+    """Install ``calendar`` (``None`` computes void of course per chart)."""
+    global _calendar, _calendar_resolved
+    with _calendar_lock:
+        _calendar = calendar
+        _calendar_resolved = True
+
+
+def _ephemeris_motion(jd_ut: float, planet_id: int) -> Tuple[float, float]:
+    data, _ = calc_ut(jd_ut, planet_id)
+    return data[0], data[3]
+
+
+def void_periods(jd_start: float, jd_end: float) -> List[VocPeriod]:
+    """VOC periods overlapping ``[jd_start, jd_end)``.
+
+    Served from the precomputed calendar when it covers the range, otherwise
+    computed on demand from the ephemeris.
+    """
+    calendar = get_voc_calendar()
+    if calendar is None or not (calendar.covers(jd_start) and calendar.covers(jd_end)):
+        calendar = VocCalendar.build(
+            jd_start - _ON_DEMAND_PADDING_DAYS, jd_end + _ON_DEMAND_PADDING_DAYS, _ephemeris_motion
+        )
+    return calendar.periods_between(jd_start, jd_end)
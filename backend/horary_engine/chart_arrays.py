@@ -0,0 +1,377 @@
+"""Struct-of-arrays form of a single chart.
+
+:class:`HoraryChart` keeps planets as a dict of :class:`PlanetPosition`
+objects keyed by :class:`Planet`, which every helper hashes into and reads
+attribute by attribute. :class:`ChartArrays` holds the same chart as small
+fixed-size arrays indexed by planet ordinal (``TABLE_PLANETS`` order, Sun to
+Saturn), plus the cusps, house rulers and aspects as parallel columns. The
+arrays feed the kernels directly (``essential`` for the dignity table,
+``reception_matrix`` for the reception matrix the engine builds from the
+same columns, ``aspect_kernel`` for the all-pairs aspect search) and a
+cached chart takes a fraction of the memory of its object graph.
+
+Conversion is lossless: ``ChartArrays.from_chart(chart).to_chart() == chart``
+for every chart ``calculate_chart`` or ``deserialize_chart_for_evaluation``
+builds. The memoized ``context`` is not carried over; it is recreated on
+first use.
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .aspects import ORB_ASPECT_DEGREES, ORB_ASPECTS, orb_matrix
+from .calculation.aspect_kernel import AspectKernelResult, aspect_kernel
+from .dignity_table import TABLE_PLANETS, dignity_table
+from .reception import ReceptionMatrix, TraditionalReceptionCalculator
+
+try:
+    from ..models import (
+        AspectInfo,
+        HoraryChart,
+        LunarAspect,
+        Planet,
+        PlanetPosition,
+        Sign,
+        SolarAnalysis,
+        SolarCondition,
+    )
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import (
+        AspectInfo,
+        HoraryChart,
+        LunarAspect,
+        Planet,
+        PlanetPosition,
+        Sign,
+        SolarAnalysis,
+        SolarCondition,
+    )
+
+
+# Signs by index (0 = Aries ... 11 = Pisces)
+SIGNS: List[Sign] = sorted(Sign, key=lambda sign: sign.start_degree)
+_SIGN_INDEX: Dict[Sign, int] = {sign: i for i, sign in enumerate(SIGNS)}
+_PLANET_INDEX: Dict[Planet, int] = {planet: i for i, planet in enumerate(TABLE_PLANETS)}
+_ASPECT_INDEX = {aspect: i for i, aspect in enumerate(ORB_ASPECTS)}
+
+# Dignity labels in the order the engine lists them; bit ``i`` of
+# ``dignities`` stands for ``DIGNITY_LABELS[i]``
+DIGNITY_LABELS: Tuple[str, ...] = (
+    "rulership",
+    "exaltation",
+    "triplicity",
+    "term",
+    "face",
+    "cazimi",
+    "combust",
+    "under_beams",
+)
+_LABEL_BITS = {label: 1 << i for i, label in enumerate(DIGNITY_LABELS)}
+
+SOLAR_CONDITIONS: List[SolarCondition] = list(SolarCondition)
+_CONDITION_INDEX = {condition: i for i, condition in enumerate(SOLAR_CONDITIONS)}
+_NONE = -1
+
+_N = len(TABLE_PLANETS)
+
+
+def _labels(bits: int) -> List[str]:
+    return [label for i, label in enumerate(DIGNITY_LABELS) if bits >> i & 1]
+
+
+def _label_bits(planet: Planet, dignities: Sequence[str]) -> int:
+    try:
+        bits = sum(_LABEL_BITS[label] for label in set(dignities))
+    except KeyError as e:
+        raise ValueError(f"Unknown dignity label {e} for {planet.value}") from None
+    if _labels(bits) != list(dignities):
+        raise ValueError(f"Dignities of {planet.value} are not in engine order: {dignities}")
+    return bits
+
+
+def _scores(values: Sequence[Any]) -> np.ndarray:
+    """Integer scores as ``int16`` (the engine's usual case), anything else as ``float64``."""
+    if all(type(value) is int for value in values):
+        return np.array(values, dtype=np.int16)
+    return np.array(values, dtype=np.float64)
+
+
+@dataclass(slots=True)
+class ChartArrays:
+    """One chart as parallel arrays.
+
+    Per-planet arrays have shape ``(7,)`` in ``TABLE_PLANETS`` order;
+    ``present`` marks the planets the chart holds. ``solar_conditions``
+    indexes ``SOLAR_CONDITIONS`` (-1 where there is no solar analysis),
+    ``dignities`` packs the dignity labels as bits of ``DIGNITY_LABELS`` and
+    ``house_rulers[h - 1]`` is the ordinal of house ``h``'s ruler (-1 when
+    unset). Aspect columns have one entry per :class:`AspectInfo`, with
+    ``aspect_planets`` holding both planet ordinals and ``aspect_kinds``
+    indexing ``ORB_ASPECTS``.
+    """
+    # Chart
+    date_time: datetime.datetime
+    date_time_utc: datetime.datetime
+    timezone_info: str
+    location: Tuple[float, float]
+    location_name: str
+    julian_day: float
+    ascendant: float
+    midheaven: float
+    cusps: np.ndarray
+    house_rulers: np.ndarray
+
+    # Planets
+    present: np.ndarray
+    longitudes: np.ndarray
+    latitudes: np.ndarray
+    speeds: np.ndarray
+    houses: np.ndarray
+    signs: np.ndarray
+    dignity_scores: np.ndarray
+    retrograde: np.ndarray
+    dignities: np.ndarray
+
+    # Solar analyses
+    elongations: np.ndarray
+    solar_conditions: np.ndarray
+    exact_cazimi: np.ndarray
+    traditional_exception: np.ndarray
+
+    # Aspects
+    aspect_planets: np.ndarray
+    aspect_kinds: np.ndarray
+    aspect_orbs: np.ndarray
+    aspect_applying: np.ndarray
+    aspect_times: np.ndarray
+    aspect_within_sign: np.ndarray
+    aspect_degrees_to_exact: np.ndarray
+    aspect_exact_times: Tuple[Optional[datetime.datetime], ...]
+
+    moon_last_aspect: Optional[LunarAspect] = None
+    moon_next_aspect: Optional[LunarAspect] = None
+    ephemeris: Optional[Any] = None
+
+    @classmethod
+    def from_chart(cls, chart: HoraryChart) -> "ChartArrays":
+        """Pack ``chart``; raises ``ValueError`` for anything the arrays cannot hold."""
+        present = np.zeros(_N, dtype=bool)
+        longitudes = np.zeros(_N)
+        latitudes = np.zeros(_N)
+        speeds = np.zeros(_N)
+        houses = np.zeros(_N, dtype=np.int8)
+        signs = np.zeros(_N, dtype=np.int8)
+        retrograde = np.zeros(_N, dtype=bool)
+        dignities = np.zeros(_N, dtype=np.uint16)
+        scores: List[Any] = [0] * _N
+
+        for planet, pos in chart.planets.items():
+            index = _PLANET_INDEX.get(planet)
+            if index is None or pos.planet != planet:
+                raise ValueError(f"ChartArrays holds the seven traditional planets only, got {planet}")
+            present[index] = True
+            longitudes[index] = pos.longitude
+            latitudes[index] = pos.latitude
+            speeds[index] = pos.speed
+            houses[index] = pos.house
+            signs[index] = _SIGN_INDEX[pos.sign]
+            retrograde[index] = pos.retrograde
+            dignities[index] = _label_bits(planet, pos.dignities)
+            scores[index] = pos.dignity_score
+
+        elongations = np.zeros(_N)
+        solar_conditions = np.full(_N, _NONE, dtype=np.int8)
+        exact_cazimi = np.zeros(_N, dtype=bool)
+        traditional_exception = np.zeros(_N, dtype=bool)
+        if chart.solar_analyses is not None:
+            if not chart.solar_analyses:
+                raise ValueError("ChartArrays cannot tell an empty solar analysis dict from None")
+            for planet, analysis in chart.solar_analyses.items():
+                index = _PLANET_INDEX.get(planet)
+                if index is None or analysis.planet != planet:
+                    raise ValueError(f"No solar analysis slot for {planet}")
+                elongations[index] = analysis.distance_from_sun
+                solar_conditions[index] = _CONDITION_INDEX[analysis.condition]
+                exact_cazimi[index] = analysis.exact_cazimi
+                traditional_exception[index] = analysis.traditional_exception
+
+        house_rulers = np.full(12, _NONE, dtype=np.int8)
+        for house, ruler in chart.house_rulers.items():
+            if not 1 <= house <= 12 or ruler not in _PLANET_INDEX:
+                raise ValueError(f"Invalid house ruler {house}: {ruler}")
+            house_rulers[house - 1] = _PLANET_INDEX[ruler]
+
+        aspects = chart.aspects
+        aspect_planets = np.array(
+            [(_PLANET_INDEX[a.planet1], _PLANET_INDEX[a.planet2]) for a in aspects], dtype=np.int8
+        ).reshape(len(aspects), 2)
+
+        return cls(
+            date_time=chart.date_time,
+            date_time_utc=chart.date_time_utc,
+            timezone_info=chart.timezone_info,
+            location=chart.location,
+            location_name=chart.location_name,
+            julian_day=chart.julian_day,
+            ascendant=chart.ascendant,
+            midheaven=chart.midheaven,
+            cusps=np.array(chart.houses, dtype=np.float64),
+            house_rulers=house_rulers,
+            present=present,
+            longitudes=longitudes,
+            latitudes=latitudes,
+            speeds=speeds,
+            houses=houses,
+            signs=signs,
+            dignity_scores=_scores(scores),
+            retrograde=retrograde,
+            dignities=dignities,
+            elongations=elongations,
+            solar_conditions=solar_conditions,
+            exact_cazimi=exact_cazimi,
+            traditional_exception=traditional_exception,
+            aspect_planets=aspect_planets,
+            aspect_kinds=np.array([_ASPECT_INDEX[a.aspect] for a in aspects], dtype=np.int8),
+            aspect_orbs=np.array([a.orb for a in aspects], dtype=np.float64),
+            aspect_applying=np.array([a.applying for a in aspects], dtype=bool),
+            aspect_times=np.array([a.time_to_perfection for a in aspects], dtype=np.float64),
+            aspect_within_sign=np.array([a.perfection_within_sign for a in aspects], dtype=bool),
+            aspect_degrees_to_exact=np.array([a.degrees_to_exact for a in aspects], dtype=np.float64),
+            aspect_exact_times=tuple(a.exact_time for a in aspects),
+            moon_last_aspect=chart.moon_last_aspect,
+            moon_next_aspect=chart.moon_next_aspect,
+            ephemeris=chart.ephemeris,
+        )
+
+    def to_chart(self) -> HoraryChart:
+        """The :class:`HoraryChart` these arrays were packed from."""
+        planets: Dict[Planet, PlanetPosition] = {}
+        rows = zip(
+            TABLE_PLANETS,
+            self.present.tolist(),
+            self.longitudes.tolist(),
+            self.latitudes.tolist(),
+            self.houses.tolist(),
+            self.signs.tolist(),
+            self.dignity_scores.tolist(),
+            self.retrograde.tolist(),
+            self.speeds.tolist(),
+            self.dignities.tolist(),
+        )
+        for planet, present, longitude, latitude, house, sign, score, retrograde, speed, bits in rows:
+            if present:
+                planets[planet] = PlanetPosition(
+                    planet=planet,
+                    longitude=longitude,
+                    latitude=latitude,
+                    house=house,
+                    sign=SIGNS[sign],
+                    dignity_score=score,
+                    retrograde=retrograde,
+                    speed=speed,
+                    dignities=_labels(bits),
+                )
+
+        solar_analyses: Optional[Dict[Planet, SolarAnalysis]] = None
+        if (self.solar_conditions != _NONE).any():
+            solar_analyses = {}
+            rows = zip(
+                TABLE_PLANETS,
+                self.solar_conditions.tolist(),
+                self.elongations.tolist(),
+                self.exact_cazimi.tolist(),
+                self.traditional_exception.tolist(),
+            )
+            for planet, condition, elongation, exact_cazimi, exception in rows:
+                if condition != _NONE:
+                    solar_analyses[planet] = SolarAnalysis(
+                        planet=planet,
+                        distance_from_sun=elongation,
+                        condition=SOLAR_CONDITIONS[condition],
+                        exact_cazimi=exact_cazimi,
+                        traditional_exception=exception,
+                    )
+
+        house_rulers = {
+            house: TABLE_PLANETS[ruler]
+            for house, ruler in enumerate(self.house_rulers.tolist(), 1)
+            if ruler != _NONE
+        }
+
+        aspects = [
+            AspectInfo(
+                planet1=TABLE_PLANETS[i],
+                planet2=TABLE_PLANETS[j],
+                aspect=ORB_ASPECTS[kind],
+                orb=orb,
+                applying=applying,
+                time_to_perfection=t,
+                perfection_within_sign=within_sign,
+                exact_time=exact_time,
+                degrees_to_exact=degrees_to_exact,
+            )
+            for (i, j), kind, orb, applying, t, within_sign, degrees_to_exact, exact_time in zip(
+                self.aspect_planets.tolist(),
+                self.aspect_kinds.tolist(),
+                self.aspect_orbs.tolist(),
+                self.aspect_applying.tolist(),
+                self.aspect_times.tolist(),
+                self.aspect_within_sign.tolist(),
+                self.aspect_degrees_to_exact.tolist(),
+                self.aspect_exact_times,
+            )
+        ]
+
+        return HoraryChart(
+            date_time=self.date_time,
+            date_time_utc=self.date_time_utc,
+            timezone_info=self.timezone_info,
+            location=self.location,
+            location_name=self.location_name,
+            planets=planets,
+            aspects=aspects,
+            houses=self.cusps.tolist(),
+            house_rulers=house_rulers,
+            ascendant=self.ascendant,
+            midheaven=self.midheaven,
+            solar_analyses=solar_analyses,
+            julian_day=self.julian_day,
+            moon_last_aspect=self.moon_last_aspect,
+            moon_next_aspect=self.moon_next_aspect,
+            ephemeris=self.ephemeris,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the array buffers."""
+        return sum(
+            getattr(self, name).nbytes
+            for name in self.__slots__
+            if isinstance(getattr(self, name), np.ndarray)
+        )
+
+    def essential(self) -> np.ndarray:
+        """Dignity-table bits for each planet (see :mod:`.dignity_table`)."""
+        return dignity_table().mask_array(self.longitudes)
+
+    def reception_matrix(self, calculator: Optional[TraditionalReceptionCalculator] = None) -> ReceptionMatrix:
+        """Receptions between the planets, from the sign and longitude columns.
+
+        Same matrix as ``calculator.reception_matrix(chart)`` for the chart
+        these arrays hold.
+        """
+        calculator = calculator or TraditionalReceptionCalculator()
+        sun = TABLE_PLANETS.index(Planet.SUN)
+        day_chart = calculator.is_day(float(self.longitudes[sun]), self.cusps.tolist())
+        signs = np.where(self.present, self.signs, -1)
+        return ReceptionMatrix.from_columns(signs, self.longitudes, day_chart, calculator)
+
+    def aspect_kernel(self, exact_exits: Optional[np.ndarray] = None) -> AspectKernelResult:
+        """All-pairs aspect kernel over the planet arrays with the configured orbs."""
+        return aspect_kernel(
+            self.longitudes, self.speeds, orb_matrix().grid,
+            exact_exits=exact_exits, aspect_degrees=ORB_ASPECT_DEGREES,
+        )
@@ -0,0 +1,418 @@
+"""Batch chart calculation for research jobs.
+
+:func:`calculate_charts_batch` computes many charts at once and returns them
+as a :class:`ChartBatch` of parallel arrays (one row per chart, one column
+per planet in ``TABLE_PLANETS`` order) instead of a list of
+:class:`HoraryChart` objects. Ephemeris and house lookups remain one Swiss
+Ephemeris call per body per chart; sign and house placement, dignity scoring
+and the all-pairs aspect search run as array operations over the whole batch.
+
+Every value matches what
+:meth:`EnhancedTraditionalAstrologicalCalculator.calculate_chart` produces for
+the same moment and place, and :meth:`ChartBatch.chart` turns any row into
+that :class:`HoraryChart`.
+"""
+
+import datetime
+import logging
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+import swisseph as swe
+
+from horary_config import config_snapshot
+
+from .aspects import (
+    ORB_ASPECT_DEGREES,
+    aspects_from_kernel,
+    calculate_moon_last_aspect,
+    calculate_moon_next_aspect,
+    orb_matrix,
+)
+from .calculation.aspect_kernel import AspectKernelResult, aspect_kernel
+from .calculation.ephemeris import EphemerisSnapshot, houses as swe_houses
+from .calculation.helpers import exact_days_to_sign_exit, sun_altitude_at_civil_twilight
+from .dignity_table import (
+    DETRIMENT,
+    EXALTATION,
+    FACE,
+    FALL,
+    HOUSE_JOYS,
+    RULERSHIP,
+    TABLE_PLANETS,
+    TERM,
+    TRIPLICITY_DAY,
+    TRIPLICITY_NIGHT,
+    dignity_table,
+)
+
+try:
+    from ..models import HoraryChart, Planet, PlanetPosition, Sign, SolarAnalysis, SolarCondition
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import HoraryChart, Planet, PlanetPosition, Sign, SolarAnalysis, SolarCondition
+
+
+logger = logging.getLogger(__name__)
+
+# Signs by index (0 = Aries ... 11 = Pisces)
+SIGNS: List[Sign] = sorted(Sign, key=lambda sign: sign.start_degree)
+
+# Swiss Ephemeris ids in ``TABLE_PLANETS`` order
+_SWE_IDS = [swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN]
+_SUN = TABLE_PLANETS.index(Planet.SUN)
+_MOON = TABLE_PLANETS.index(Planet.MOON)
+_MERCURY = TABLE_PLANETS.index(Planet.MERCURY)
+_VENUS = TABLE_PLANETS.index(Planet.VENUS)
+
+# Solar condition codes in ``solar_conditions``
+SOLAR_CONDITIONS: List[SolarCondition] = [
+    SolarCondition.FREE,
+    SolarCondition.CAZIMI,
+    SolarCondition.COMBUSTION,
+    SolarCondition.UNDER_BEAMS,
+]
+_FREE, _CAZIMI, _COMBUSTION, _UNDER_BEAMS = range(4)
+
+# Fixed traditional boundaries, as in ``_analyze_enhanced_solar_condition``
+_CAZIMI_ORB = 17 / 60.0
+_EXACT_CAZIMI_ORB = 3 / 60
+_COMBUSTION_ORB = 8.5
+_UNDER_BEAMS_ORB = 17.0
+
+_JOY_HOUSES = np.array([HOUSE_JOYS[planet] for planet in TABLE_PLANETS])
+_DIURNAL = np.isin(TABLE_PLANETS, [Planet.SUN, Planet.JUPITER, Planet.SATURN])
+_NOCTURNAL = np.isin(TABLE_PLANETS, [Planet.MOON, Planet.VENUS, Planet.MARS])
+_INFERIOR = np.isin(TABLE_PLANETS, [Planet.MERCURY, Planet.VENUS])
+_SUPERIOR = np.isin(TABLE_PLANETS, [Planet.MARS, Planet.JUPITER, Planet.SATURN])
+_IS_MOON = np.arange(len(TABLE_PLANETS)) == _MOON
+
+
+@dataclass
+class ChartBatch:
+    """Struct-of-arrays result of :func:`calculate_charts_batch`.
+
+    Arrays are indexed ``[chart]`` or ``[chart, planet]`` with planets in
+    ``planets`` order. ``essential`` holds the dignity-table bits (see
+    :mod:`.dignity_table`) and ``aspects`` the batched kernel result, whose
+    ``best`` array gives each pair's aspect (-1 for none).
+    """
+    planets: List[Planet]
+    datetimes_utc: List[datetime.datetime]
+    julian_days: np.ndarray
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+    planet_longitudes: np.ndarray
+    planet_latitudes: np.ndarray
+    speeds: np.ndarray
+    signs: np.ndarray
+    houses: np.ndarray
+    cusps: np.ndarray
+    ascendants: np.ndarray
+    midheavens: np.ndarray
+    dignity_scores: np.ndarray
+    essential: np.ndarray
+    elongations: np.ndarray
+    solar_conditions: np.ndarray
+    exact_cazimi: np.ndarray
+    traditional_exception: np.ndarray
+    aspects: AspectKernelResult
+    snapshots: List[EphemerisSnapshot]
+    location_names: List[str]
+
+    def __len__(self) -> int:
+        return len(self.julian_days)
+
+    def chart(self, index: int, dt_local: Optional[datetime.datetime] = None,
+              timezone_info: str = "UTC") -> HoraryChart:
+        """Row ``index`` as the :class:`HoraryChart` ``calculate_chart`` would build."""
+        jd_ut = float(self.julian_days[index])
+        triplicity_scored = bool(config_snapshot().dignity.triplicity)
+
+        planets = {}
+        solar_analyses = {}
+        rows = zip(
+            self.planets,
+            self.planet_longitudes[index].tolist(),
+            self.planet_latitudes[index].tolist(),
+            self.speeds[index].tolist(),
+            self.signs[index].tolist(),
+            self.houses[index].tolist(),
+            self.dignity_scores[index].tolist(),
+            self.essential[index].tolist(),
+            self.elongations[index].tolist(),
+            self.solar_conditions[index].tolist(),
+            self.exact_cazimi[index].tolist(),
+            self.traditional_exception[index].tolist(),
+        )
+        is_day = self.houses[index, _SUN] >= 7
+        for (planet, longitude, latitude, speed, sign, house, score, essential,
+             elongation, condition, exact_cazimi, exception) in rows:
+            dignities = []
+            if essential & RULERSHIP:
+                dignities.append("rulership")
+            if essential & EXALTATION:
+                dignities.append("exaltation")
+            if essential & (TRIPLICITY_DAY if is_day else TRIPLICITY_NIGHT) and triplicity_scored:
+                dignities.append("triplicity")
+            if essential & TERM:
+                dignities.append("term")
+            if essential & FACE:
+                dignities.append("face")
+            if condition == _CAZIMI:
+                dignities.append("cazimi")
+            elif condition == _COMBUSTION:
+                dignities.append("combust")
+            elif condition == _UNDER_BEAMS:
+                dignities.append("under_beams")
+
+            planets[planet] = PlanetPosition(
+                planet=planet,
+                longitude=longitude,
+                latitude=latitude,
+                house=house,
+                sign=SIGNS[sign],
+                dignity_score=score,
+                retrograde=speed < 0,
+                speed=speed,
+                dignities=dignities,
+            )
+            solar_analyses[planet] = SolarAnalysis(
+                planet=planet,
+                distance_from_sun=elongation,
+                condition=SOLAR_CONDITIONS[condition],
+                exact_cazimi=exact_cazimi,
+                traditional_exception=exception,
+            )
+
+        houses = self.cusps[index].tolist()
+        house_rulers = {i: SIGNS[min(int((cusp % 360) // 30), 11)].ruler for i, cusp in enumerate(houses, 1)}
+        positions = [planets[planet] for planet in self.planets]
+        dt_utc = self.datetimes_utc[index]
+
+        return HoraryChart(
+            date_time=dt_local if dt_local is not None else dt_utc,
+            date_time_utc=dt_utc,
+            timezone_info=timezone_info,
+            location=(float(self.latitudes[index]), float(self.longitudes[index])),
+            location_name=self.location_names[index],
+            planets=planets,
+            aspects=aspects_from_kernel(self.aspects.row(index), self.planets, positions, jd_ut),
+            houses=houses,
+            house_rulers=house_rulers,
+            ascendant=float(self.ascendants[index]),
+            midheaven=float(self.midheavens[index]),
+            solar_analyses=solar_analyses,
+            julian_day=jd_ut,
+            moon_last_aspect=calculate_moon_last_aspect(planets, jd_ut),
+            moon_next_aspect=calculate_moon_next_aspect(planets, jd_ut),
+            ephemeris=self.snapshots[index],
+        )
+
+
+def _house_positions(longitudes: np.ndarray, cusps: np.ndarray) -> np.ndarray:
+    """Vectorized ``_calculate_house_position``: houses shaped like ``longitudes``."""
+    longitudes = longitudes % 360
+    houses = np.zeros(longitudes.shape, dtype=np.int64)
+    for i in range(12):
+        current = (cusps[:, i] % 360)[:, None]
+        following = (cusps[:, (i + 1) % 12] % 360)[:, None]
+        inside = np.where(
+            current > following,
+            (longitudes >= current) | (longitudes < following),
+            (current <= longitudes) & (longitudes < following),
+        )
+        houses = np.where((houses == 0) & inside, i + 1, houses)
+    return np.where(houses == 0, 1, houses)
+
+
+def _dignity_scores(longitudes: np.ndarray, speeds: np.ndarray, signs: np.ndarray,
+                    houses: np.ndarray, cusps: np.ndarray, essential: np.ndarray,
+                    sun_altitudes: np.ndarray):
+    """Vectorized ``_calculate_comprehensive_traditional_dignity`` plus solar analysis."""
+    snapshot = config_snapshot()
+    weights = snapshot.dignity
+    config = snapshot.config
+    solar = config.confidence.solar
+
+    sun_house = houses[:, _SUN][:, None]
+    is_day = sun_house >= 7
+
+    # Essential dignities
+    score = np.zeros(longitudes.shape, dtype=np.int64)
+    score = score + np.where(essential & RULERSHIP, weights.rulership, 0)
+    score = score + np.where(essential & EXALTATION, weights.exaltation, 0)
+    triplicity = essential & np.where(is_day, TRIPLICITY_DAY, TRIPLICITY_NIGHT)
+    score = score + np.where(triplicity != 0, weights.triplicity, 0)
+    score = score + np.where(essential & TERM, 2, 0)
+    score = score + np.where(essential & FACE, 1, 0)
+    score = score + np.where(essential & DETRIMENT, weights.detriment, 0)
+    score = score + np.where(essential & FALL, weights.fall, 0)
+
+    # Accidental dignities: joys and angularity with the 5 degree rule
+    score = score + np.where(houses == _JOY_HOUSES, weights.joy, 0)
+    normalized = longitudes % 360
+    near_angle = np.zeros(longitudes.shape, dtype=bool)
+    for cusp_index in (0, 3, 6, 9):
+        gap = np.abs(normalized - (cusps[:, cusp_index] % 360)[:, None])
+        near_angle |= np.minimum(gap, 360 - gap) <= 5.0
+    house_kind = (houses - 1) % 3  # 0 angular, 1 succedent, 2 cadent
+    angularity = np.where(near_angle, 0, house_kind)
+    score = score + np.choose(angularity, [weights.angular, weights.succedent, weights.cadent])
+
+    # Speed, retrogradation and hayz
+    speed_score = np.where(
+        _IS_MOON,
+        np.where(speeds > 13.0, weights.speed_bonus, np.where(speeds < 11.0, weights.speed_penalty, 0)),
+        np.where(
+            _INFERIOR,
+            np.where(speeds > 1.0, weights.speed_bonus, 0),
+            np.where(
+                _SUPERIOR,
+                np.where(speeds > 0.3, weights.speed_bonus, np.where(speeds < 0.1, weights.speed_penalty, 0)),
+                0,
+            ),
+        ),
+    )
+    score = score + speed_score
+    score = score + np.where(speeds < 0, config.retrograde.dignity_penalty, 0)
+    score = score + np.where(
+        _DIURNAL,
+        np.where(is_day, weights.hayz_bonus, weights.hayz_penalty),
+        np.where(_NOCTURNAL, np.where(is_day, weights.hayz_penalty, weights.hayz_bonus), 0),
+    )
+
+    # Solar condition
+    sun_longitude = longitudes[:, _SUN][:, None]
+    gap = np.abs(longitudes - sun_longitude)
+    elongation = np.minimum(gap, 360 - gap)
+    condition = np.select(
+        [elongation <= _CAZIMI_ORB, elongation <= _COMBUSTION_ORB, elongation <= _UNDER_BEAMS_ORB],
+        [_CAZIMI, _COMBUSTION, _UNDER_BEAMS],
+        _FREE,
+    )
+    condition[:, _SUN] = _FREE
+    elongation[:, _SUN] = 0.0
+    exact_cazimi = (condition == _CAZIMI) & (elongation <= _EXACT_CAZIMI_ORB)
+
+    # Mercury and Venus visibility exceptions (_check_enhanced_combustion_exception)
+    dark = (sun_altitudes <= -8.0)[:, None]
+    visible = elongation >= 10.0
+    mercury = visible & dark & (
+        np.isin(signs, [SIGNS.index(Sign.GEMINI), SIGNS.index(Sign.VIRGO)]) | (elongation >= 18.0)
+    )
+    venus = visible & (dark | (elongation >= 40.0))
+    exception = np.zeros(longitudes.shape, dtype=bool)
+    exception[:, _MERCURY] = mercury[:, _MERCURY]
+    exception[:, _VENUS] = venus[:, _VENUS]
+    exception &= (condition == _COMBUSTION) | (condition == _UNDER_BEAMS)
+
+    score = score + np.where(
+        condition == _CAZIMI,
+        np.where(exact_cazimi, solar.exact_cazimi_bonus, solar.cazimi_bonus),
+        0,
+    )
+    score = score - np.where((condition == _COMBUSTION) & ~exception, solar.combustion_penalty, 0)
+    score = score - np.where((condition == _UNDER_BEAMS) & ~exception, solar.under_beams_penalty, 0)
+
+    return score, elongation, condition, exact_cazimi, exception
+
+
+def calculate_charts_batch(datetimes_utc: Sequence[datetime.datetime],
+                           latitudes: Sequence[float], longitudes: Sequence[float],
+                           location_names: Optional[Sequence[str]] = None) -> ChartBatch:
+    """Calculate one chart per ``(datetime, latitude, longitude)`` row.
+
+    ``latitudes`` and ``longitudes`` may also be scalars, placing every chart
+    at the same location.
+    """
+    n = len(datetimes_utc)
+    latitudes = np.broadcast_to(np.asarray(latitudes, dtype=float), (n,))
+    longitudes = np.broadcast_to(np.asarray(longitudes, dtype=float), (n,))
+    if location_names is None:
+        location_names = [""] * n
+
+    julian_days = np.empty(n)
+    planet_longitudes = np.zeros((n, len(TABLE_PLANETS)))
+    planet_latitudes = np.zeros((n, len(TABLE_PLANETS)))
+    speeds = np.zeros((n, len(TABLE_PLANETS)))
+    cusps = np.empty((n, 12))
+    ascendants = np.empty(n)
+    midheavens = np.empty(n)
+    sun_altitudes = np.empty(n)
+    exact_exits = np.full((n, len(TABLE_PLANETS)), math.nan)
+    snapshots: List[EphemerisSnapshot] = []
+
+    # Per-chart Swiss Ephemeris work
+    for row, dt_utc in enumerate(datetimes_utc):
+        lat, lon = float(latitudes[row]), float(longitudes[row])
+        jd_ut = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
+                           dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
+        julian_days[row] = jd_ut
+
+        snapshot = EphemerisSnapshot.capture(jd_ut, lat, lon, _SWE_IDS)
+        snapshots.append(snapshot)
+        for column, planet_id in enumerate(_SWE_IDS):
+            data = snapshot.body(planet_id)
+            if data is None:
+                logger.error(f"No ephemeris data for body {planet_id} at JD {jd_ut}")
+                continue
+            planet_longitudes[row, column] = data[0]
+            planet_latitudes[row, column] = data[1]
+            speeds[row, column] = data[3]
+
+        try:
+            houses_data, ascmc = swe_houses(jd_ut, lat, lon, b'R')  # Regiomontanus
+            cusps[row] = houses_data
+            ascendants[row] = ascmc[0]
+            midheavens[row] = ascmc[1]
+        except Exception as e:
+            logger.error(f"Error calculating houses at JD {jd_ut}: {e}")
+            cusps[row] = [i * 30.0 for i in range(12)]
+            ascendants[row] = 0.0
+            midheavens[row] = 90.0
+
+        sun_altitudes[row] = sun_altitude_at_civil_twilight(lat, lon, jd_ut, snapshot)
+        for column, planet in enumerate(TABLE_PLANETS):
+            exit_days = exact_days_to_sign_exit(planet, jd_ut)
+            if exit_days is not None:
+                exact_exits[row, column] = exit_days
+
+    # Whole-batch array work
+    signs = np.minimum((planet_longitudes % 360 // 30).astype(np.int64), 11)
+    houses = _house_positions(planet_longitudes, cusps)
+    essential = dignity_table().mask_array(planet_longitudes)
+    scores, elongations, conditions, exact_cazimi, exception = _dignity_scores(
+        planet_longitudes, speeds, signs, houses, cusps, essential, sun_altitudes
+    )
+    aspects = aspect_kernel(
+        planet_longitudes, speeds, orb_matrix().grid,
+        exact_exits=exact_exits, aspect_degrees=ORB_ASPECT_DEGREES,
+    )
+
+    logger.info(f"Calculated {n} charts in batch")
+    return ChartBatch(
+        planets=list(TABLE_PLANETS),
+        datetimes_utc=list(datetimes_utc),
+        julian_days=julian_days,
+        latitudes=np.array(latitudes),
+        longitudes=np.array(longitudes),
+        planet_longitudes=planet_longitudes,
+        planet_latitudes=planet_latitudes,
+        speeds=speeds,
+        signs=signs,
+        houses=houses,
+        cusps=cusps,
+        ascendants=ascendants,
+        midheavens=midheavens,
+        dignity_scores=scores,
+        essential=essential,
+        elongations=elongations,
+        solar_conditions=conditions,
+        exact_cazimi=exact_cazimi,
+        traditional_exception=exception,
+        aspects=aspects,
+        snapshots=snapshots,
+        location_names=list(location_names),
+    )
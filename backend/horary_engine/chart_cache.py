@@ -0,0 +1,184 @@
+"""In-process LRU cache of calculated charts.
+
+Resubmitting a question for the same moment and place (typically while
+toggling override checkboxes) used to recompute planets, houses, solar
+analyses, dignities and aspects from scratch. :class:`ChartCache` keeps
+recent charts keyed by the Julian day rounded to ``time_resolution_seconds``,
+the latitude and longitude rounded to ``coordinate_decimals`` places, the
+house system and the configuration version, with a size limit (least
+recently used entries go first) and a time-to-live.
+
+Settings come from the ``cache.chart`` configuration section and are
+re-read whenever the configuration version changes, which also empties the
+cache. Cached charts are shared between callers and must be treated as
+read-only.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from horary_config import config_snapshot
+
+try:
+    from ..models import HoraryChart
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import HoraryChart
+
+
+SECONDS_PER_DAY = 86400.0
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_TIME_RESOLUTION_SECONDS = 60.0
+DEFAULT_COORDINATE_DECIMALS = 4
+
+
+class ChartCache:
+    """Thread-safe LRU cache of :class:`HoraryChart` objects with a TTL.
+
+    A ``max_entries`` of 0 disables caching; a ``ttl_seconds`` of 0 or less
+    keeps entries until they are evicted for space.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 time_resolution_seconds: float = DEFAULT_TIME_RESOLUTION_SECONDS,
+                 coordinate_decimals: int = DEFAULT_COORDINATE_DECIMALS,
+                 clock=time.monotonic) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Tuple[float, HoraryChart]] = OrderedDict()
+        self._clock = clock
+        self.config_version: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.configure(max_entries, ttl_seconds, time_resolution_seconds, coordinate_decimals)
+
+    def configure(self, max_entries: int, ttl_seconds: float,
+                  time_resolution_seconds: float, coordinate_decimals: int) -> None:
+        """Apply new limits and drop every cached chart."""
+        with self._lock:
+            self.max_entries = max(int(max_entries), 0)
+            self.ttl_seconds = float(ttl_seconds)
+            self.time_resolution_seconds = max(float(time_resolution_seconds), 1e-3)
+            self.coordinate_decimals = int(coordinate_decimals)
+            self._entries.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def key(self, jd_ut: float, lat: float, lon: float, house_system: bytes,
+            config_version: int) -> Tuple[Hashable, ...]:
+        """Cache key for a chart at ``jd_ut`` and ``(lat, lon)``."""
+        return (
+            round(jd_ut * SECONDS_PER_DAY / self.time_resolution_seconds),
+            round(lat, self.coordinate_decimals),
+            round(lon, self.coordinate_decimals),
+            house_system,
+            config_version,
+        )
+
+    def get(self, key: Hashable) -> Optional[HoraryChart]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, chart = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return chart
+
+    def put(self, key: Hashable, chart: HoraryChart) -> None:
+        with self._lock:
+            if not self.max_entries:
+                return
+            expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds > 0 else float("inf")
+            self._entries[key] = (expires_at, chart)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.expirations = self.evictions = 0
+
+
+def relabel(chart: HoraryChart, dt_local: datetime.datetime, dt_utc: datetime.datetime,
+            timezone_info: str, lat: float, lon: float, location_name: str) -> HoraryChart:
+    """A cached ``chart`` carrying the caller's time, zone and place labels.
+
+    Returns ``chart`` itself when the labels already match, so repeat
+    submissions also share its memoized derived facts; otherwise a shallow
+    copy with a fresh context.
+    """
+    if (chart.date_time == dt_local and chart.date_time_utc == dt_utc
+            and chart.timezone_info == timezone_info and chart.location == (lat, lon)
+            and chart.location_name == location_name):
+        return chart
+    return dataclasses.replace(
+        chart,
+        date_time=dt_local,
+        date_time_utc=dt_utc,
+        timezone_info=timezone_info,
+        location=(lat, lon),
+        location_name=location_name,
+        context=None,
+    )
+
+
+_cache = ChartCache()
+_cache_lock = threading.Lock()
+
+
+def chart_cache() -> ChartCache:
+    """The process-wide chart cache, reconfigured when the configuration changes."""
+    snapshot = config_snapshot()
+    if _cache.config_version != snapshot.version:
+        with _cache_lock:
+            if _cache.config_version != snapshot.version:
+                settings = getattr(getattr(snapshot.config, "cache", None), "chart", None)
+                _cache.configure(
+                    getattr(settings, "max_entries", DEFAULT_MAX_ENTRIES),
+                    getattr(settings, "ttl_seconds", DEFAULT_TTL_SECONDS),
+                    getattr(settings, "time_resolution_seconds", DEFAULT_TIME_RESOLUTION_SECONDS),
+                    getattr(settings, "coordinate_decimals", DEFAULT_COORDINATE_DECIMALS),
+                )
+                _cache.config_version = snapshot.version
+    return _cache
@@ -0,0 +1,109 @@
+"""Per-chart memoization of derived facts (reception, void of course, radicality, perfection).
+
+A single judgment asks for the same reception between two planets, the Moon's
+void-of-course status and the chart's radicality many times over. These are
+pure functions of the chart and the active configuration, so they are computed
+once per chart and reused. The cache is dropped whenever the configuration
+object changes (for example after ``HoraryConfig.reset()`` with a different
+``HORARY_CONFIG``), and per-call overrides that change the answer are part of
+the cache key.
+
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from horary_config import config_version
+
+try:
+    from ..models import HoraryChart
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import HoraryChart
+
+
+class _ContextStats:
+    """Process-wide hit/miss counters across every chart context."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+
+    def record(self, kind: str, hit: bool) -> None:
+        with self._lock:
+            (self.hits if hit else self.misses)[kind] += 1
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            kinds = set(self.hits) | set(self.misses)
+            return {
+                kind: {
+                    "hits": self.hits[kind],
+                    "misses": self.misses[kind],
+                    "hit_rate": round(self.hits[kind] / (self.hits[kind] + self.misses[kind]), 4),
+                }
+                for kind in sorted(kinds)
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits.clear()
+            self.misses.clear()
+
+
+CONTEXT_STATS = _ContextStats()
+
+
+def _config_token() -> int:
+    return config_version()
+
+
+class ChartContext:
+    """Memoized derived facts for one :class:`HoraryChart`."""
+
+    def __init__(self) -> None:
+        self._config_token = _config_token()
+        self._values: Dict[Tuple[Hashable, ...], Any] = {}
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+
+    def memo(self, kind: str, key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+        """Return the cached ``kind``/``key`` value, computing it on first use."""
+        token = _config_token()
+        if token != self._config_token:
+            self._values.clear()
+            self._config_token = token
+
+        cache_key = (kind,) + key
+        try:
+            value = self._values[cache_key]
+        except KeyError:
+            value = compute()
+            self._values[cache_key] = value
+            self.misses[kind] += 1
+            CONTEXT_STATS.record(kind, hit=False)
+            return value
+        self.hits[kind] += 1
+        CONTEXT_STATS.record(kind, hit=True)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every cached value (call after mutating the chart)."""
+        self._values.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        kinds = set(self.hits) | set(self.misses)
+        return {kind: {"hits": self.hits[kind], "misses": self.misses[kind]} for kind in sorted(kinds)}
+
+
+def chart_context(chart: HoraryChart) -> ChartContext:
+    """Return the chart's memoization context, creating it on first use."""
+    context = chart.context
+    if context is None:
+        context = ChartContext()
+        chart.context = context
+    return context
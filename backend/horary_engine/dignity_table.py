@@ -0,0 +1,243 @@
+"""Degree-indexed essential dignity table.
+
+Every essential dignity a planet can hold - rulership, exaltation, day and
+night triplicity, term, face, detriment and fall - is a function of the
+planet and its zodiacal degree alone. The table compiles the sign tables
+below and the configured terms and faces (``reception.terms`` /
+``reception.faces``) into one bitmask per planet per degree, so scoring a
+planet's essential dignity is a single lookup instead of a walk over the
+configuration.
+
+Cells are whole degrees when every configured term and face bound is a whole
+degree (the traditional tables) and arc-minutes otherwise. The table is
+rebuilt whenever the configuration version changes.
+"""
+
+import logging
+import threading
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from horary_config import config_snapshot
+
+try:
+    from ..models import Planet, Sign
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Planet, Sign
+
+
+logger = logging.getLogger(__name__)
+
+# Planets covered by the table, in table order
+TABLE_PLANETS: List[Planet] = [
+    Planet.SUN,
+    Planet.MOON,
+    Planet.MERCURY,
+    Planet.VENUS,
+    Planet.MARS,
+    Planet.JUPITER,
+    Planet.SATURN,
+]
+_PLANET_INDEX: Dict[Planet, int] = {planet: i for i, planet in enumerate(TABLE_PLANETS)}
+_NO_RULER = 0xFF
+
+# Dignity bits
+RULERSHIP = 1
+EXALTATION = 2
+TRIPLICITY_DAY = 4
+TRIPLICITY_NIGHT = 8
+TERM = 16
+FACE = 32
+DETRIMENT = 64
+FALL = 128
+
+EXALTATIONS: Dict[Planet, Sign] = {
+    Planet.SUN: Sign.ARIES,
+    Planet.MOON: Sign.TAURUS,
+    Planet.MERCURY: Sign.VIRGO,
+    Planet.VENUS: Sign.PISCES,
+    Planet.MARS: Sign.CAPRICORN,
+    Planet.JUPITER: Sign.CANCER,
+    Planet.SATURN: Sign.LIBRA,
+}
+
+# Opposite the exaltation
+FALLS: Dict[Planet, Sign] = {
+    Planet.SUN: Sign.LIBRA,
+    Planet.MOON: Sign.SCORPIO,
+    Planet.MERCURY: Sign.PISCES,
+    Planet.VENUS: Sign.VIRGO,
+    Planet.MARS: Sign.CANCER,
+    Planet.JUPITER: Sign.CAPRICORN,
+    Planet.SATURN: Sign.ARIES,
+}
+
+# Opposite the domicile
+DETRIMENTS: Dict[Planet, Tuple[Sign, ...]] = {
+    Planet.SUN: (Sign.AQUARIUS,),
+    Planet.MOON: (Sign.CAPRICORN,),
+    Planet.MERCURY: (Sign.PISCES, Sign.SAGITTARIUS),
+    Planet.VENUS: (Sign.ARIES, Sign.SCORPIO),
+    Planet.MARS: (Sign.LIBRA, Sign.TAURUS),
+    Planet.JUPITER: (Sign.GEMINI, Sign.VIRGO),
+    Planet.SATURN: (Sign.CANCER, Sign.LEO),
+}
+
+# (day ruler, night ruler) by element
+_FIRE = (Planet.SUN, Planet.JUPITER)
+_EARTH = (Planet.VENUS, Planet.MOON)
+_AIR = (Planet.SATURN, Planet.MERCURY)
+_WATER = (Planet.VENUS, Planet.MARS)
+TRIPLICITY_RULERS: Dict[Sign, Tuple[Planet, Planet]] = {
+    Sign.ARIES: _FIRE, Sign.LEO: _FIRE, Sign.SAGITTARIUS: _FIRE,
+    Sign.TAURUS: _EARTH, Sign.VIRGO: _EARTH, Sign.CAPRICORN: _EARTH,
+    Sign.GEMINI: _AIR, Sign.LIBRA: _AIR, Sign.AQUARIUS: _AIR,
+    Sign.CANCER: _WATER, Sign.SCORPIO: _WATER, Sign.PISCES: _WATER,
+}
+
+HOUSE_JOYS: Dict[Planet, int] = {
+    Planet.MERCURY: 1,
+    Planet.MOON: 3,
+    Planet.VENUS: 5,
+    Planet.MARS: 6,
+    Planet.SUN: 9,
+    Planet.JUPITER: 11,
+    Planet.SATURN: 12,
+}
+
+_SIGNS: List[Sign] = sorted(Sign, key=lambda sign: sign.start_degree)
+
+
+def _bounds(config: SimpleNamespace, table_name: str) -> Dict[Sign, List[Tuple[float, float, Planet]]]:
+    """Configured ``(start, end, ruler)`` bounds per sign; signs without a table are omitted."""
+    section = getattr(getattr(config, "reception", None), table_name, None)
+    bounds: Dict[Sign, List[Tuple[float, float, Planet]]] = {}
+    for sign in _SIGNS:
+        table = getattr(section, sign.sign_name, None)
+        if table is None:
+            continue
+        entries = []
+        for bound in table:
+            try:
+                entries.append((bound.start, bound.end, Planet[bound.ruler.upper()]))
+            except (AttributeError, KeyError):
+                logger.warning(f"Ignoring malformed {table_name} entry for {sign.sign_name}: {bound}")
+        bounds[sign] = entries
+    return bounds
+
+
+class DignityTable:
+    """Essential dignity bitmasks for the seven planets at every degree.
+
+    ``masks[planet * cells + cell]`` holds the dignity bits of ``planet`` at
+    longitude cell ``cell``; ``term_rulers[cell]`` and ``face_rulers[cell]``
+    hold the table index of the term and face ruler (``0xFF`` when the sign
+    has no configured bounds there).
+    """
+
+    __slots__ = ("steps_per_degree", "cells", "masks", "term_rulers", "face_rulers")
+
+    def __init__(self, steps_per_degree: int, masks: bytearray,
+                 term_rulers: bytearray, face_rulers: bytearray) -> None:
+        self.steps_per_degree = steps_per_degree
+        self.cells = 360 * steps_per_degree
+        self.masks = masks
+        self.term_rulers = term_rulers
+        self.face_rulers = face_rulers
+
+    @classmethod
+    def build(cls, config: SimpleNamespace) -> "DignityTable":
+        """Compile the sign tables and ``config``'s terms and faces."""
+        terms = _bounds(config, "terms")
+        faces = _bounds(config, "faces")
+        whole_degrees = all(
+            float(start).is_integer() and float(end).is_integer()
+            for table in (terms, faces)
+            for entries in table.values()
+            for start, end, _ in entries
+        )
+        steps = 1 if whole_degrees else 60
+        cells = 360 * steps
+
+        term_rulers = bytearray([_NO_RULER]) * cells
+        face_rulers = bytearray([_NO_RULER]) * cells
+        for rulers, table in ((term_rulers, terms), (face_rulers, faces)):
+            for sign, entries in table.items():
+                for cell in range(sign.start_degree * steps, (sign.start_degree + 30) * steps):
+                    sign_degree = cell / steps - sign.start_degree
+                    for start, end, ruler in entries:
+                        if start <= sign_degree < end:
+                            rulers[cell] = _PLANET_INDEX.get(ruler, _NO_RULER)
+                            break
+
+        masks = bytearray(len(TABLE_PLANETS) * cells)
+        for index, planet in enumerate(TABLE_PLANETS):
+            for sign in _SIGNS:
+                sign_bits = 0
+                if sign.ruler == planet:
+                    sign_bits |= RULERSHIP
+                if EXALTATIONS.get(planet) == sign:
+                    sign_bits |= EXALTATION
+                day_ruler, night_ruler = TRIPLICITY_RULERS[sign]
+                if day_ruler == planet:
+                    sign_bits |= TRIPLICITY_DAY
+                if night_ruler == planet:
+                    sign_bits |= TRIPLICITY_NIGHT
+                if sign in DETRIMENTS.get(planet, ()):
+                    sign_bits |= DETRIMENT
+                if FALLS.get(planet) == sign:
+                    sign_bits |= FALL
+                for cell in range(sign.start_degree * steps, (sign.start_degree + 30) * steps):
+                    bits = sign_bits
+                    if term_rulers[cell] == index:
+                        bits |= TERM
+                    if face_rulers[cell] == index:
+                        bits |= FACE
+                    masks[index * cells + cell] = bits
+
+        return cls(steps, masks, term_rulers, face_rulers)
+
+    def cell(self, longitude: float) -> int:
+        return int((longitude % 360.0) * self.steps_per_degree) % self.cells
+
+    def mask(self, planet: Planet, longitude: float) -> int:
+        """Dignity bits ``planet`` holds at ``longitude`` (0 for points off the table)."""
+        index = _PLANET_INDEX.get(planet)
+        if index is None:
+            return 0
+        return self.masks[index * self.cells + self.cell(longitude)]
+
+    def mask_array(self, longitudes: np.ndarray) -> np.ndarray:
+        """Dignity bits for longitudes shaped ``(..., 7)`` in ``TABLE_PLANETS`` order."""
+        longitudes = np.asarray(longitudes, dtype=float)
+        cells = ((longitudes % 360.0) * self.steps_per_degree).astype(np.int64) % self.cells
+        grid = np.frombuffer(self.masks, dtype=np.uint8).reshape(len(TABLE_PLANETS), self.cells)
+        return grid[np.arange(len(TABLE_PLANETS)), cells]
+
+    def term_ruler(self, longitude: float) -> Optional[Planet]:
+        index = self.term_rulers[self.cell(longitude)]
+        return None if index == _NO_RULER else TABLE_PLANETS[index]
+
+    def face_ruler(self, longitude: float) -> Optional[Planet]:
+        index = self.face_rulers[self.cell(longitude)]
+        return None if index == _NO_RULER else TABLE_PLANETS[index]
+
+
+# (config version, table) swapped as one reference so readers never see a mixed pair
+_state: Optional[Tuple[int, DignityTable]] = None
+_state_lock = threading.Lock()
+
+
+def dignity_table() -> DignityTable:
+    """The dignity table for the active configuration, rebuilt when it changes."""
+    global _state
+    snapshot = config_snapshot()
+    state = _state
+    if state is not None and state[0] == snapshot.version:
+        return state[1]
+    with _state_lock:
+        if _state is None or _state[0] != snapshot.version:
+            _state = (snapshot.version, DignityTable.build(snapshot.config))
+        return _state[1]
@@ -16,7 +16,7 @@ except ImportError:  # pragma: no cover - fallback when executed as script
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Role:
     """Simple identifier for a significator role."""
 
@@ -39,7 +39,7 @@ Actor = Union[Planet, Role]
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Aspect:
     """Relationship between two actors."""
 
@@ -53,7 +53,7 @@ def aspect(actor1: Actor, actor2: Actor, aspect: AspectType, applying: bool = Tr
     return Aspect(actor1, actor2, aspect, applying)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Translation:
     """Translation of light through a third actor."""
 
@@ -76,7 +76,7 @@ def translation(
     return Translation(translator, from_actor, to_actor, applying, aspect, reception)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Collection:
     """Collection of light by a slower actor."""
 
@@ -99,7 +99,7 @@ def collection(
     return Collection(collector, actor1, actor2, applying, aspect, reception)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Prohibition:
     """Interfering aspect preventing perfection."""
 
@@ -112,7 +112,7 @@ def prohibition(prohibitor: Actor, significator: Actor, aspect: Optional[AspectT
     return Prohibition(prohibitor, significator, aspect)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Refranation:
     """One actor refrains from completing an aspect."""
 
@@ -124,7 +124,7 @@ def refranation(refrainer: Actor, other: Actor) -> Refranation:
     return Refranation(refrainer, other)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Frustration:
     """Third actor perfects aspect before main significators."""
 
@@ -137,7 +137,7 @@ def frustration(frustrator: Actor, from_actor: Actor, to_actor: Actor) -> Frustr
     return Frustration(frustrator, from_actor, to_actor)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Abscission:
     """Cutting off a connection between actors."""
 
@@ -150,7 +150,7 @@ def abscission(abscissor: Actor, from_actor: Actor, to_actor: Actor) -> Abscissi
     return Abscission(abscissor, from_actor, to_actor)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Reception:
     """One actor receives another in dignity."""
 
@@ -163,7 +163,7 @@ def reception(receiver: Actor, received: Actor, dignity: str) -> Reception:
     return Reception(receiver, received, dignity)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EssentialDignity:
     """Essential dignity indicator for an actor.
 
@@ -182,7 +182,7 @@ def essential(actor: Actor, score: Union[float, str]) -> EssentialDignity:
     return EssentialDignity(actor, score)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AccidentalDignity:
     """Accidental dignity indicator for an actor.
 
@@ -198,7 +198,7 @@ def accidental(actor: Actor, score: Union[float, str]) -> AccidentalDignity:
     return AccidentalDignity(actor, score)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MoonVoidOfCourse:
     """Status of the Moon's void-of-course condition."""
 
@@ -210,7 +210,7 @@ def moon_voc(is_voc: bool, detail: Optional[str] = None) -> MoonVoidOfCourse:
     return MoonVoidOfCourse(is_voc, detail)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HousePlacement:
     """Placement of an actor within a house."""
 
@@ -234,7 +234,7 @@ def is_malefic(planet: Planet) -> bool:
     return planet in (Planet.MARS, Planet.SATURN)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoleImportance:
     """Importance weighting for a role."""
 
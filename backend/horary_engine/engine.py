@@ -11,14 +11,18 @@ Refactored with comprehensive configuration system and enhanced lunar calculatio
 
 import os
 import datetime
+import hashlib
+import itertools
+import json
 import logging
 import re
 import math
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Mapping, Optional, Any, Sequence, Tuple, Union
 from types import SimpleNamespace
+from dataclasses import dataclass
 
 # Configuration system
-from horary_config import get_config, cfg, HoraryError
+from horary_config import get_config, cfg, config_snapshot, HoraryError
 
 # Timezone handling
 import swisseph as swe
@@ -37,6 +41,13 @@ from .calculation.helpers import (
     normalize_longitude,
     degrees_to_dms,
 )
+from .calculation.ephemeris import (
+    EphemerisSnapshot,
+    calc_ut,
+    count_swe_calls,
+    houses as swe_houses,
+)
+from .calculation.voc_calendar import get_voc_calendar
 from .services.geolocation import (
     TimezoneManager,
     LocationError,
@@ -503,12 +514,32 @@ except ImportError:  # pragma: no cover - fallback when package context is missi
     from taxonomy import Category, resolve_category, resolve as resolve_significators, get_defaults
     from category_rules import get_category_rules
 from .reception import TraditionalReceptionCalculator
+from .dignity_table import (
+    DETRIMENT,
+    DETRIMENTS,
+    EXALTATION,
+    EXALTATIONS,
+    FACE,
+    FALL,
+    FALLS,
+    HOUSE_JOYS,
+    RULERSHIP,
+    TERM,
+    TRIPLICITY_DAY,
+    TRIPLICITY_NIGHT,
+    TRIPLICITY_RULERS,
+    dignity_table,
+)
 from .aspects import (
     calculate_enhanced_aspects,
     calculate_moon_last_aspect,
     calculate_moon_next_aspect,
 )
 from .radicality import check_enhanced_radicality
+from .chart_context import chart_context
+from .chart_cache import chart_cache, relabel
+from .result_cache import register_cached_types, result_cache
+from .chart_batch import ChartBatch, calculate_charts_batch
 from .serialization import (
     serialize_chart_for_frontend,
     serialize_lunar_aspect,
@@ -527,6 +558,9 @@ class EnhancedTraditionalAstrologicalCalculator:
         # Initialize timezone manager (use provided or create new)
         self.timezone_manager = timezone_manager or TimezoneManager()
         
+        # Regiomontanus - traditional for horary
+        self.house_system = b'R'
+        
         # Traditional planets only
         self.planets_swe = {
             Planet.SUN: swe.SUN,
@@ -538,27 +572,9 @@ class EnhancedTraditionalAstrologicalCalculator:
             Planet.SATURN: swe.SATURN
         }
         
-        # Traditional exaltations
-        self.exaltations = {
-            Planet.SUN: Sign.ARIES,
-            Planet.MOON: Sign.TAURUS,
-            Planet.MERCURY: Sign.VIRGO,
-            Planet.VENUS: Sign.PISCES,
-            Planet.MARS: Sign.CAPRICORN,
-            Planet.JUPITER: Sign.CANCER,
-            Planet.SATURN: Sign.LIBRA
-        }
-        
-        # Traditional falls (opposite to exaltations)
-        self.falls = {
-            Planet.SUN: Sign.LIBRA,
-            Planet.MOON: Sign.SCORPIO,
-            Planet.MERCURY: Sign.PISCES,
-            Planet.VENUS: Sign.VIRGO,
-            Planet.MARS: Sign.CANCER,
-            Planet.JUPITER: Sign.CAPRICORN,
-            Planet.SATURN: Sign.ARIES
-        }
+        # Traditional exaltations and falls (opposite to exaltations)
+        self.exaltations = EXALTATIONS
+        self.falls = FALLS
         
         # Planets that have traditional exceptions to combustion
         self.combustion_resistant = {
@@ -566,17 +582,61 @@ class EnhancedTraditionalAstrologicalCalculator:
             Planet.VENUS: "Venus as morning/evening star"
         }
     
-    def get_real_moon_speed(self, jd_ut: float) -> float:
+    def get_real_moon_speed(self, jd_ut: float,
+                            snapshot: Optional[EphemerisSnapshot] = None) -> float:
         """Get actual Moon speed from ephemeris in degrees per day"""
+        if snapshot is not None and snapshot.covers(jd_ut):
+            moon_speed = snapshot.speed(swe.MOON)
+            if moon_speed is not None:
+                return abs(moon_speed)
         try:
-            moon_data, ret_flag = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+            moon_data, ret_flag = calc_ut(jd_ut, swe.MOON)
             return abs(moon_data[3])  # degrees per day
         except Exception as e:
             logger.warning(f"Failed to get Moon speed from ephemeris: {e}")
             # Fall back to configured default
             return cfg().timing.default_moon_speed_fallback
     
-    def calculate_chart(self, dt_local: datetime.datetime, dt_utc: datetime.datetime, 
+    def calculate_chart(self, dt_local: datetime.datetime, dt_utc: datetime.datetime,
+                        timezone_info: str, lat: float, lon: float, location_name: str) -> HoraryChart:
+        """Horary chart for a moment and place, served from the chart cache when possible.
+
+        Moments within the cache's time resolution and places within its
+        coordinate rounding share one calculation; the returned chart always
+        carries the caller's time, timezone and location labels.
+        """
+        cache = chart_cache()
+        shared = result_cache()
+        if not cache.enabled and not shared.backend.shared:
+            return self._calculate_chart(dt_local, dt_utc, timezone_info, lat, lon, location_name)
+
+        snapshot = config_snapshot()
+        jd_ut = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
+                           dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
+        key = cache.key(jd_ut, lat, lon, self.house_system, snapshot.version)
+        if cache.enabled:
+            chart = cache.get(key)
+            if chart is not None:
+                logger.info(f"Chart cache hit for JD {jd_ut} at ({lat:.4f}, {lon:.4f})")
+                return relabel(chart, dt_local, dt_utc, timezone_info, lat, lon, location_name)
+
+        # Other workers' charts, keyed on the process-independent config digest
+        shared_key = None
+        if shared.backend.shared:
+            shared_key = ":".join(str(part) for part in key[:3]) + f":{self.house_system.decode()}:{snapshot.digest}"
+            chart = shared.get("chart", shared_key)
+            if chart is not None:
+                logger.info(f"Shared chart cache hit for JD {jd_ut} at ({lat:.4f}, {lon:.4f})")
+                cache.put(key, chart)
+                return relabel(chart, dt_local, dt_utc, timezone_info, lat, lon, location_name)
+
+        chart = self._calculate_chart(dt_local, dt_utc, timezone_info, lat, lon, location_name)
+        cache.put(key, chart)
+        if shared_key is not None:
+            shared.put("chart", shared_key, chart)
+        return chart
+    
+    def _calculate_chart(self, dt_local: datetime.datetime, dt_utc: datetime.datetime, 
                        timezone_info: str, lat: float, lon: float, location_name: str) -> HoraryChart:
         """Enhanced Calculate horary chart with configuration system"""
         
@@ -595,11 +655,17 @@ class EnhancedTraditionalAstrologicalCalculator:
             safe_location = location_name.encode('ascii', 'replace').decode('ascii')
             logger.info(f"  Location: {safe_location} ({lat:.4f}, {lon:.4f})")
         
+        # One ephemeris read per body; helpers reuse this snapshot afterwards
+        snapshot = EphemerisSnapshot.capture(jd_ut, lat, lon, self.planets_swe.values())
+        logger.debug(f"  Ephemeris snapshot built with {snapshot.swe_calls} Swiss Ephemeris calls")
+        
         # Calculate traditional planets only
         planets = {}
         for planet_enum, planet_id in self.planets_swe.items():
             try:
-                planet_data, ret_flag = swe.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+                planet_data = snapshot.body(planet_id)
+                if planet_data is None:
+                    raise ValueError("no ephemeris data in snapshot")
                 
                 longitude = planet_data[0]
                 latitude = planet_data[1]
@@ -634,7 +700,7 @@ class EnhancedTraditionalAstrologicalCalculator:
         
         # Calculate houses (Regiomontanus - traditional for horary)
         try:
-            houses_data, ascmc = swe.houses(jd_ut, lat, lon, b'R')  # Regiomontanus
+            houses_data, ascmc = swe_houses(jd_ut, lat, lon, self.house_system)
             houses = list(houses_data)
             ascendant = ascmc[0]
             midheaven = ascmc[1]
@@ -661,7 +727,7 @@ class EnhancedTraditionalAstrologicalCalculator:
         
         for planet_enum, planet_pos in planets.items():
             solar_analysis = self._analyze_enhanced_solar_condition(
-                planet_enum, planet_pos, sun_pos, lat, lon, jd_ut)
+                planet_enum, planet_pos, sun_pos, lat, lon, jd_ut, snapshot)
             solar_analyses[planet_enum] = solar_analysis
             
             # Calculate comprehensive traditional dignity with all factors
@@ -696,18 +762,30 @@ class EnhancedTraditionalAstrologicalCalculator:
             solar_analyses=solar_analyses,
             julian_day=jd_ut,
             moon_last_aspect=moon_last_aspect,
-            moon_next_aspect=moon_next_aspect
+            moon_next_aspect=moon_next_aspect,
+            ephemeris=snapshot
         )
         
         return chart
     
     
+    def calculate_charts_batch(self, datetimes_utc: Sequence[datetime.datetime],
+                               latitudes: Sequence[float], longitudes: Sequence[float],
+                               location_names: Optional[Sequence[str]] = None) -> ChartBatch:
+        """Calculate many charts at once as a struct-of-arrays :class:`ChartBatch`.
+
+        ``batch.chart(i)`` gives the :class:`HoraryChart` that
+        :meth:`calculate_chart` would return for row ``i``.
+        """
+        return calculate_charts_batch(datetimes_utc, latitudes, longitudes, location_names)
+    
     # [Continue with the rest of the methods...]
     # Due to space constraints, I'll continue with key methods
     
     def _analyze_enhanced_solar_condition(self, planet: Planet, planet_pos: PlanetPosition, 
                                         sun_pos: PlanetPosition, lat: float, lon: float,
-                                        jd_ut: float) -> SolarAnalysis:
+                                        jd_ut: float,
+                                        snapshot: Optional[EphemerisSnapshot] = None) -> SolarAnalysis:
         """Enhanced solar condition analysis with configuration"""
         
         # Don't analyze the Sun itself
@@ -731,7 +809,7 @@ class EnhancedTraditionalAstrologicalCalculator:
         traditional_exception = False
         if planet in self.combustion_resistant:
             traditional_exception = self._check_enhanced_combustion_exception(
-                planet, planet_pos, sun_pos, lat, lon, jd_ut)
+                planet, planet_pos, sun_pos, lat, lon, jd_ut, snapshot)
         
         # Determine condition by hierarchy
         if elongation <= cazimi_orb:
@@ -773,7 +851,8 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _check_enhanced_combustion_exception(self, planet: Planet, planet_pos: PlanetPosition,
                                            sun_pos: PlanetPosition, lat: float, lon: float, 
-                                           jd_ut: float) -> bool:
+                                           jd_ut: float,
+                                           snapshot: Optional[EphemerisSnapshot] = None) -> bool:
         """Enhanced combustion exception check with visibility calculations"""
         
         elongation = calculate_elongation(planet_pos.longitude, sun_pos.longitude)
@@ -786,7 +865,7 @@ class EnhancedTraditionalAstrologicalCalculator:
         is_oriental = is_planet_oriental(planet_pos.longitude, sun_pos.longitude)
         
         # Get Sun altitude at civil twilight
-        sun_altitude = sun_altitude_at_civil_twilight(lat, lon, jd_ut)
+        sun_altitude = sun_altitude_at_civil_twilight(lat, lon, jd_ut, snapshot)
         
         # Classical visibility conditions
         if planet == Planet.MERCURY:
@@ -815,56 +894,37 @@ class EnhancedTraditionalAstrologicalCalculator:
         """Enhanced dignity calculation with configuration"""
         score = 0
         config = cfg()
+        weights = config_snapshot().dignity
         
         # Rulership
         if sign.ruler == planet:
-            score += config.dignity.rulership
+            score += weights.rulership
         
         # Exaltation
         if planet in self.exaltations and self.exaltations[planet] == sign:
-            score += config.dignity.exaltation
+            score += weights.exaltation
         
         # Detriment - opposite to rulership
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN],
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
-            score += config.dignity.detriment
+        if sign in DETRIMENTS.get(planet, ()):
+            score += weights.detriment
         
         # Fall
         if planet in self.falls and self.falls[planet] == sign:
-            score += config.dignity.fall
+            score += weights.fall
         
         # House considerations - traditional joys
-        house_joys = {
-            Planet.MERCURY: 1,  # 1st house
-            Planet.MOON: 3,     # 3rd house
-            Planet.VENUS: 5,    # 5th house
-            Planet.MARS: 6,     # 6th house
-            Planet.SUN: 9,      # 9th house
-            Planet.JUPITER: 11, # 11th house
-            Planet.SATURN: 12   # 12th house
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
-            score += config.dignity.joy
+        if HOUSE_JOYS.get(planet) == house:
+            score += weights.joy
         
         # ENHANCED: Use 5° rule for angularity determination
         # This requires access to houses and longitude - will be handled in calling function
         # For now, use traditional classification
         if house in [1, 4, 7, 10]:
-            score += config.dignity.angular
+            score += weights.angular
         elif house in [2, 5, 8, 11]:  # Succedent houses
-            score += config.dignity.succedent
+            score += weights.succedent
         elif house in [3, 6, 9, 12]:  # Cadent houses
-            score += config.dignity.cadent
+            score += weights.cadent
         
         # Enhanced solar conditions
         if solar_analysis:
@@ -899,87 +959,62 @@ class EnhancedTraditionalAstrologicalCalculator:
         score = 0
         dignities: List[str] = []
         config = cfg()
-        sign = self._get_sign(planet_pos.longitude)
+        weights = config_snapshot().dignity
         house = planet_pos.house
-        sign_degree = (planet_pos.longitude - sign.start_degree) % 30
         
         # === ESSENTIAL DIGNITIES ===
+        # One lookup in the degree-indexed table for every essential dignity
+        essential = dignity_table().mask(planet, planet_pos.longitude)
         
         # Rulership (+5)
-        if sign.ruler == planet:
-            score += config.dignity.rulership
+        if essential & RULERSHIP:
+            score += weights.rulership
             dignities.append("rulership")
         
         # Exaltation (+4)
-        if planet in self.exaltations and self.exaltations[planet] == sign:
-            score += config.dignity.exaltation
+        if essential & EXALTATION:
+            score += weights.exaltation
             dignities.append("exaltation")
         
         # Triplicity (+3) - traditional day/night rulers
-        triplicity_score = self._calculate_triplicity_dignity(planet, sign, sun_pos)
-        if triplicity_score:
-            score += triplicity_score
+        # Day = Sun in houses 7-12 (below horizon), Night = Sun in houses 1-6 (above horizon)
+        is_day = sun_pos.house in [7, 8, 9, 10, 11, 12]
+        if essential & (TRIPLICITY_DAY if is_day else TRIPLICITY_NIGHT) and weights.triplicity:
+            score += weights.triplicity
             dignities.append("triplicity")
 
         # Terms (+2) and Faces (+1)
-        try:
-            terms_table = getattr(cfg().reception.terms, sign.sign_name)
-            for term in terms_table:
-                if term.start <= sign_degree < term.end and Planet[term.ruler.upper()] == planet:
-                    score += 2
-                    dignities.append("term")
-                    break
-        except AttributeError:
-            pass
+        if essential & TERM:
+            score += 2
+            dignities.append("term")
 
-        try:
-            faces_table = getattr(cfg().reception.faces, sign.sign_name)
-            for face in faces_table:
-                if face.start <= sign_degree < face.end and Planet[face.ruler.upper()] == planet:
-                    score += 1
-                    dignities.append("face")
-                    break
-        except AttributeError:
-            pass
+        if essential & FACE:
+            score += 1
+            dignities.append("face")
         
         # Detriment (-5)
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN], 
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
-            score += config.dignity.detriment
+        if essential & DETRIMENT:
+            score += weights.detriment
         
         # Fall (-4)
-        if planet in self.falls and self.falls[planet] == sign:
-            score += config.dignity.fall
+        if essential & FALL:
+            score += weights.fall
         
         # === ACCIDENTAL DIGNITIES ===
         
         # House joys (+2)
-        house_joys = {
-            Planet.MERCURY: 1, Planet.MOON: 3, Planet.VENUS: 5,
-            Planet.MARS: 6, Planet.SUN: 9, Planet.JUPITER: 11, Planet.SATURN: 12
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
-            score += config.dignity.joy
+        if HOUSE_JOYS.get(planet) == house:
+            score += weights.joy
         
         # Angularity with 5° rule
         angularity = self._get_traditional_angularity(planet_pos.longitude, houses, house)
         
         if angularity == "angular":
-            score += config.dignity.angular
+            score += weights.angular
         elif angularity == "succedent":
-            score += config.dignity.succedent
+            score += weights.succedent
         else:  # cadent
-            score += config.dignity.cadent
+            score += weights.cadent
         
         # === ADVANCED TRADITIONAL FACTORS ===
         
@@ -1018,67 +1053,44 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _calculate_triplicity_dignity(self, planet: Planet, sign: Sign, sun_pos: PlanetPosition) -> int:
         """Calculate traditional triplicity dignity (ENHANCED)"""
-        # Traditional triplicity rulers by element and day/night (CORRECTED)
-        triplicity_rulers = {
-            # Fire signs (Aries, Leo, Sagittarius) 
-            Sign.ARIES: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.LEO: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.SAGITTARIUS: {"day": Planet.SUN, "night": Planet.JUPITER},
-            
-            # Earth signs (Taurus, Virgo, Capricorn)
-            Sign.TAURUS: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.VIRGO: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.CAPRICORN: {"day": Planet.VENUS, "night": Planet.MOON},
-            
-            # Air signs (Gemini, Libra, Aquarius)
-            Sign.GEMINI: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.LIBRA: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.AQUARIUS: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            
-            # Water signs (Cancer, Scorpio, Pisces)
-            Sign.CANCER: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.SCORPIO: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.PISCES: {"day": Planet.VENUS, "night": Planet.MARS}
-        }
-        
-        if sign not in triplicity_rulers:
+        if sign not in TRIPLICITY_RULERS:
             return 0
             
         # Determine if it's day or night (Sun above or below horizon)
         # Day = Sun in houses 7-12 (below horizon), Night = Sun in houses 1-6 (above horizon)
         sun_house = sun_pos.house
         is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Houses below horizon = day
-        sect = "day" if is_day else "night"
+        day_ruler, night_ruler = TRIPLICITY_RULERS[sign]
         
-        if triplicity_rulers[sign][sect] == planet:
-            return cfg().dignity.triplicity  # Configurable triplicity score
+        if (day_ruler if is_day else night_ruler) == planet:
+            return config_snapshot().dignity.triplicity  # Configurable triplicity score
             
         return 0
     
     def _calculate_speed_dignity(self, planet: Planet, speed: float) -> int:
         """Calculate dignity bonus/penalty based on planetary speed (ENHANCED)"""
-        config = cfg()
+        weights = config_snapshot().dignity
         
         # Traditional fast/slow considerations
         if planet == Planet.MOON:
             if speed > 13.0:  # Fast Moon
-                return config.dignity.speed_bonus
+                return weights.speed_bonus
             elif speed < 11.0:  # Slow Moon  
-                return config.dignity.speed_penalty
+                return weights.speed_penalty
         elif planet in [Planet.MERCURY, Planet.VENUS]:
             if speed > 1.0:  # Fast inferior planets
-                return config.dignity.speed_bonus
+                return weights.speed_bonus
         elif planet in [Planet.MARS, Planet.JUPITER, Planet.SATURN]:
             if speed > 0.3:  # Fast superior planets
-                return config.dignity.speed_bonus
+                return weights.speed_bonus
             elif speed < 0.1:  # Very slow (near station)
-                return config.dignity.speed_penalty
+                return weights.speed_penalty
                 
         return 0
     
     def _calculate_hayz_dignity(self, planet: Planet, sun_pos: PlanetPosition, houses: List[float]) -> int:
         """Calculate hayz (sect) dignity bonus (ENHANCED)"""
-        config = cfg()
+        weights = config_snapshot().dignity
         
         # Determine if Sun is above horizon (day) or below (night)
         sun_house = self._calculate_house_position(sun_pos.longitude, houses)
@@ -1089,13 +1101,13 @@ class EnhancedTraditionalAstrologicalCalculator:
         nocturnal_planets = [Planet.MOON, Planet.VENUS, Planet.MARS]
         
         if planet in diurnal_planets and is_day:
-            return config.dignity.hayz_bonus  # Diurnal planet in day chart
+            return weights.hayz_bonus  # Diurnal planet in day chart
         elif planet in nocturnal_planets and not is_day:
-            return config.dignity.hayz_bonus  # Nocturnal planet in night chart
+            return weights.hayz_bonus  # Nocturnal planet in night chart
         elif planet in diurnal_planets and not is_day:
-            return config.dignity.hayz_penalty  # Diurnal planet in night chart
+            return weights.hayz_penalty  # Diurnal planet in night chart
         elif planet in nocturnal_planets and is_day:
-            return config.dignity.hayz_penalty  # Nocturnal planet in day chart
+            return weights.hayz_penalty  # Nocturnal planet in day chart
             
         # Mercury is neutral
         return 0
@@ -1107,51 +1119,37 @@ class EnhancedTraditionalAstrologicalCalculator:
         """Enhanced dignity calculation with 5° rule for angularity (ENHANCED)"""
         score = 0
         config = cfg()
+        weights = config_snapshot().dignity
         sign = self._get_sign(planet_pos.longitude)
         house = planet_pos.house
         
         # Basic dignities (same as before)
         if sign.ruler == planet:
-            score += config.dignity.rulership
+            score += weights.rulership
         
         if planet in self.exaltations and self.exaltations[planet] == sign:
-            score += config.dignity.exaltation
+            score += weights.exaltation
         
         # Detriment
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN],
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
-            score += config.dignity.detriment
+        if sign in DETRIMENTS.get(planet, ()):
+            score += weights.detriment
         
         if planet in self.falls and self.falls[planet] == sign:
-            score += config.dignity.fall
+            score += weights.fall
         
         # House joys
-        house_joys = {
-            Planet.MERCURY: 1, Planet.MOON: 3, Planet.VENUS: 5,
-            Planet.MARS: 6, Planet.SUN: 9, Planet.JUPITER: 11, Planet.SATURN: 12
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
-            score += config.dignity.joy
+        if HOUSE_JOYS.get(planet) == house:
+            score += weights.joy
         
         # ENHANCED: Apply 5° rule for angularity
         angularity = self._get_traditional_angularity(planet_pos.longitude, houses, house)
         
         if angularity == "angular":
-            score += config.dignity.angular
+            score += weights.angular
         elif angularity == "succedent":
-            score += config.dignity.succedent
+            score += weights.succedent
         else:  # cadent
-            score += config.dignity.cadent
+            score += weights.cadent
         
         # Solar conditions
         if solar_analysis:
@@ -1226,6 +1224,94 @@ class EnhancedTraditionalAstrologicalCalculator:
             return "cadent"
 
 
+class ChartNotFoundError(LookupError):
+    """No prepared chart is cached under the requested chart id."""
+
+
+@dataclass
+class PreparedQuestion:
+    """Everything a judgment needs before override flags come into play.
+
+    Cached under the response's ``chart_id`` so :meth:`rejudge` can rerun
+    only the judgment stages when the user toggles an override.
+    """
+    question: str
+    chart: HoraryChart
+    question_analysis: Dict[str, Any]
+    window_days: int
+
+
+# Charts, and the prepared questions and judgments holding them, are cached
+register_cached_types(PreparedQuestion, HoraryChart, EphemerisSnapshot)
+
+
+OVERRIDE_FLAGS = ("ignore_radicality", "ignore_void_moon", "ignore_combustion", "ignore_saturn_7th")
+
+
+def override_combinations(
+        override_matrix: Union[bool, Sequence[Mapping[str, bool]]] = True) -> List[Dict[str, bool]]:
+    """Normalize an override matrix request into a list of flag dictionaries.
+
+    ``True`` selects all 16 combinations of :data:`OVERRIDE_FLAGS`, starting
+    with none set; otherwise each mapping names the flags to set, missing
+    flags being ``False``. Duplicates are dropped and unknown flag names
+    raise ``ValueError``.
+    """
+    if override_matrix is True:
+        return [dict(zip(OVERRIDE_FLAGS, bits))
+                for bits in itertools.product((False, True), repeat=len(OVERRIDE_FLAGS))]
+
+    combinations = []
+    for entry in override_matrix:
+        if not isinstance(entry, Mapping):
+            raise ValueError(f"Override combination must be a mapping of flags, got {entry!r}")
+        unknown = set(entry) - set(OVERRIDE_FLAGS)
+        if unknown:
+            raise ValueError(f"Unknown override flags: {', '.join(sorted(unknown))}")
+        flags = {flag: bool(entry.get(flag, False)) for flag in OVERRIDE_FLAGS}
+        if flags not in combinations:
+            combinations.append(flags)
+    if not combinations:
+        raise ValueError("Override matrix is empty")
+    return combinations
+
+
+def _judgment_error(e: Exception) -> Dict[str, Any]:
+    """Error result for a judgment that raised ``e``."""
+    if isinstance(e, LocationError):
+        return {
+            "error": str(e),
+            "judgment": "LOCATION_ERROR",
+            "confidence": 0,
+            "reasoning": _structure_reasoning([f"Location error: {e}"]),
+            "error_type": "LocationError"
+        }
+    import traceback
+    logger.error(f"Error in judge_question: {e}")
+    logger.error(traceback.format_exc())
+    return {
+        "error": str(e),
+        "judgment": "ERROR",
+        "confidence": 0,
+        "reasoning": _structure_reasoning([f"Calculation error: {e}"])
+    }
+
+
+def _timezone_info(chart: HoraryChart) -> Dict[str, Any]:
+    """Local and UTC time, zone and place of ``chart`` as returned by judgments."""
+    lat, lon = chart.location
+    return {
+        "local_time": chart.date_time.isoformat(),
+        "utc_time": chart.date_time_utc.isoformat(),
+        "timezone": chart.timezone_info,
+        "location_name": chart.location_name,
+        "coordinates": {
+            "latitude": lat,
+            "longitude": lon
+        }
+    }
+
+
 class EnhancedTraditionalHoraryJudgmentEngine:
     """Enhanced Traditional horary judgment engine with configuration system"""
     
@@ -1235,7 +1321,64 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         self.calculator = EnhancedTraditionalAstrologicalCalculator(timezone_manager=self.timezone_manager)
         self.reception_calculator = TraditionalReceptionCalculator()
     
-    def judge_question(self, question: str, location: str, 
+    def judge_question(self, question: str, location: str,
+                       date_str: Optional[str] = None, time_str: Optional[str] = None,
+                       timezone_str: Optional[str] = None, use_current_time: bool = True,
+                       manual_houses: Optional[List[int]] = None,
+                       ignore_radicality: bool = False,
+                       ignore_void_moon: bool = False,
+                       ignore_combustion: bool = False,
+                       ignore_saturn_7th: bool = False,
+                       exaltation_confidence_boost: float = None,
+                       override_matrix: Union[bool, Sequence[Mapping[str, bool]], None] = None) -> Dict[str, Any]:
+        """Horary judgment, served from the result cache for repeated requests.
+
+        Judgments for an explicit date and time are cached under their
+        canonical inputs and the configuration digest; "current time"
+        requests and failed judgments are never cached. Every hit is a fresh
+        copy the caller may modify.
+
+        With ``override_matrix`` (``True`` for all 16 combinations, or a list
+        of flag mappings as accepted by :func:`override_combinations`) the
+        chart and question analysis are prepared once and only the judgment
+        stages run per combination; the result carries an ``override_matrix``
+        list of verdicts and confidences instead of a single judgment, and
+        the individual ``ignore_*`` arguments are not used.
+        """
+        if override_matrix is not None and override_matrix is not False:
+            override_matrix = override_combinations(override_matrix)
+        else:
+            override_matrix = None
+        arguments = dict(
+            question=question, location=location, date_str=date_str, time_str=time_str,
+            timezone_str=timezone_str, use_current_time=use_current_time, manual_houses=manual_houses,
+            ignore_radicality=ignore_radicality, ignore_void_moon=ignore_void_moon,
+            ignore_combustion=ignore_combustion, ignore_saturn_7th=ignore_saturn_7th,
+            exaltation_confidence_boost=exaltation_confidence_boost,
+            override_matrix=override_matrix,
+        )
+        if use_current_time:
+            return self._judge_question(**arguments)[0]
+
+        cache = result_cache()
+        canonical = json.dumps({**arguments, "config": config_snapshot().digest}, sort_keys=True, default=str)
+        key = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        cached = cache.get("judgment", key)
+        if cached is not None:
+            logger.info("Judgment cache hit")
+            result, prepared = cached
+            # The session entry behind chart_id can be evicted or expire
+            # before the judgment; put it back so /api/rejudge still finds it
+            if not cache.contains("session", result["chart_id"]):
+                cache.put("session", result["chart_id"], prepared)
+            return result
+
+        result, prepared = self._judge_question(**arguments)
+        if "error" not in result:
+            cache.put("judgment", key, (result, prepared))
+        return result
+
+    def _judge_question(self, question: str, location: str, 
                       date_str: Optional[str] = None, time_str: Optional[str] = None,
                       timezone_str: Optional[str] = None, use_current_time: bool = True,
                       manual_houses: Optional[List[int]] = None,
@@ -1245,8 +1388,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                       ignore_combustion: bool = False,
                       ignore_saturn_7th: bool = False,
                       # Legacy reception weighting (now configurable)
-                      exaltation_confidence_boost: float = None) -> Dict[str, Any]:
-        """Enhanced Traditional horary judgment with configuration system"""
+                      exaltation_confidence_boost: float = None,
+                      override_matrix: Optional[List[Dict[str, bool]]] = None
+                      ) -> Tuple[Dict[str, Any], Optional["PreparedQuestion"]]:
+        """Enhanced Traditional horary judgment with configuration system.
+
+        Returns the result and the prepared question stored under its
+        ``chart_id`` (``None`` when the chart could not be prepared).
+        """
         
         logger.info("=== JUDGE_QUESTION METHOD CALLED ===")
         logger.info(f"Location parameter: {location}")
@@ -1257,101 +1406,242 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             if exaltation_confidence_boost is None:
                 exaltation_confidence_boost = config.confidence.reception.mutual_exaltation_bonus
             
-            # Fail-fast geocoding
+            chart = self._cast_chart(location, date_str, time_str, timezone_str, use_current_time)
+            prepared = self._prepare_question(question, chart, manual_houses)
+            chart_id = self._store_prepared(prepared, manual_houses)
+
+        except Exception as e:
+            return _judgment_error(e), None
+
+        if override_matrix is not None:
+            result = self._judge_matrix(prepared, override_matrix, exaltation_confidence_boost)
+        else:
+            result = self._judge_prepared(
+                prepared, ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
+                exaltation_confidence_boost)
+        if "error" not in result:
+            result["chart_id"] = chart_id
+        return result, prepared
+
+    def judge_questions(self, questions: Sequence[str], location: str,
+                        date_str: Optional[str] = None, time_str: Optional[str] = None,
+                        timezone_str: Optional[str] = None, use_current_time: bool = True,
+                        manual_houses: Optional[Sequence[Optional[List[int]]]] = None,
+                        ignore_radicality: bool = False,
+                        ignore_void_moon: bool = False,
+                        ignore_combustion: bool = False,
+                        ignore_saturn_7th: bool = False,
+                        exaltation_confidence_boost: float = None) -> Iterator[Dict[str, Any]]:
+        """Judge several questions asked at the same moment and place.
+
+        Geocoding, timezone resolution and the chart are done once; each
+        question is then analyzed and judged against that shared chart.
+        Results are yielded in input order, each with its own ``question``
+        and ``chart_id``, so callers can stream them. ``manual_houses``
+        optionally gives a house list (or ``None``) per question. If the
+        chart cannot be cast, every question yields the same error result.
+        """
+        if manual_houses is not None and len(manual_houses) != len(questions):
+            raise ValueError("manual_houses must give one entry per question")
+        if exaltation_confidence_boost is None:
+            exaltation_confidence_boost = cfg().confidence.reception.mutual_exaltation_bonus
+
+        try:
+            chart = self._cast_chart(location, date_str, time_str, timezone_str, use_current_time)
+        except Exception as e:
+            error = _judgment_error(e)
+            for question in questions:
+                yield {**error, "question": question}
+            return
+
+        for index, question in enumerate(questions):
+            houses = manual_houses[index] if manual_houses is not None else None
             try:
-                lat, lon, full_location = safe_geocode(location)
-            except LocationError as e:
-                raise e
-            
-            # Handle datetime with proper timezone support
-            if use_current_time:
-                dt_local, dt_utc, timezone_used = self.timezone_manager.get_current_time_for_location(lat, lon)
-            else:
-                if not date_str or not time_str:
-                    raise ValueError("Date and time must be provided when not using current time")
-                dt_local, dt_utc, timezone_used = self.timezone_manager.parse_datetime_with_timezone(
-                    date_str, time_str, timezone_str, lat, lon)
-            
-            chart = self.calculator.calculate_chart(dt_local, dt_utc, timezone_used, lat, lon, full_location)
-            
-            # Analyze question traditionally
-            question_analysis = self.question_analyzer.analyze_question(question)
-            
-            # Override with manual houses if provided
-            if manual_houses:
-                question_analysis["relevant_houses"] = manual_houses
-                question_analysis["significators"]["quesited_house"] = manual_houses[1] if len(manual_houses) > 1 else 7
-            
-            # Extract window_days from timeframe analysis
-            timeframe_analysis = question_analysis.get("timeframe_analysis", {})
-            window_days = timeframe_analysis.get("window_days")
-            
-            # Use default window if no timeframe specified
-            if window_days is None:
-                config = cfg()
-                window_days = getattr(config.timing, "default_window_days", 90)
-            
-            # Apply enhanced judgment with configuration
-            judgment = self._apply_enhanced_judgment(
-                chart, question_analysis,
-                ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
-                exaltation_confidence_boost, window_days)
-
-            structured_reasoning = _structure_reasoning(judgment.get("reasoning", []))
-            question_type = resolve_category(question_analysis.get("question_type"))
-            category_rules = get_category_rules(question_type)
-            evaluation = _evaluate_enhanced(structured_reasoning, category_rules)
-            
-            # Apply hybrid confidence calculation if blockers were found
-            if judgment.get("hybrid_confidence_needed"):
-                # For "no perfection" cases, create a synthetic blocker
-                blockers = judgment["traditional_factors"].get("blockers", [])
-                if not blockers and judgment["traditional_factors"].get("perfection_type") == "none":
-                    blockers = [{
-                        "type": "no_perfection",
-                        "severity": "fatal", 
-                        "confidence": 85,
-                        "reason": "No viable perfection found between significators"
-                    }]
-                
-                hybrid_result = self._calculate_hybrid_confidence(
-                    judgment["result"],
-                    evaluation["score"], 
-                    blockers, 
-                    70  # Base confidence in the determined verdict
-                )
-                judgment["confidence"] = hybrid_result["confidence"]
-                judgment["confidence_breakdown"] = hybrid_result["breakdown"]
-            
-            # Preserve the engine's confidence when a valid perfection exists.
-            # The evaluation sigmoid is useful diagnostics, but it shouldn't
-            # override direct/translation/collection (or equivalent) perfection results.
-            judgment["reasoning"] = structured_reasoning
-
-            # Determine if we have a valid perfection type
-            tf = judgment.get("traditional_factors", {}) or {}
-            perfection_type = tf.get("perfection_type")
-            valid_perfection_types = {
-                "direct",
-                "translation",
-                "collection",
-                "same_ruler_unity",
-                "future_house_placement",
-                "moon_sun_education",
-                "transaction_translation",
-            }
+                prepared = self._prepare_question(question, chart, houses)
+                chart_id = self._store_prepared(prepared, houses)
+            except Exception as e:
+                yield {**_judgment_error(e), "question": question}
+                continue
+            result = self._judge_prepared(
+                prepared, ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
+                exaltation_confidence_boost)
+            if "error" not in result:
+                result["chart_id"] = chart_id
+            yield result
+
+    def _cast_chart(self, location: str, date_str: Optional[str], time_str: Optional[str],
+                    timezone_str: Optional[str], use_current_time: bool) -> HoraryChart:
+        """Geocode ``location``, resolve the moment and calculate its chart."""
+        # Fail-fast geocoding
+        try:
+            lat, lon, full_location = safe_geocode(location)
+        except LocationError as e:
+            raise e
+        
+        # Handle datetime with proper timezone support
+        if use_current_time:
+            dt_local, dt_utc, timezone_used = self.timezone_manager.get_current_time_for_location(lat, lon)
+        else:
+            if not date_str or not time_str:
+                raise ValueError("Date and time must be provided when not using current time")
+            dt_local, dt_utc, timezone_used = self.timezone_manager.parse_datetime_with_timezone(
+                date_str, time_str, timezone_str, lat, lon)
+        
+        return self.calculator.calculate_chart(dt_local, dt_utc, timezone_used, lat, lon, full_location)
+
+    def _prepare_question(self, question: str, chart: HoraryChart,
+                          manual_houses: Optional[List[int]]) -> "PreparedQuestion":
+        """Analyze ``question`` for judgment against ``chart``."""
+        # Analyze question traditionally
+        question_analysis = self.question_analyzer.analyze_question(question)
+        
+        # Override with manual houses if provided
+        if manual_houses:
+            question_analysis["relevant_houses"] = manual_houses
+            question_analysis["significators"]["quesited_house"] = manual_houses[1] if len(manual_houses) > 1 else 7
+        
+        # Extract window_days from timeframe analysis
+        timeframe_analysis = question_analysis.get("timeframe_analysis", {})
+        window_days = timeframe_analysis.get("window_days")
+        
+        # Use default window if no timeframe specified
+        if window_days is None:
+            config = cfg()
+            window_days = getattr(config.timing, "default_window_days", 90)
+        
+        return PreparedQuestion(question, chart, question_analysis, window_days)
+
+    def _store_prepared(self, prepared: "PreparedQuestion", manual_houses: Optional[List[int]]) -> str:
+        """Keep ``prepared`` in the result cache for rejudging and return its chart id."""
+        chart = prepared.chart
+        identity = json.dumps([
+            prepared.question, manual_houses, chart.location, chart.location_name,
+            chart.date_time.isoformat(), chart.date_time_utc.isoformat(), chart.timezone_info,
+            config_snapshot().digest,
+        ], default=str)
+        chart_id = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+        result_cache().put("session", chart_id, prepared)
+        return chart_id
+
+    def rejudge(self, chart_id: str,
+                ignore_radicality: bool = False,
+                ignore_void_moon: bool = False,
+                ignore_combustion: bool = False,
+                ignore_saturn_7th: bool = False,
+                exaltation_confidence_boost: float = None,
+                override_matrix: Union[bool, Sequence[Mapping[str, bool]], None] = None) -> Dict[str, Any]:
+        """Judge a previously submitted chart again with different override flags.
+
+        Skips geocoding, timezone resolution, chart calculation and question
+        analysis, running only :meth:`_apply_enhanced_judgment` and the stages
+        after it. ``override_matrix`` works as in :meth:`judge_question`.
+        Raises :class:`ChartNotFoundError` when ``chart_id`` is unknown or has
+        expired from the result cache.
+        """
+        if override_matrix is not None and override_matrix is not False:
+            override_matrix = override_combinations(override_matrix)
+        else:
+            override_matrix = None
+        prepared = result_cache().get("session", chart_id)
+        if prepared is None:
+            raise ChartNotFoundError(chart_id)
+        if exaltation_confidence_boost is None:
+            exaltation_confidence_boost = cfg().confidence.reception.mutual_exaltation_bonus
+        if override_matrix is not None:
+            result = self._judge_matrix(prepared, override_matrix, exaltation_confidence_boost)
+        else:
+            result = self._judge_prepared(
+                prepared, ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
+                exaltation_confidence_boost)
+        if "error" not in result:
+            result["chart_id"] = chart_id
+        return result
 
-            if judgment.get("hybrid_confidence_needed"):
-                # Already set by hybrid calc above
-                pass
-            elif perfection_type in valid_perfection_types:
-                # Keep engine-derived confidence for valid perfection
-                judgment["confidence"] = int(judgment.get("confidence", 0))
-            else:
-                # Fall back to evaluation-derived confidence when no perfection
-                judgment["confidence"] = int(evaluation["confidence"])
+    def _final_verdict(self, prepared: "PreparedQuestion",
+                       ignore_radicality: bool, ignore_void_moon: bool,
+                       ignore_combustion: bool, ignore_saturn_7th: bool,
+                       exaltation_confidence_boost: float) -> Dict[str, Any]:
+        """Verdict, confidence and structured reasoning for one set of override flags"""
+        chart = prepared.chart
+        question_analysis = prepared.question_analysis
+
+        # Apply enhanced judgment with configuration
+        judgment = self._apply_enhanced_judgment(
+            chart, question_analysis,
+            ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
+            exaltation_confidence_boost, prepared.window_days)
+
+        structured_reasoning = _structure_reasoning(judgment.get("reasoning", []))
+        question_type = resolve_category(question_analysis.get("question_type"))
+        category_rules = get_category_rules(question_type)
+        evaluation = _evaluate_enhanced(structured_reasoning, category_rules)
+
+        # Apply hybrid confidence calculation if blockers were found
+        if judgment.get("hybrid_confidence_needed"):
+            # For "no perfection" cases, create a synthetic blocker
+            blockers = judgment["traditional_factors"].get("blockers", [])
+            if not blockers and judgment["traditional_factors"].get("perfection_type") == "none":
+                blockers = [{
+                    "type": "no_perfection",
+                    "severity": "fatal", 
+                    "confidence": 85,
+                    "reason": "No viable perfection found between significators"
+                }]
+
+            hybrid_result = self._calculate_hybrid_confidence(
+                judgment["result"],
+                evaluation["score"], 
+                blockers, 
+                70  # Base confidence in the determined verdict
+            )
+            judgment["confidence"] = hybrid_result["confidence"]
+            judgment["confidence_breakdown"] = hybrid_result["breakdown"]
+
+        # Preserve the engine's confidence when a valid perfection exists.
+        # The evaluation sigmoid is useful diagnostics, but it shouldn't
+        # override direct/translation/collection (or equivalent) perfection results.
+        judgment["reasoning"] = structured_reasoning
+
+        # Determine if we have a valid perfection type
+        tf = judgment.get("traditional_factors", {}) or {}
+        perfection_type = tf.get("perfection_type")
+        valid_perfection_types = {
+            "direct",
+            "translation",
+            "collection",
+            "same_ruler_unity",
+            "future_house_placement",
+            "moon_sun_education",
+            "transaction_translation",
+        }
 
-            judgment["scoring_trace"] = evaluation["trace"]
+        if judgment.get("hybrid_confidence_needed"):
+            # Already set by hybrid calc above
+            pass
+        elif perfection_type in valid_perfection_types:
+            # Keep engine-derived confidence for valid perfection
+            judgment["confidence"] = int(judgment.get("confidence", 0))
+        else:
+            # Fall back to evaluation-derived confidence when no perfection
+            judgment["confidence"] = int(evaluation["confidence"])
+
+        judgment["scoring_trace"] = evaluation["trace"]
+        return judgment
+
+    def _judge_prepared(self, prepared: "PreparedQuestion",
+                        ignore_radicality: bool, ignore_void_moon: bool,
+                        ignore_combustion: bool, ignore_saturn_7th: bool,
+                        exaltation_confidence_boost: float) -> Dict[str, Any]:
+        """Judgment stages from :meth:`_apply_enhanced_judgment` on, for a prepared chart"""
+        chart = prepared.chart
+        question = prepared.question
+        question_analysis = prepared.question_analysis
+
+        try:
+            judgment = self._final_verdict(
+                prepared, ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
+                exaltation_confidence_boost)
+            structured_reasoning = judgment["reasoning"]
             reasoning_bundle = serialize_reasoning_v1(structured_reasoning) if USE_REASONING_V1 else None
 
             # Serialize chart data for frontend
@@ -1382,36 +1672,41 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "moon_last_aspect": serialize_lunar_aspect(chart.moon_last_aspect),
                 "moon_next_aspect": serialize_lunar_aspect(chart.moon_next_aspect),
                 
-                "timezone_info": {
-                    "local_time": dt_local.isoformat(),
-                    "utc_time": dt_utc.isoformat(),
-                    "timezone": timezone_used,
-                    "location_name": full_location,
-                    "coordinates": {
-                        "latitude": lat,
-                        "longitude": lon
-                    }
-                }
+                "timezone_info": _timezone_info(chart)
             }
             
-        except LocationError as e:
-            return {
-                "error": str(e),
-                "judgment": "LOCATION_ERROR",
-                "confidence": 0,
-                "reasoning": _structure_reasoning([f"Location error: {e}"]),
-                "error_type": "LocationError"
-            }
         except Exception as e:
-            import traceback
-            logger.error(f"Error in judge_question: {e}")
-            logger.error(traceback.format_exc())
+            return _judgment_error(e)
+
+    def _judge_matrix(self, prepared: "PreparedQuestion", combinations: List[Dict[str, bool]],
+                      exaltation_confidence_boost: float) -> Dict[str, Any]:
+        """Verdicts of a prepared chart under each combination of override flags.
+
+        Radicality, void-of-course and perfection searches are memoized on the
+        chart, so after the first combination each row only reruns the cheap
+        final stages.
+        """
+        try:
+            rows = []
+            for flags in combinations:
+                judgment = self._final_verdict(
+                    prepared, flags["ignore_radicality"], flags["ignore_void_moon"],
+                    flags["ignore_combustion"], flags["ignore_saturn_7th"],
+                    exaltation_confidence_boost)
+                rows.append({
+                    "overrides": dict(flags),
+                    "judgment": judgment["result"],
+                    "confidence": judgment["confidence"],
+                    "perfection_type": (judgment.get("traditional_factors") or {}).get("perfection_type"),
+                })
             return {
-                "error": str(e),
-                "judgment": "ERROR",
-                "confidence": 0,
-                "reasoning": _structure_reasoning([f"Calculation error: {e}"])
+                "question": prepared.question,
+                "question_analysis": prepared.question_analysis,
+                "override_matrix": rows,
+                "timezone_info": _timezone_info(prepared.chart),
             }
+        except Exception as e:
+            return _judgment_error(e)
     
     def _moon_aspects_significator_directly(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> bool:
         """
@@ -1899,8 +2194,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             secondary_significator = significators["quesited"]  # Success
             reasoning.append(f"3rd person analysis: Student ({primary_significator.value}) seeking Success ({secondary_significator.value})")
         
-        perfection = self._check_enhanced_perfection(
-            chart, primary_significator, secondary_significator, exaltation_confidence_boost, window_days
+        perfection = chart_context(chart).memo(
+            "perfection",
+            (primary_significator, secondary_significator, exaltation_confidence_boost, window_days),
+            lambda: self._check_enhanced_perfection(
+                chart, primary_significator, secondary_significator, exaltation_confidence_boost, window_days
+            ),
         )
 
         # Post-event mode: count recent separating aspects as positive testimony
@@ -3456,15 +3755,17 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         to any of the seven classical planets (Sun, Mercury, Venus, Mars, Jupiter, Saturn) 
         by a Ptolemaic aspect (conjunction, sextile, square, trine, opposition) within the 
         permitted orb, considering true motion (including retrograde).
+        Memoized per chart.
         """
         
-        return self._void_traditional_ground_truth(chart)
+        return chart_context(chart).memo("void", (), lambda: self._void_traditional_ground_truth(chart))
     
     def _void_traditional_ground_truth(self, chart: HoraryChart) -> Dict[str, Any]:
         """GROUND TRUTH: Traditional void of course implementation
         
         Moon is void if it will not apply to any classical planet by Ptolemaic aspect
-        within permitted orb before leaving its current sign.
+        within permitted orb before leaving its current sign. When the precomputed
+        VOC calendar covers the chart, its exact periods decide the void status.
         """
         moon_pos = chart.planets[Planet.MOON]
         config = cfg()
@@ -3483,6 +3784,20 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "first_applying_aspect": None,
             }
 
+        # Precomputed calendar (exact motion) decides void status when it covers the chart
+        calendar = get_voc_calendar()
+        calendar_void = None
+        if calendar is not None and calendar.covers(chart.julian_day):
+            calendar_void = calendar.period_at(chart.julian_day) is not None
+            if calendar_void:
+                return {
+                    "void": True,
+                    "exception": False,
+                    "reason": f"Moon makes no applying aspects before leaving {moon_pos.sign.sign_name}",
+                    "degrees_left_in_sign": degrees_left_in_sign,
+                    "first_applying_aspect": None,
+                }
+
         # Determine next lunar aspect using analytic helper
         moon_next_aspect = calculate_moon_next_aspect(
             chart.planets,
@@ -3490,6 +3805,21 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             ignore_orb_for_voc=True,
         )
 
+        if moon_next_aspect is None and calendar_void is False:
+            # Linear projection misses an aspect the exact calendar still sees
+            void_start = calendar.next_period(chart.julian_day)
+            days_to_void = void_start[0] - chart.julian_day if void_start else 0.0
+            return {
+                "void": False,
+                "exception": False,
+                "reason": (
+                    f"Moon perfects its last aspect in {moon_pos.sign.sign_name} "
+                    f"in {days_to_void:.1f} days"
+                ),
+                "degrees_left_in_sign": degrees_left_in_sign,
+                "first_applying_aspect": None,
+            }
+
         if moon_next_aspect is None:
             return {
                 "void": True,
@@ -3542,7 +3872,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         """Enhanced Moon story with real timing calculations"""
         
         moon_pos = chart.planets[Planet.MOON]
-        moon_speed = self.calculator.get_real_moon_speed(chart.julian_day)
+        moon_speed = self.calculator.get_real_moon_speed(chart.julian_day, chart.ephemeris)
         
         # Calculate how much time Moon has left in current sign
         moon_degree_in_sign = moon_pos.longitude % 30
@@ -3628,7 +3958,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 # Handle Aspect object - get degrees_to_exact from perfection root level
                 degrees = perfection.get("degrees_to_exact") or perfection.get("t_perfect_days", 0) * 13.0  # Fallback calculation
                 
-            moon_speed = self.calculator.get_real_moon_speed(chart.julian_day)
+            moon_speed = self.calculator.get_real_moon_speed(chart.julian_day, chart.ephemeris)
             if degrees > 0 and moon_speed > 0:
                 timing_days = degrees / moon_speed
                 return self._format_timing_description_enhanced(timing_days)
@@ -3907,8 +4237,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         quesited_pos = chart.planets[quesited]
 
         # Moiety-based orb limit
-        moiety_q = getattr(config.orbs.moieties, querent.value, self._get_planet_moiety(querent))
-        moiety_qs = getattr(config.orbs.moieties, quesited.value, self._get_planet_moiety(quesited))
+        moieties = config_snapshot().moieties or {}
+        moiety_q = moieties.get(querent.value, self._get_planet_moiety(querent))
+        moiety_qs = moieties.get(quesited.value, self._get_planet_moiety(quesited))
         orb_limit = moiety_q + moiety_qs
 
         target_angles = {
@@ -3958,8 +4289,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             if days_to_perfection is not None and 0 < days_to_perfection <= max_window:
                 # Sign boundary check
                 if getattr(config.perfection, "require_in_sign", False):
-                    exit_q = days_to_sign_exit(querent_pos.longitude, querent_pos.speed)
-                    exit_qs = days_to_sign_exit(quesited_pos.longitude, quesited_pos.speed)
+                    exit_q = days_to_sign_exit(
+                        querent_pos.longitude, querent_pos.speed, querent_pos.planet, chart.julian_day
+                    )
+                    exit_qs = days_to_sign_exit(
+                        quesited_pos.longitude, quesited_pos.speed, quesited_pos.planet, chart.julian_day
+                    )
                     exits = [e for e in (exit_q, exit_qs) if e is not None]
                     if exits and days_to_perfection > min(exits):
                         return {
@@ -4322,8 +4657,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 continue
             
             # TRADITIONAL REQUIREMENT 4: Timing validation - collection must complete in current signs
-            querent_days_to_sign = self._days_to_sign_exit(querent_pos)
-            quesited_days_to_sign = self._days_to_sign_exit(quesited_pos)
+            querent_days_to_sign = self._days_to_sign_exit(querent_pos, chart.julian_day)
+            quesited_days_to_sign = self._days_to_sign_exit(quesited_pos, chart.julian_day)
             
             # Calculate when collection aspects will perfect
             querent_collection_days = self._days_to_aspect_perfection(querent_pos, pos, aspects_from_querent)
@@ -4672,11 +5007,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         return {"found": False}
     
-    def _days_to_sign_exit(self, pos: PlanetPosition) -> float:
+    def _days_to_sign_exit(self, pos: PlanetPosition, jd_ut: Optional[float] = None) -> float:
         """Calculate days until planet exits current sign"""
         try:
             from .calculation.helpers import days_to_sign_exit
-            return days_to_sign_exit(pos.longitude, pos.speed)
+            return days_to_sign_exit(pos.longitude, pos.speed, pos.planet, jd_ut)
         except ImportError:
             # Fallback calculation
             degrees_in_sign = pos.longitude % 30
@@ -4709,8 +5044,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         Returns tuple (perfects, impediment) where impediment details reason if False."""
         
         # Use enhanced sign exit calculations
-        days_to_exit_1 = days_to_sign_exit(pos1.longitude, pos1.speed)
-        days_to_exit_2 = days_to_sign_exit(pos2.longitude, pos2.speed)
+        days_to_exit_1 = days_to_sign_exit(pos1.longitude, pos1.speed, pos1.planet, chart.julian_day)
+        days_to_exit_2 = days_to_sign_exit(pos2.longitude, pos2.speed, pos2.planet, chart.julian_day)
 
         # Estimate days until aspect perfects using analytic solver
         days_to_perfect = self._calculate_future_aspect_time(
@@ -4815,11 +5150,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _check_dignified_reception(self, chart: HoraryChart, receiving_planet: Planet, received_planet: Planet) -> bool:
         """Check if receiving_planet has dignified reception of received_planet using centralized calculator"""
-        reception_data = self.reception_calculator.calculate_comprehensive_reception(chart, receiving_planet, received_planet)
-        
         # Check if receiving_planet has dignities over received_planet
-        reception_1_to_2 = reception_data["planet1_receives_planet2"]
-        return len(reception_1_to_2) > 0
+        return self.reception_calculator.reception_matrix(chart).receives(receiving_planet, received_planet)
     
     
     def _apply_confidence_threshold(self, result: str, confidence: int, reasoning: List[str]) -> tuple:
@@ -5352,21 +5684,28 @@ class HoraryEngine:
         # Call the enhanced engine
         logger.info("About to call self.engine.judge_question()...")
         try:
-            result = self.engine.judge_question(
-                question=question,
-                location=location,
-                date_str=date_str,
-                time_str=time_str,
-                timezone_str=timezone_str,
-                use_current_time=use_current_time,
-                manual_houses=manual_houses,
-                ignore_radicality=ignore_radicality,
-                ignore_void_moon=ignore_void_moon,
-                ignore_combustion=ignore_combustion,
-                ignore_saturn_7th=ignore_saturn_7th,
-                exaltation_confidence_boost=exaltation_confidence_boost
+            with count_swe_calls() as swe_calls:
+                result = self.engine.judge_question(
+                    question=question,
+                    location=location,
+                    date_str=date_str,
+                    time_str=time_str,
+                    timezone_str=timezone_str,
+                    use_current_time=use_current_time,
+                    manual_houses=manual_houses,
+                    ignore_radicality=ignore_radicality,
+                    ignore_void_moon=ignore_void_moon,
+                    ignore_combustion=ignore_combustion,
+                    ignore_saturn_7th=ignore_saturn_7th,
+                    exaltation_confidence_boost=exaltation_confidence_boost,
+                    override_matrix=settings.get("override_matrix")
+                )
+            logger.info(
+                f"self.engine.judge_question() completed successfully "
+                f"({swe_calls.calls} Swiss Ephemeris calls)"
             )
-            logger.info("self.engine.judge_question() completed successfully")
+            if isinstance(result, dict):
+                result["ephemeris_stats"] = swe_calls.as_dict()
         except Exception as engine_error:
             logger.error(f"ERROR in self.engine.judge_question(): {str(engine_error)}")
             logger.error(f"Exception type: {type(engine_error)}")
@@ -5374,6 +5713,62 @@ class HoraryEngine:
             logger.error(f"Full traceback: {traceback.format_exc()}")
             raise
         
+        return self._audit(result)
+    
+    def judge_batch(self, questions: Sequence[str], settings: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Judge several questions against one chart, yielding results in order.
+
+        ``settings`` takes the keys :meth:`judge` accepts, except that
+        ``manual_houses`` (if given) holds one house list or ``None`` per
+        question.
+        """
+        exaltation_confidence_boost = settings.get("exaltation_confidence_boost")
+        if exaltation_confidence_boost is None:
+            exaltation_confidence_boost = cfg().confidence.reception.mutual_exaltation_bonus
+        
+        results = self.engine.judge_questions(
+            questions,
+            location=settings.get("location", "London, England"),
+            date_str=settings.get("date"),
+            time_str=settings.get("time"),
+            timezone_str=settings.get("timezone"),
+            use_current_time=settings.get("use_current_time", True),
+            manual_houses=settings.get("manual_houses"),
+            ignore_radicality=settings.get("ignore_radicality", False),
+            ignore_void_moon=settings.get("ignore_void_moon", False),
+            ignore_combustion=settings.get("ignore_combustion", False),
+            ignore_saturn_7th=settings.get("ignore_saturn_7th", False),
+            exaltation_confidence_boost=exaltation_confidence_boost,
+        )
+        for result in results:
+            yield self._audit(result)
+    
+    def rejudge(self, chart_id: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Judge a previously returned ``chart_id`` again with new override flags.
+
+        ``settings`` takes the override keys :meth:`judge` accepts, including
+        ``override_matrix``; raises :class:`ChartNotFoundError` when the chart
+        is no longer cached.
+        """
+        exaltation_confidence_boost = settings.get("exaltation_confidence_boost")
+        if exaltation_confidence_boost is None:
+            exaltation_confidence_boost = cfg().confidence.reception.mutual_exaltation_bonus
+        
+        with count_swe_calls() as swe_calls:
+            result = self.engine.rejudge(
+                chart_id,
+                ignore_radicality=settings.get("ignore_radicality", False),
+                ignore_void_moon=settings.get("ignore_void_moon", False),
+                ignore_combustion=settings.get("ignore_combustion", False),
+                ignore_saturn_7th=settings.get("ignore_saturn_7th", False),
+                exaltation_confidence_boost=exaltation_confidence_boost,
+                override_matrix=settings.get("override_matrix"),
+            )
+        result["ephemeris_stats"] = swe_calls.as_dict()
+        return self._audit(result)
+    
+    def _audit(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the explanation consistency audit to a judgment result"""
         # ENHANCED: Apply explanation consistency audit
         if hasattr(result, 'get') and result.get('chart_data'):
             chart = result.get('chart_data')  # Chart data for audit
@@ -4,7 +4,7 @@ from typing import Callable, Dict, Any, List
 
 from horary_config import cfg
 from .calculation.helpers import days_to_sign_exit
-from .reception import TraditionalReceptionCalculator
+from .reception import reception_matrix
 try:
     from ..models import Planet, Aspect, HoraryChart
 except ImportError:  # pragma: no cover - fallback when executed as script
@@ -69,14 +69,14 @@ def check_future_prohibitions(
 
     pos1 = chart.planets[sig1]
     pos2 = chart.planets[sig2]
-    reception_calc = TraditionalReceptionCalculator()
+    receptions = reception_matrix(chart)
 
     def _valid(t: float, p_a, p_b) -> bool:
         if t is None or t <= 0 or t >= days_ahead:
             return False
         if require_in_sign and not allow_out_of_sign:
-            exit_a = days_to_sign_exit(p_a.longitude, p_a.speed)
-            exit_b = days_to_sign_exit(p_b.longitude, p_b.speed)
+            exit_a = days_to_sign_exit(p_a.longitude, p_a.speed, p_a.planet, chart.julian_day)
+            exit_b = days_to_sign_exit(p_b.longitude, p_b.speed, p_b.planet, chart.julian_day)
             return t < exit_a and t < exit_b
         return True
 
@@ -104,9 +104,9 @@ def check_future_prohibitions(
                             if aspect in (Aspect.CONJUNCTION, Aspect.TRINE, Aspect.SEXTILE)
                             else "with difficulty"
                         )
-                        rec1 = reception_calc.calculate_comprehensive_reception(chart, planet, sig1)
-                        rec2 = reception_calc.calculate_comprehensive_reception(chart, planet, sig2)
-                        has_reception = rec1["type"] != "none" or rec2["type"] != "none"
+                        has_reception = receptions.has_reception(planet, sig1) or receptions.has_reception(
+                            planet, sig2
+                        )
                         reason = (
                             f"Perfection by translation ({aspect.display_name.lower()}): positive "
                             + (f"({quality})" if quality == "easier" else f"{quality}")
@@ -141,9 +141,9 @@ def check_future_prohibitions(
                             if aspect in (Aspect.CONJUNCTION, Aspect.TRINE, Aspect.SEXTILE)
                             else "with difficulty"
                         )
-                        rec1 = reception_calc.calculate_comprehensive_reception(chart, planet, sig1)
-                        rec2 = reception_calc.calculate_comprehensive_reception(chart, planet, sig2)
-                        has_reception = rec1["type"] != "none" or rec2["type"] != "none"
+                        has_reception = receptions.has_reception(planet, sig1) or receptions.has_reception(
+                            planet, sig2
+                        )
                         reason = (
                             f"Perfection by translation ({aspect.display_name.lower()}): positive "
                             + (f"({quality})" if quality == "easier" else f"{quality}")
@@ -176,9 +176,9 @@ def check_future_prohibitions(
                             if aspect in (Aspect.CONJUNCTION, Aspect.TRINE, Aspect.SEXTILE)
                             else "with difficulty"
                         )
-                        rec1 = reception_calc.calculate_comprehensive_reception(chart, planet, sig1)
-                        rec2 = reception_calc.calculate_comprehensive_reception(chart, planet, sig2)
-                        has_reception = rec1["type"] != "none" or rec2["type"] != "none"
+                        has_reception = receptions.has_reception(planet, sig1) or receptions.has_reception(
+                            planet, sig2
+                        )
                         reason = (
                             f"Perfection by collection ({aspect.display_name.lower()}): positive "
                             + (f"({quality})" if quality == "easier" else f"{quality}")
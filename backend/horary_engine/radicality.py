@@ -10,6 +10,7 @@ try:
     from ..models import HoraryChart, Planet, Sign
 except ImportError:  # pragma: no cover - fallback when executed as script
     from models import HoraryChart, Planet, Sign
+from .chart_context import chart_context
 
 
 PLANET_SEQUENCE = [
@@ -171,7 +172,16 @@ def check_planetary_hour_agreement(chart: HoraryChart, config) -> Dict[str, Any]
 
 
 def check_enhanced_radicality(chart: HoraryChart, ignore_saturn_7th: bool = False) -> Dict[str, Any]:
-    """Enhanced radicality checks with configuration"""
+    """Enhanced radicality checks with configuration (memoized per chart)"""
+
+    return chart_context(chart).memo(
+        "radicality",
+        (ignore_saturn_7th,),
+        lambda: _check_enhanced_radicality(chart, ignore_saturn_7th),
+    )
+
+
+def _check_enhanced_radicality(chart: HoraryChart, ignore_saturn_7th: bool) -> Dict[str, Any]:
 
     config = cfg()
     asc_degree = chart.ascendant % 30
@@ -1,8 +1,9 @@
 """Reception calculations for the horary engine."""
 
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 
-from horary_config import cfg
+from .chart_context import chart_context
+from .dignity_table import dignity_table
 
 try:
     from ..models import Planet, Sign, HoraryChart
@@ -10,6 +11,135 @@ except ImportError:  # pragma: no cover - fallback when executed as script
     from models import Planet, Sign, HoraryChart
 
 
+# Planets covered by the reception matrix, in matrix order
+MATRIX_PLANETS: List[Planet] = [
+    Planet.SUN,
+    Planet.MOON,
+    Planet.MERCURY,
+    Planet.VENUS,
+    Planet.MARS,
+    Planet.JUPITER,
+    Planet.SATURN,
+]
+_MATRIX_INDEX: Dict[Planet, int] = {planet: i for i, planet in enumerate(MATRIX_PLANETS)}
+
+# Dignity bits, strongest first (the order legacy dignity lists are reported in)
+DOMICILE = 1
+EXALTATION = 2
+TRIPLICITY = 4
+TERM = 8
+FACE = 16
+DIGNITY_BITS: List[Tuple[int, str]] = [
+    (DOMICILE, "domicile"),
+    (EXALTATION, "exaltation"),
+    (TRIPLICITY, "triplicity"),
+    (TERM, "term"),
+    (FACE, "face"),
+]
+
+# Signs by index (0 = Aries ... 11 = Pisces), the order of ChartArrays.signs
+_SIGNS: List[Sign] = sorted(Sign, key=lambda sign: sign.start_degree)
+_SIGN_INDEX: Dict[Sign, int] = {sign: i for i, sign in enumerate(_SIGNS)}
+
+
+def _tolist(column: Sequence[Any]) -> List[Any]:
+    return column.tolist() if hasattr(column, "tolist") else list(column)
+
+
+class ReceptionMatrix:
+    """Every reception between the seven planets of one chart.
+
+    ``cells[receiver * 7 + received]`` is a bitmask of the dignities the
+    receiving planet holds at the received planet's position. Built once per
+    chart from the planets' sign and longitude columns and the dignity
+    table (see :meth:`from_columns`), so a :class:`ChartArrays` builds it
+    straight from its own arrays.
+    """
+
+    __slots__ = ("cells", "day_chart")
+
+    def __init__(self, cells: bytearray, day_chart: bool) -> None:
+        self.cells = cells
+        self.day_chart = day_chart
+
+    @classmethod
+    def build(cls, chart: HoraryChart, calculator: "TraditionalReceptionCalculator") -> "ReceptionMatrix":
+        signs = [-1] * len(MATRIX_PLANETS)
+        longitudes = [0.0] * len(MATRIX_PLANETS)
+        for index, planet in enumerate(MATRIX_PLANETS):
+            pos = chart.planets.get(planet)
+            if pos is not None:
+                signs[index] = _SIGN_INDEX[pos.sign]
+                longitudes[index] = pos.longitude
+        return cls.from_columns(signs, longitudes, calculator.is_day_chart(chart), calculator)
+
+    @classmethod
+    def from_columns(cls, signs: Sequence[int], longitudes: Sequence[float], day_chart: bool,
+                     calculator: "TraditionalReceptionCalculator") -> "ReceptionMatrix":
+        """Matrix for planets with sign indexes ``signs`` (-1 where absent) at ``longitudes``.
+
+        Both columns are in ``MATRIX_PLANETS`` order, as lists or arrays.
+        Domicile, exaltation and triplicity follow the sign; the term and
+        face rulers are read from the dignity table at the longitude.
+        """
+        table = dignity_table()
+        sect = "day" if day_chart else "night"
+        exalted_in = {sign: planet for planet, sign in calculator.exaltations.items()}
+        size = len(MATRIX_PLANETS)
+        cells = bytearray(size ** 2)
+
+        rows = zip(_tolist(signs), _tolist(longitudes))
+        for received_index, (sign_index, longitude) in enumerate(rows):
+            if sign_index < 0:
+                continue
+            sign = _SIGNS[sign_index]
+            cell = table.cell(longitude)
+            receivers = [
+                (DOMICILE, _MATRIX_INDEX.get(sign.ruler)),
+                (EXALTATION, _MATRIX_INDEX.get(exalted_in.get(sign))),
+                (TRIPLICITY, _MATRIX_INDEX.get(calculator.triplicity_rulers.get(sign, {}).get(sect))),
+                # The table's rulers are planet indexes in the same order, 0xFF for none
+                (TERM, table.term_rulers[cell]),
+                (FACE, table.face_rulers[cell]),
+            ]
+            for bit, receiver_index in receivers:
+                if receiver_index is not None and receiver_index < size:
+                    cells[receiver_index * size + received_index] |= bit
+
+        return cls(cells, day_chart)
+
+    @staticmethod
+    def covers(planet: Planet) -> bool:
+        return planet in _MATRIX_INDEX
+
+    def mask(self, receiver: Planet, received: Planet) -> int:
+        return self.cells[_MATRIX_INDEX[receiver] * len(MATRIX_PLANETS) + _MATRIX_INDEX[received]]
+
+    def receives(self, receiver: Planet, received: Planet, dignities: int = 0xFF) -> bool:
+        """True if ``receiver`` receives ``received`` by any of ``dignities``."""
+        return bool(self.mask(receiver, received) & dignities)
+
+    def has_reception(self, planet1: Planet, planet2: Planet) -> bool:
+        """True if either planet receives the other."""
+        return bool(self.mask(planet1, planet2) or self.mask(planet2, planet1))
+
+    def dignities(self, receiver: Planet, received: Planet) -> List[str]:
+        """Legacy dignity list (strongest first) for one direction."""
+        mask = self.mask(receiver, received)
+        return [name for bit, name in DIGNITY_BITS if mask & bit]
+
+
+_default_calculator: Optional["TraditionalReceptionCalculator"] = None
+
+
+def reception_matrix(chart: HoraryChart) -> ReceptionMatrix:
+    """The chart's reception matrix, built once and memoized on the chart."""
+    global _default_calculator
+    if _default_calculator is None:
+        _default_calculator = TraditionalReceptionCalculator()
+    return _default_calculator.reception_matrix(chart)
+
+
 class TraditionalReceptionCalculator:
     """Centralized reception calculator - single source of truth for all reception logic"""
 
@@ -52,20 +182,30 @@ class TraditionalReceptionCalculator:
         self, chart: HoraryChart, planet1: Planet, planet2: Planet
     ) -> Dict[str, Any]:
         """SINGLE SOURCE OF TRUTH for all reception calculations
-        Returns comprehensive reception data used by both reasoning and structured output."""
+        Returns comprehensive reception data used by both reasoning and structured output.
 
-        # Get planet positions
-        pos1 = chart.planets[planet1]
-        pos2 = chart.planets[planet2]
+        Results are memoized per chart; treat the returned dict as read-only."""
 
-        # Determine day/night for triplicity calculations
-        sun_pos = chart.planets[Planet.SUN]
-        sun_house = self._calculate_house_position(sun_pos.longitude, chart.houses)
-        is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Sun below horizon = day chart
+        return chart_context(chart).memo(
+            "reception",
+            (planet1, planet2),
+            lambda: self._compute_comprehensive_reception(chart, planet1, planet2),
+        )
 
-        # Check all dignity types for both directions
-        reception_1_to_2 = self._check_all_dignities(planet1, pos2, is_day)
-        reception_2_to_1 = self._check_all_dignities(planet2, pos1, is_day)
+    def _compute_comprehensive_reception(
+        self, chart: HoraryChart, planet1: Planet, planet2: Planet
+    ) -> Dict[str, Any]:
+
+        if ReceptionMatrix.covers(planet1) and ReceptionMatrix.covers(planet2):
+            # Legacy dict generated from the chart's precomputed matrix
+            matrix = self.reception_matrix(chart)
+            is_day = matrix.day_chart
+            reception_1_to_2 = matrix.dignities(planet1, planet2)
+            reception_2_to_1 = matrix.dignities(planet2, planet1)
+        else:
+            is_day = self.is_day_chart(chart)
+            reception_1_to_2 = self._check_all_dignities(planet1, chart.planets[planet2], is_day)
+            reception_2_to_1 = self._check_all_dignities(planet2, chart.planets[planet1], is_day)
 
         # Determine overall reception type
         reception_type, reception_details = self._classify_reception(
@@ -104,6 +244,29 @@ class TraditionalReceptionCalculator:
             ),
         }
 
+    def reception_matrix(self, chart: HoraryChart) -> ReceptionMatrix:
+        """The chart's :class:`ReceptionMatrix`, memoized per chart."""
+        return chart_context(chart).memo(
+            "reception_matrix", (), lambda: ReceptionMatrix.build(chart, self)
+        )
+
+    def is_day_chart(self, chart: HoraryChart) -> bool:
+        """Day/night for triplicity: Sun above the horizon (houses 7-12)."""
+        return self.is_day(chart.planets[Planet.SUN].longitude, chart.houses)
+
+    def is_day(self, sun_longitude: float, cusps: Sequence[float]) -> bool:
+        """:meth:`is_day_chart` from the Sun's longitude and the house cusps."""
+        sun_house = self._calculate_house_position(sun_longitude, cusps)
+        return sun_house in [7, 8, 9, 10, 11, 12]  # Sun below horizon = day chart
+
+    def term_ruler(self, position) -> Optional[Planet]:
+        """Egyptian term ruler at ``position`` (None if terms are not configured)."""
+        return dignity_table().term_ruler(position.longitude)
+
+    def face_ruler(self, position) -> Optional[Planet]:
+        """Face/decan ruler at ``position`` (None if faces are not configured)."""
+        return dignity_table().face_ruler(position.longitude)
+
     def _check_all_dignities(
         self, receiving_planet: Planet, received_position, is_day: bool
     ) -> List[str]:
@@ -127,36 +290,13 @@ class TraditionalReceptionCalculator:
         ):
             dignities.append("triplicity")
 
-        # Get position within sign for terms/faces
-        sign_degree = (
-            received_position.longitude - received_position.sign.start_degree
-        ) % 30
-
         # 4. Terms (Egyptian terms)
-        try:
-            terms_table = getattr(
-                cfg().reception.terms, received_position.sign.sign_name
-            )
-            for term in terms_table:
-                if term.start <= sign_degree < term.end:
-                    if Planet[term.ruler.upper()] == receiving_planet:
-                        dignities.append("term")
-                    break
-        except AttributeError:
-            pass
+        if self.term_ruler(received_position) == receiving_planet:
+            dignities.append("term")
 
         # 5. Faces/Decans
-        try:
-            faces_table = getattr(
-                cfg().reception.faces, received_position.sign.sign_name
-            )
-            for face in faces_table:
-                if face.start <= sign_degree < face.end:
-                    if Planet[face.ruler.upper()] == receiving_planet:
-                        dignities.append("face")
-                    break
-        except AttributeError:
-            pass
+        if self.face_ruler(received_position) == receiving_planet:
+            dignities.append("face")
 
         return dignities
 
@@ -0,0 +1,456 @@
+"""Pluggable cache for calculated charts and judgments, shareable across workers.
+
+The in-process chart cache (:mod:`.chart_cache`) is private to one worker, so
+several workers each miss separately and a restart starts cold. A
+:class:`ResultCache` stores values under canonical request keys in a backend
+chosen by the ``cache.shared`` configuration section:
+
+``memory``
+    An LRU dictionary inside the process (the default).
+``sqlite``
+    A SQLite database in WAL mode on local disk, shared by every worker on the
+    machine and surviving restarts. The ``HORARY_CACHE_PATH`` environment
+    variable selects a database file regardless of the ``backend`` setting.
+
+Values are pickled and zlib-compressed rather than stored as JSON text.
+Keys carry the configuration digest (see :func:`horary_config.config_digest`),
+which, unlike the configuration version, is the same in every process, and
+a digest of the field layout of every cached type (see
+:func:`register_cached_types`), so a deploy that changes a model never
+unpickles entries written with the old layout. Backend failures and entries
+that cannot be decoded are logged and treated as misses; the cache never
+fails a request. Pickles are only read back from stores this process family writes,
+so the database file must not be writable by untrusted users.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import hashlib
+import itertools
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import typing
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from horary_config import config_snapshot
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_CHART_TTL_SECONDS = 86400.0
+DEFAULT_JUDGMENT_TTL_SECONDS = 3600.0
+DEFAULT_SESSION_TTL_SECONDS = 7200.0  # outlives the judgments that hand out its chart ids
+
+# Part of every key; bump when the shape of cached values changes in a way
+# the dataclass layouts do not show (which namespace holds what, tuples, dicts)
+CACHE_FORMAT = 2
+
+# zlib level 1: most of the size reduction at a fraction of the CPU of level 6
+_COMPRESSION_LEVEL = 1
+
+
+def encode(value: Any) -> bytes:
+    """Compact binary form of ``value`` (pickle, then zlib)."""
+    return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), _COMPRESSION_LEVEL)
+
+
+def decode(data: bytes) -> Any:
+    return pickle.loads(zlib.decompress(data))
+
+
+def _referenced_types(hint: Any) -> Iterator[type]:
+    """Dataclasses and enums named anywhere in the type hint ``hint``."""
+    if isinstance(hint, type) and (dataclasses.is_dataclass(hint) or issubclass(hint, enum.Enum)):
+        yield hint
+    for argument in typing.get_args(hint):
+        yield from _referenced_types(argument)
+
+
+def layout_digest(types: Iterable[type]) -> str:
+    """Hash of the fields of ``types`` and of the dataclasses and enums they refer to.
+
+    Field names, order and annotations, and enum member names and values,
+    are what a pickle depends on; any change to them changes the digest.
+    """
+    layouts: Dict[str, Any] = {}
+    pending = list(types)
+    while pending:
+        cls = pending.pop()
+        name = f"{cls.__module__}.{cls.__qualname__}"
+        if name in layouts:
+            continue
+        if dataclasses.is_dataclass(cls):
+            try:
+                hints = typing.get_type_hints(cls)
+            except Exception:  # unresolvable forward reference: use the raw annotations
+                hints = {}
+            layouts[name] = [
+                (f.name, repr(hints.get(f.name, f.type))) for f in dataclasses.fields(cls)
+            ]
+            for hint in hints.values():
+                pending.extend(_referenced_types(hint))
+        else:
+            layouts[name] = [(member.name, repr(member.value)) for member in cls]
+    text = json.dumps(sorted(layouts.items()))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+# Types whose instances are cached, and the digest of their layout
+_cached_types: Set[type] = set()
+_layout: Optional[str] = None
+
+
+def register_cached_types(*types: type) -> None:
+    """Make the layout of ``types`` (see :func:`layout_digest`) part of every key.
+
+    Call once at import time for each dataclass stored in the cache; the
+    dataclasses and enums their fields name are covered automatically.
+    """
+    global _layout
+    _cached_types.update(types)
+    _layout = None
+
+
+def layout_version() -> str:
+    """Digest of the registered types' layout, computed on first use."""
+    global _layout
+    layout = _layout
+    if layout is None:
+        layout = _layout = layout_digest(_cached_types)
+    return layout
+
+
+def _expiry(ttl_seconds: float) -> float:
+    return time.time() + ttl_seconds if ttl_seconds > 0 else float("inf")
+
+
+class CacheBackend(ABC):
+    """Byte store behind :class:`ResultCache`.
+
+    ``shared`` is true for backends other processes can read, which makes it
+    worth copying charts there in addition to the in-process chart cache.
+    """
+
+    name = "none"
+    shared = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """LRU dictionary with per-entry expiry, private to the process."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max(int(max_entries), 0)
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            if not self.max_entries:
+                return
+            self._entries[key] = (_expiry(ttl_seconds), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "max_entries": self.max_entries}
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """SQLite table in WAL mode, shared by every process that opens the file.
+
+    Each thread (and each forked worker) gets its own connection. Expired
+    rows are dropped when read; every ``prune_interval`` writes the oldest
+    rows beyond ``max_entries`` are deleted along with any expired ones.
+    """
+
+    name = "sqlite"
+    shared = True
+    prune_interval = 64
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS cache ("
+        " key TEXT PRIMARY KEY,"
+        " value BLOB NOT NULL,"
+        " expires_at REAL NOT NULL,"
+        " stored_at REAL NOT NULL"
+        ") WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS cache_stored_at ON cache (stored_at)",
+    )
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.path = Path(path)
+        self.max_entries = max(int(max_entries), 0)
+        self._local = threading.local()
+        # next() on a count is atomic, so concurrent writers never share a number
+        self._writes = itertools.count(1)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in self._SCHEMA:
+                connection.execute(statement)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                connection.execute("DELETE FROM cache WHERE key = ? AND expires_at <= ?", (key, time.time()))
+                return None
+            return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Cache read failed ({self.path}): {e}")
+            return None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if not self.max_entries:
+            return
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, stored_at) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), _expiry(ttl_seconds), time.time()),
+            )
+            if next(self._writes) % self.prune_interval == 0:
+                self.prune()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache write failed ({self.path}): {e}")
+
+    def prune(self) -> None:
+        """Delete expired rows and the oldest rows beyond ``max_entries``."""
+        connection = self._connection()
+        connection.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        excess = connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0] - self.max_entries
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY stored_at LIMIT ?)",
+                (excess,),
+            )
+
+    def delete(self, key: str) -> None:
+        try:
+            self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Cache delete failed ({self.path}): {e}")
+
+    def clear(self) -> None:
+        try:
+            self._connection().execute("DELETE FROM cache")
+        except sqlite3.Error as e:
+            logger.warning(f"Cache clear failed ({self.path}): {e}")
+
+    def __len__(self) -> int:
+        try:
+            return self._connection().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "path": str(self.path), "max_entries": self.max_entries}
+
+
+class ResultCache:
+    """Encoded values in a :class:`CacheBackend`, with per-namespace hit counts.
+
+    Namespaces separate kinds of value (``"chart"``, ``"judgment"`` and
+    ``"session"``, the prepared charts behind ``chart_id``); each has its own
+    time-to-live.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: Optional[Dict[str, float]] = None) -> None:
+        self.backend = backend
+        self.ttl_seconds = dict(ttl_seconds or {})
+        self._lock = threading.Lock()
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+        self.stores: Dict[str, int] = defaultdict(int)
+        self.bytes_stored: Dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def _key(namespace: str, key: str) -> str:
+        return f"{CACHE_FORMAT}.{layout_version()}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        stored_key = self._key(namespace, key)
+        data = self.backend.get(stored_key)
+        value = None
+        if data is not None:
+            try:
+                value = decode(data)
+            except Exception as e:
+                logger.warning(f"Discarding undecodable {namespace} cache entry: {e}")
+                self.backend.delete(stored_key)
+        with self._lock:
+            (self.misses if value is None else self.hits)[namespace] += 1
+        return value
+
+    def contains(self, namespace: str, key: str) -> bool:
+        """Whether an entry is stored, without decoding it or counting a hit."""
+        return self.backend.get(self._key(namespace, key)) is not None
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        try:
+            data = encode(value)
+        except Exception as e:
+            logger.warning(f"Not caching unpicklable {namespace} value: {e}")
+            return
+        self.backend.set(self._key(namespace, key), data, self.ttl_seconds.get(namespace, 0.0))
+        with self._lock:
+            self.stores[namespace] += 1
+            self.bytes_stored[namespace] += len(data)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            namespaces = {}
+            for namespace in sorted(set(self.hits) | set(self.misses) | set(self.stores)):
+                hits, misses, stores = self.hits[namespace], self.misses[namespace], self.stores[namespace]
+                namespaces[namespace] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                    "stores": stores,
+                    "mean_entry_bytes": round(self.bytes_stored[namespace] / stores) if stores else 0,
+                }
+        return {**self.backend.describe(), "entries": len(self.backend), "namespaces": namespaces}
+
+
+def _settings() -> Tuple[str, Optional[Path], int, float, float, float]:
+    settings = getattr(getattr(config_snapshot().config, "cache", None), "shared", None)
+    backend = getattr(settings, "backend", "memory")
+    path = os.environ.get("HORARY_CACHE_PATH")
+    if path:
+        backend = "sqlite"
+    elif backend == "sqlite":
+        path = getattr(settings, "path", "data/cache.sqlite3")
+    resolved = None
+    if path:
+        resolved = Path(path)
+        if not resolved.is_absolute():
+            resolved = Path(__file__).resolve().parents[1] / resolved
+    return (
+        backend,
+        resolved,
+        getattr(settings, "max_entries", DEFAULT_MAX_ENTRIES),
+        getattr(settings, "chart_ttl_seconds", DEFAULT_CHART_TTL_SECONDS),
+        getattr(settings, "judgment_ttl_seconds", DEFAULT_JUDGMENT_TTL_SECONDS),
+        getattr(settings, "session_ttl_seconds", DEFAULT_SESSION_TTL_SECONDS),
+    )
+
+
+def _build(settings: Tuple[str, Optional[Path], int, float, float, float]) -> ResultCache:
+    backend_name, path, max_entries, chart_ttl, judgment_ttl, session_ttl = settings
+    backend: CacheBackend
+    if backend_name == "sqlite":
+        try:
+            backend = SQLiteCacheBackend(path, max_entries)
+            logger.info(f"Using shared SQLite result cache at {path}")
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Cannot open result cache {path}, using in-memory cache: {e}")
+            backend = MemoryCacheBackend(max_entries)
+    else:
+        if backend_name != "memory":
+            logger.warning(f"Unknown cache backend '{backend_name}', using memory")
+        backend = MemoryCacheBackend(max_entries)
+    return ResultCache(backend, {"chart": chart_ttl, "judgment": judgment_ttl, "session": session_ttl})
+
+
+# (config version, settings, cache) swapped as one reference
+_state: Optional[Tuple[int, Tuple, ResultCache]] = None
+_state_lock = threading.Lock()
+
+
+def result_cache() -> ResultCache:
+    """The process-wide result cache for the active configuration.
+
+    The backend is only rebuilt when a configuration change alters the
+    ``cache.shared`` settings, so hit counts survive unrelated reloads.
+    """
+    global _state
+    version = config_snapshot().version
+    state = _state
+    if state is not None and state[0] == version:
+        return state[2]
+    with _state_lock:
+        if _state is None or _state[0] != version:
+            settings = _settings()
+            if _state is not None and _state[1] == settings:
+                _state = (version, settings, _state[2])
+            else:
+                _state = (version, settings, _build(settings))
+        return _state[2]
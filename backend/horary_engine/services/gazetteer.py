@@ -0,0 +1,485 @@
+"""
+Offline gazetteer: place names, coordinates and timezone ids in one file.
+
+:func:`safe_geocode` asks the gazetteer before the geocode cache and
+Nominatim, so common places resolve in microseconds and installs without
+network access still work. The file is built by ``build_gazetteer.py`` from
+a GeoNames cities dump and opened with ``mmap`` in read-only mode, so every
+worker maps the same pages.
+
+Names are matched after :func:`normalize_name`: case-folded, accents and
+other combining marks removed, a few letters without decompositions folded
+(``ø`` to ``o``, ``ł`` to ``l`` ...), punctuation turned into spaces. A query
+such as ``"Zürich, Switzerland"`` looks up the first comma-separated part
+and keeps places whose admin area (by name or code, as in ``"Paris, TX"``),
+country name or country code match every other part; among those the most
+populous wins. Queries the gazetteer
+cannot answer exactly return ``None`` and go to the network.
+
+File layout (little-endian)::
+
+    header  : magic "HRYGAZ01", version u32, place count u32, key count u32,
+              zone count u32, places offset u64, keys offset u64,
+              zones offset u64, strings offset u64
+    places  : per place -> latitude f32, longitude f32, population u32,
+              display offset u32, display length u16, name length u16,
+              zone index u16, country code 2s, admin code 4s
+    keys    : per key -> string offset u32, string length u32, place u32,
+              sorted by key bytes, then by population (largest first)
+    zones   : timezone ids, UTF-8, newline separated
+    strings : UTF-8 keys and display names ("London, England, United Kingdom"),
+              each display name starting with the place name
+"""
+
+import heapq
+import logging
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from horary_config import cfg
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"HRYGAZ01"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIIIQQQQ")
+_PLACE = struct.Struct("<ffIIHHH2s4s")
+_KEY = struct.Struct("<III")
+_POPULATION = struct.Struct("<I")
+
+# Letters that NFKD leaves alone but users type without the diacritic
+_FOLD = str.maketrans({
+    "ø": "o", "æ": "ae", "œ": "oe", "ł": "l", "đ": "d", "ð": "d", "þ": "th", "ı": "i", "ħ": "h",
+})
+_NON_WORD = re.compile(r"[\W_]+")
+
+# Qualifiers people write for a country instead of its name or ISO code
+COUNTRY_ALIASES = {
+    "uk": "GB",
+    "u k": "GB",
+    "united kingdom": "GB",
+    "great britain": "GB",
+    "britain": "GB",
+    "usa": "US",
+    "us": "US",
+    "u s": "US",
+    "u s a": "US",
+    "united states": "US",
+    "united states of america": "US",
+    "america": "US",
+    "uae": "AE",
+}
+
+
+# Suggestions: prefixes naming more keys than this are answered from a table of
+# their most populous places built on first use; smaller ranges are scanned
+SUGGEST_SCAN_LIMIT = 96
+SUGGEST_TOP_PLACES = 32
+# Score bonus (in decades of population) for a name equal to the whole query
+EXACT_MATCH_BOOST = 2.0
+
+
+class GazetteerError(Exception):
+    """Raised when a gazetteer file is missing or malformed."""
+    pass
+
+
+def normalize_name(text: str) -> str:
+    """Case-, accent- and punctuation-insensitive form of a place name."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).translate(_FOLD)
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+class Place(NamedTuple):
+    """One gazetteer entry."""
+
+    name: str
+    display_name: str
+    latitude: float
+    longitude: float
+    timezone: str
+    country_code: str
+    population: int
+    admin_code: str = ""
+
+
+class GazetteerEntry(NamedTuple):
+    """Input record for :func:`write_gazetteer`.
+
+    ``names`` are every spelling the place should be found under; the first
+    is its display name.
+    """
+
+    names: Sequence[str]
+    latitude: float
+    longitude: float
+    population: int
+    timezone: str
+    country_code: str
+    admin_name: str = ""
+    admin_code: str = ""
+    country_name: str = ""
+
+
+class Gazetteer:
+    """Read-only, memory-mapped gazetteer with a sorted name index."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise GazetteerError(f"Cannot open gazetteer {self.path}: {e}")
+
+        try:
+            (magic, version, self.place_count, self.key_count, zone_count, self._places,
+             self._keys, zones, self._strings) = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error as e:
+            raise GazetteerError(f"Truncated gazetteer {self.path}: {e}")
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise GazetteerError(f"Unsupported gazetteer {self.path} (magic={magic!r}, version={version})")
+        if (self._places + self.place_count * _PLACE.size > self._keys
+                or self._keys + self.key_count * _KEY.size > zones
+                or self._strings > len(self._mmap)):
+            raise GazetteerError(f"Gazetteer {self.path} is truncated")
+
+        self.zones = bytes(self._mmap[zones:self._strings]).decode("utf-8").split("\n")
+        if len(self.zones) != zone_count:
+            raise GazetteerError(f"Gazetteer {self.path} has a corrupt zone table")
+
+        self._top: Optional[Dict[bytes, array]] = None
+        self._top_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.place_count
+
+    def _key(self, index: int) -> Tuple[bytes, int]:
+        offset, length, place = _KEY.unpack_from(self._mmap, self._keys + index * _KEY.size)
+        start = self._strings + offset
+        return self._mmap[start:start + length], place
+
+    def _lower_bound(self, key: bytes, lo: int = 0, hi: Optional[int] = None) -> int:
+        hi = self.key_count if hi is None else hi
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _population(self, index: int) -> int:
+        return _POPULATION.unpack_from(self._mmap, self._places + index * _PLACE.size + 8)[0]
+
+    def _region(self, index: int) -> bytes:
+        """Country code, admin code and display name after the place name."""
+        offset = self._places + index * _PLACE.size
+        _lat, _lon, _population, start, length, name_length, _zone, country, admin = _PLACE.unpack_from(
+            self._mmap, offset
+        )
+        start += self._strings
+        return country + admin + self._mmap[start + name_length:start + length]
+
+    def place(self, index: int) -> Place:
+        lat, lon, population, offset, length, name_length, zone, country, admin = _PLACE.unpack_from(
+            self._mmap, self._places + index * _PLACE.size
+        )
+        start = self._strings + offset
+        display = self._mmap[start:start + length]
+        return Place(
+            name=display[:name_length].decode("utf-8"),
+            display_name=display.decode("utf-8"),
+            # float32 storage: five decimals (~1 m) is all it carries
+            latitude=round(lat, 5),
+            longitude=round(lon, 5),
+            timezone=self.zones[zone],
+            country_code=country.decode("ascii"),
+            population=population,
+            admin_code=admin.rstrip(b"\0").decode("ascii"),
+        )
+
+    def matches(self, name: str) -> List[int]:
+        """Indexes of places named ``name`` exactly (after normalization), most populous first."""
+        key = normalize_name(name).encode("utf-8")
+        if not key:
+            return []
+        found = []
+        index = self._lower_bound(key)
+        while index < self.key_count:
+            candidate, place = self._key(index)
+            if candidate != key:
+                break
+            if place not in found:
+                found.append(place)
+            index += 1
+        return found
+
+    def prefix_matches(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        """Up to ``limit`` ``(key, place index)`` pairs whose key starts with ``prefix``, in key order."""
+        key = normalize_name(prefix).encode("utf-8")
+        if not key or limit <= 0:
+            return []
+        found = []
+        index = self._lower_bound(key)
+        while index < self.key_count and len(found) < limit:
+            candidate, place = self._key(index)
+            if not candidate.startswith(key):
+                break
+            found.append((candidate.decode("utf-8"), place))
+            index += 1
+        return found
+
+    def lookup(self, query: str) -> Optional[Place]:
+        """The place a free-text query names, or ``None`` when it is not certain.
+
+        ``"Paris"`` gives the most populous Paris; ``"Paris, Texas"`` or
+        ``"Paris, US"`` the most populous one whose admin area or country
+        matches every qualifier.
+        """
+        parts = [normalize_name(part) for part in query.split(",")]
+        parts = [part for part in parts if part]
+        if not parts:
+            return None
+        name, qualifiers = parts[0], parts[1:]
+        for index in self.matches(name):
+            place = self.place(index)
+            if all(_qualifies(place, qualifier) for qualifier in qualifiers):
+                return place
+        return None
+
+    def suggest(self, query: str, limit: int = 10) -> List[Place]:
+        """Places whose name starts with ``query``, best first.
+
+        Places are ranked by population (log scale), with a boost for names
+        equal to the whole query, so "Paris" lists Paris, France, before
+        Parisot. Text after a comma narrows the results to places whose
+        admin area or country starts with it, as in ``"Paris, Te"``. When a
+        common prefix has fewer than ``limit`` qualifying places among its
+        most populous ones, the rest come from the index in key order.
+        """
+        parts = [normalize_name(part) for part in query.split(",")]
+        name, qualifiers = parts[0], [part for part in parts[1:] if part]
+        key = name.encode("utf-8")
+        if not key or limit <= 0:
+            return []
+
+        # The qualifier test depends only on a place's region, and many share one
+        regions: Dict[bytes, bool] = {}
+
+        def qualified(index: int) -> bool:
+            if not qualifiers:
+                return True
+            region = self._region(index)
+            if region not in regions:
+                place = self.place(index)
+                regions[region] = all(_qualifies(place, qualifier, prefix=True) for qualifier in qualifiers)
+            return regions[region]
+
+        lo = self._lower_bound(key)
+        hi = self._lower_bound(key + b"\xff")
+        scores: Dict[int, float] = {}
+        wide = hi - lo > SUGGEST_SCAN_LIMIT
+        if wide:
+            for index in self._top_places().get(key, ()):
+                if qualified(index):
+                    scores[index] = math.log10(self._population(index) + 1)
+            for index in self.matches(name):
+                if qualified(index):
+                    scores[index] = math.log10(self._population(index) + 1) + EXACT_MATCH_BOOST
+        # A wide prefix is only scanned to find places the qualifiers allow
+        if not wide or (qualifiers and len(scores) < limit):
+            for position in range(lo, hi):
+                candidate, index = self._key(position)
+                if not qualified(index):
+                    continue
+                score = math.log10(self._population(index) + 1)
+                if candidate == key:
+                    score += EXACT_MATCH_BOOST
+                scores[index] = max(score, scores.get(index, score))
+                if wide and len(scores) >= limit:
+                    break
+
+        # Only the best few become Place records; equal scores go by display name
+        ranked = []
+        for index in sorted(scores, key=scores.__getitem__, reverse=True):
+            score = scores[index]
+            if len(ranked) >= limit and -score > ranked[limit - 1][0]:
+                break
+            place = self.place(index)
+            ranked.append((-score, place.display_name, place))
+            ranked.sort(key=lambda item: item[:2])
+        return [place for _score, _display, place in ranked[:limit]]
+
+    def _top_places(self) -> Dict[bytes, array]:
+        """Most populous places for every prefix covering over ``SUGGEST_SCAN_LIMIT`` keys."""
+        if self._top is None:
+            with self._top_lock:
+                if self._top is None:
+                    self._top = self._build_top_places()
+        return self._top
+
+    def _build_top_places(self) -> Dict[bytes, array]:
+        top: Dict[bytes, array] = {}
+        if self.key_count > SUGGEST_SCAN_LIMIT:
+            self._collect_top_places(b"", 0, self.key_count, top)
+        logger.info(f"Built gazetteer suggestion table ({len(top)} prefixes)")
+        return top
+
+    def _collect_top_places(self, prefix: bytes, start: int, end: int,
+                            top: Dict[bytes, array]) -> List[int]:
+        """Most populous places among keys ``start:end`` (all starting with ``prefix``).
+
+        Each longer prefix that still covers more than ``SUGGEST_SCAN_LIMIT``
+        keys is recorded in ``top`` on the way; the rest are read once, so
+        the whole table costs one pass over the index.
+        """
+        candidates = set()
+        position = start
+        while position < end and self._key(position)[0] == prefix:
+            candidates.add(self._key(position)[1])
+            position += 1
+        while position < end:
+            child = bytes(self._key(position)[0][:len(prefix) + 1])
+            child_end = self._lower_bound(child + b"\xff", position, end)
+            if child_end - position > SUGGEST_SCAN_LIMIT:
+                candidates.update(self._collect_top_places(child, position, child_end, top))
+            else:
+                candidates.update(self._key(index)[1] for index in range(position, child_end))
+            position = child_end
+        best = heapq.nlargest(SUGGEST_TOP_PLACES, candidates, key=self._population)
+        if prefix:
+            top[prefix] = array("I", best)
+        return best
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def _qualifies(place: Place, qualifier: str, prefix: bool = False) -> bool:
+    """Whether ``qualifier`` names the place's admin area or country.
+
+    With ``prefix`` a qualifier that is the start of a name also counts.
+    """
+    country = place.country_code
+    if qualifier == country.lower() or COUNTRY_ALIASES.get(qualifier) == country:
+        return True
+    if place.admin_code and qualifier == place.admin_code.lower():
+        return True
+    components = [normalize_name(component) for component in place.display_name.split(", ")[1:]]
+    if prefix:
+        return any(component.startswith(qualifier) for component in components)
+    return qualifier in components
+
+
+def write_gazetteer(path: Union[str, Path], entries: Iterable[GazetteerEntry]) -> int:
+    """Write ``entries`` to a gazetteer file and return the number of places."""
+    entries = list(entries)
+    zones = sorted({entry.timezone for entry in entries})
+    zone_index = {zone: i for i, zone in enumerate(zones)}
+    if len(zones) > 0xFFFF:
+        raise GazetteerError("Too many distinct timezones for the gazetteer format")
+
+    strings = bytearray()
+    string_offsets = {}
+
+    def intern(data: bytes) -> int:
+        offset = string_offsets.get(data)
+        if offset is None:
+            offset = string_offsets[data] = len(strings)
+            strings.extend(data)
+        return offset
+
+    places = bytearray()
+    keys = []
+    for index, entry in enumerate(entries):
+        name = entry.names[0]
+        display = ", ".join(part for part in (name, entry.admin_name, entry.country_name) if part)
+        display_bytes = display.encode("utf-8")
+        places.extend(_PLACE.pack(
+            entry.latitude, entry.longitude, min(max(int(entry.population), 0), 0xFFFFFFFF),
+            intern(display_bytes), len(display_bytes), len(name.encode("utf-8")),
+            zone_index[entry.timezone], entry.country_code.upper().encode("ascii")[:2].ljust(2),
+            entry.admin_code.upper().encode("ascii", "ignore")[:4],
+        ))
+        for key in {normalize_name(alias) for alias in entry.names}:
+            if key:
+                keys.append((key.encode("utf-8"), -int(entry.population), index))
+
+    keys.sort()
+    key_table = bytearray()
+    for key, _population, index in keys:
+        key_table.extend(_KEY.pack(intern(key), len(key), index))
+
+    zone_bytes = "\n".join(zones).encode("utf-8")
+    places_offset = _HEADER.size
+    keys_offset = places_offset + len(places)
+    zones_offset = keys_offset + len(key_table)
+    strings_offset = zones_offset + len(zone_bytes)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(entries), len(keys), len(zones),
+                             places_offset, keys_offset, zones_offset, strings_offset))
+        f.write(places)
+        f.write(key_table)
+        f.write(zone_bytes)
+        f.write(strings)
+    return len(entries)
+
+
+def _configured_path() -> Optional[Path]:
+    env_path = os.environ.get("HORARY_GAZETTEER")
+    if env_path:
+        return Path(env_path)
+    value = getattr(getattr(cfg(), "geocoding", None), "gazetteer_path", None)
+    if not value:
+        return None
+    path = Path(value)
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parents[2] / path
+    return path
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_resolved = False
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """Return the configured gazetteer, opening it on first use."""
+    global _gazetteer, _gazetteer_resolved
+    if _gazetteer_resolved:
+        return _gazetteer
+    with _gazetteer_lock:
+        if not _gazetteer_resolved:
+            path = _configured_path()
+            if path is not None and path.exists():
+                try:
+                    _gazetteer = Gazetteer(path)
+                    logger.info(f"Loaded gazetteer {path} ({len(_gazetteer)} places)")
+                    # Build the suggestion table off the request path
+                    threading.Thread(target=_gazetteer._top_places, name="gazetteer-suggest",
+                                     daemon=True).start()
+                except GazetteerError as e:
+                    logger.warning(f"{e} - locations will be geocoded online")
+            _gazetteer_resolved = True
+    return _gazetteer
+
+
+def set_gazetteer(gazetteer: Optional[Gazetteer]) -> None:
+    """Install ``gazetteer`` (``None`` geocodes every location online)."""
+    global _gazetteer, _gazetteer_resolved
+    with _gazetteer_lock:
+        _gazetteer = gazetteer
+        _gazetteer_resolved = True
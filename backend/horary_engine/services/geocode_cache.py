@@ -0,0 +1,195 @@
+"""Persistent cache of geocoding results in front of :func:`safe_geocode`.
+
+Every judgment and every ``/api/get-timezone`` call geocodes its location,
+and a Nominatim round trip dominates their latency even for the same few
+places. :class:`GeocodeCache` keeps results keyed by the normalized
+location string (Unicode NFKC, case-folded, whitespace collapsed), with:
+
+* a time-to-live for found locations (``ttl_seconds``);
+* negative entries for "location not found" answers with their own, shorter
+  time-to-live (``negative_ttl_seconds``), so repeated typos do not each cost
+  a lookup. Service failures and timeouts are never cached;
+* a size limit (``max_entries``), the oldest entries going first.
+
+Settings come from the ``cache.geocode`` configuration section. The default
+backend is a SQLite file (see :class:`~horary_engine.result_cache.SQLiteCacheBackend`)
+shared by every worker and surviving restarts; ``HORARY_GEOCODE_CACHE_PATH``
+selects the file. Entries are small JSON documents rather than pickles.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from horary_config import config_snapshot
+
+from ..result_cache import CacheBackend, MemoryCacheBackend, SQLiteCacheBackend
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50000
+DEFAULT_TTL_SECONDS = 30 * 86400.0
+DEFAULT_NEGATIVE_TTL_SECONDS = 3600.0
+
+# Part of every key; bump when the stored document changes shape
+GEOCODE_FORMAT = 1
+
+_WHITESPACE = re.compile(r"\s+")
+_COMMA = re.compile(r"\s*,\s*")
+
+
+def normalize_location(location: str) -> str:
+    """Canonical form of a free-text location used as the cache key."""
+    text = unicodedata.normalize("NFKC", location).casefold()
+    text = _COMMA.sub(", ", _WHITESPACE.sub(" ", text))
+    return text.strip(" ,")
+
+
+class CachedGeocode(NamedTuple):
+    """A cached answer: coordinates and address, or ``found=False``."""
+
+    found: bool
+    latitude: float = 0.0
+    longitude: float = 0.0
+    address: str = ""
+
+    @property
+    def coordinates(self) -> Tuple[float, float, str]:
+        return (self.latitude, self.longitude, self.address)
+
+
+class GeocodeCache:
+    """Geocoding answers in a :class:`CacheBackend`, with hit counts."""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS) -> None:
+        self.backend = backend
+        self.ttl_seconds = float(ttl_seconds)
+        self.negative_ttl_seconds = float(negative_ttl_seconds)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @staticmethod
+    def key(location: str) -> str:
+        return f"{GEOCODE_FORMAT}:{normalize_location(location)}"
+
+    def get(self, location: str) -> Optional[CachedGeocode]:
+        data = self.backend.get(self.key(location))
+        entry = None
+        if data is not None:
+            try:
+                entry = CachedGeocode(**json.loads(data))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Discarding unreadable geocode cache entry: {e}")
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            elif entry.found:
+                self.hits += 1
+            else:
+                self.negative_hits += 1
+        return entry
+
+    def put(self, location: str, latitude: float, longitude: float, address: str) -> None:
+        self._store(location, CachedGeocode(True, latitude, longitude, address), self.ttl_seconds)
+
+    def put_not_found(self, location: str) -> None:
+        if self.negative_ttl_seconds > 0:
+            self._store(location, CachedGeocode(False), self.negative_ttl_seconds)
+
+    def _store(self, location: str, entry: CachedGeocode, ttl_seconds: float) -> None:
+        data = json.dumps(entry._asdict(), separators=(",", ":")).encode("utf-8")
+        self.backend.set(self.key(location), data, ttl_seconds)
+        with self._lock:
+            self.stores += 1
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                **self.backend.describe(),
+                "entries": len(self.backend),
+                "ttl_seconds": self.ttl_seconds,
+                "negative_ttl_seconds": self.negative_ttl_seconds,
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_ratio": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+
+def _settings() -> Tuple[str, Optional[Path], int, float, float]:
+    settings = getattr(getattr(config_snapshot().config, "cache", None), "geocode", None)
+    backend = getattr(settings, "backend", "sqlite")
+    path = os.environ.get("HORARY_GEOCODE_CACHE_PATH")
+    if path:
+        backend = "sqlite"
+    elif backend == "sqlite":
+        path = getattr(settings, "path", "data/geocode.sqlite3")
+    resolved = None
+    if path:
+        resolved = Path(path)
+        if not resolved.is_absolute():
+            resolved = Path(__file__).resolve().parents[2] / resolved
+    return (
+        backend,
+        resolved,
+        getattr(settings, "max_entries", DEFAULT_MAX_ENTRIES),
+        getattr(settings, "ttl_seconds", DEFAULT_TTL_SECONDS),
+        getattr(settings, "negative_ttl_seconds", DEFAULT_NEGATIVE_TTL_SECONDS),
+    )
+
+
+def _build(settings: Tuple[str, Optional[Path], int, float, float]) -> GeocodeCache:
+    backend_name, path, max_entries, ttl, negative_ttl = settings
+    backend: CacheBackend
+    if backend_name == "sqlite":
+        try:
+            backend = SQLiteCacheBackend(path, max_entries)
+            logger.info(f"Using SQLite geocode cache at {path}")
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Cannot open geocode cache {path}, using in-memory cache: {e}")
+            backend = MemoryCacheBackend(max_entries)
+    else:
+        if backend_name != "memory":
+            logger.warning(f"Unknown geocode cache backend '{backend_name}', using memory")
+        backend = MemoryCacheBackend(max_entries)
+    return GeocodeCache(backend, ttl, negative_ttl)
+
+
+# (config version, settings, cache) swapped as one reference
+_state: Optional[Tuple[int, Tuple, GeocodeCache]] = None
+_state_lock = threading.Lock()
+
+
+def geocode_cache() -> GeocodeCache:
+    """The process-wide geocode cache for the active configuration."""
+    global _state
+    version = config_snapshot().version
+    state = _state
+    if state is not None and state[0] == version:
+        return state[2]
+    with _state_lock:
+        if _state is None or _state[0] != version:
+            settings = _settings()
+            if _state is not None and _state[1] == settings:
+                _state = (version, settings, _state[2])
+            else:
+                _state = (version, settings, _build(settings))
+        return _state[2]
@@ -3,20 +3,14 @@ from typing import Optional, Tuple
 
 import datetime
 import pytz
-try:
-    from zoneinfo import ZoneInfo
-except ImportError:  # pragma: no cover - Python <3.9
-    ZoneInfo = None
+from zoneinfo import ZoneInfo
 
-try:
-    from timezonefinder import TimezoneFinder
-    TIMEZONEFINDER_AVAILABLE = True
-except ImportError:  # pragma: no cover
-    TimezoneFinder = None
-    TIMEZONEFINDER_AVAILABLE = False
+from geopy.exc import GeocoderRateLimited, GeocoderTimedOut, GeocoderUnavailable
 
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
+from .gazetteer import get_gazetteer
+from .geocode_cache import geocode_cache
+from .nominatim import nominatim_geocoder
+from .timezone_resolver import timezone_resolver
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +24,11 @@ class LocationError(Exception):
 def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float, str]:
     """Geocode a location string with fail-fast behaviour.
 
+    The offline gazetteer (see :mod:`.gazetteer`) is asked first. Other
+    answers, including "not found", are served from the geocode cache when
+    possible (see :mod:`.geocode_cache`); only misses reach Nominatim, through
+    its rate limiter (see :mod:`.nominatim`).
+
     Args:
         location_string: Location to geocode.
         timeout: Timeout in seconds.
@@ -40,14 +39,28 @@ def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float,
     Raises:
         LocationError: If geocoding fails or the library is unavailable.
     """
+    gazetteer = get_gazetteer()
+    if gazetteer is not None:
+        place = gazetteer.lookup(location_string)
+        if place is not None:
+            return (place.latitude, place.longitude, place.display_name)
+
+    cache = geocode_cache()
+    cached = cache.get(location_string)
+    if cached is not None:
+        if not cached.found:
+            raise LocationError(_not_found_message(location_string))
+        return cached.coordinates
+
     try:
-        geolocator = Nominatim(user_agent="horary_astrology_precise")
-        location = geolocator.geocode(location_string, timeout=timeout)
+        location = nominatim_geocoder().geocode(location_string, timeout)
         if location is None:
-            raise LocationError(
-                f"Location not found: '{location_string}'. Please provide a more specific location."
-            )
-        return (location.latitude, location.longitude, location.address)
+            cache.put_not_found(location_string)
+            raise LocationError(_not_found_message(location_string))
+    except LocationError:
+        raise
+    except GeocoderRateLimited as e:
+        raise LocationError(f"Geocoding service busy: {e}")
     except (GeocoderTimedOut, GeocoderUnavailable) as e:
         raise LocationError(f"Geocoding service unavailable: {e}")
     except ImportError:
@@ -55,39 +68,30 @@ def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float,
     except Exception as e:  # pragma: no cover - unexpected errors
         raise LocationError(f"Geocoding failed for '{location_string}': {e}")
 
+    cache.put(location_string, location.latitude, location.longitude, location.address)
+    return (location.latitude, location.longitude, location.address)
 
-class TimezoneManager:
-    """Handles timezone operations for horary calculations."""
 
-    def __init__(self) -> None:
-        if TIMEZONEFINDER_AVAILABLE:
-            try:
-                self.tf = TimezoneFinder()
-                logger.info("TimezoneFinder initialized successfully")
-            except Exception as e:  # pragma: no cover - initialization failure
-                logger.error(f"Failed to initialize TimezoneFinder: {e}")
-                self.tf = None
-        else:  # pragma: no cover - library missing
-            logger.warning(
-                "TimezoneFinder library not available - using fallback timezone detection only"
-            )
-            self.tf = None
+def _not_found_message(location_string: str) -> str:
+    return f"Location not found: '{location_string}'. Please provide a more specific location."
 
-        try:
-            self.geolocator = Nominatim(user_agent="horary_astrology_tz")
-            logger.info("Geolocator initialized successfully")
-        except Exception as e:  # pragma: no cover - geolocator failure
-            logger.error(f"Failed to initialize Geolocator: {e}")
-            self.geolocator = None
+
+class TimezoneManager:
+    """Handles timezone operations for horary calculations.
+
+    Cheap to create: coordinates are resolved and validated offline by the
+    process-wide :func:`timezone_resolver`.
+    """
 
     def get_timezone_for_location(self, lat: float, lon: float) -> Optional[str]:
         """Get timezone string for given coordinates with enhanced debugging."""
         logger.info(f"=== TIMEZONE DETECTION STARTED for {lat}, {lon} ===")
 
         try:
-            if self.tf is not None:
+            resolver = timezone_resolver()
+            if resolver.available:
                 logger.info("Using TimezoneFinder library")
-                timezone_result = self.tf.timezone_at(lat=lat, lng=lon)
+                timezone_result = resolver.timezone_at(lat, lon)
                 logger.info(f"TimezoneFinder raw result: {timezone_result}")
 
                 if timezone_result:
@@ -130,84 +134,35 @@ class TimezoneManager:
     def _validate_timezone_for_coordinates(
         self, timezone_str: str, lat: float, lon: float
     ) -> Optional[str]:
-        """Validate that timezone makes geographic sense for coordinates."""
+        """Validate that the timezone's shapes contain the coordinates.
+
+        Runs locally on TimezoneFinder's polygons (see
+        :meth:`TimezoneResolver.contains`); a zone that does not contain the
+        point is replaced by the one that does.
+        """
 
         logger.info(
             f"TIMEZONE VALIDATION: Checking {timezone_str} for coordinates {lat}, {lon}"
         )
 
-        geographic_validations = {
-            (29.5, 33.5, 34.0, 36.0): "Asia/Jerusalem",
-        }
-
-        for (lat_min, lat_max, lon_min, lon_max), expected_tz in geographic_validations.items():
-            if lat_min <= lat <= lat_max and lon_min <= lon <= lon_max:
-                logger.info(
-                    f"COORDINATE MATCH: {lat},{lon} falls in range {lat_min}-{lat_max}, {lon_min}-{lon_max}"
-                )
-                if timezone_str != expected_tz:
-                    logger.warning(
-                        f"TIMEZONE OVERRIDE: TimezoneFinder returned {timezone_str} for {lat},{lon} but expected {expected_tz} - CORRECTING"
-                    )
-                    return expected_tz
-                else:
-                    logger.info(
-                        f"TIMEZONE OK: {timezone_str} is correct for coordinates {lat},{lon}"
-                    )
-                    return timezone_str
-
-        suspicious_combinations = [
-            (29.5, 33.5, 34.0, 36.0, ["America/"])
-        ]
-
-        for (
-            lat_min,
-            lat_max,
-            lon_min,
-            lon_max,
-            forbidden_prefixes,
-        ) in suspicious_combinations:
-            if lat_min <= lat <= lat_max and lon_min <= lon <= lon_max:
-                if any(timezone_str.startswith(prefix) for prefix in forbidden_prefixes):
-                    logger.warning(
-                        f"TIMEZONE OVERRIDE: Suspicious combination {lat},{lon} with timezone {timezone_str}"
-                    )
-                    return geographic_validations.get(
-                        (29.5, 33.5, 34.0, 36.0), timezone_str
-                    )
+        resolver = timezone_resolver()
+        if resolver.contains(timezone_str, lat, lon) is not False:
+            return timezone_str
 
+        expected_tz = resolver.certain_timezone_at(lat, lon)
+        if expected_tz and expected_tz != timezone_str:
+            logger.warning(
+                f"TIMEZONE OVERRIDE: TimezoneFinder returned {timezone_str} for {lat},{lon} but the point lies in {expected_tz} - CORRECTING"
+            )
+            return expected_tz
         return timezone_str
 
     def _get_fallback_timezone(self, lat: float, lon: float) -> Optional[str]:
         """Fallback method to get timezone if TimezoneFinder fails."""
-        if self.geolocator is None:
-            return None
-
         try:
-            location = self.geolocator.reverse((lat, lon), exactly_one=True)
-            if location and location.raw.get("address"):
-                address = location.raw["address"]
-                if "country_code" in address:
-                    country_code = address["country_code"].upper()
-                    country = pytz.country_names.get(country_code)
-                    if country:
-                        timezones = pytz.country_timezones.get(country_code)
-                        if timezones:
-                            logger.info(
-                                f"Using country-level timezone fallback {timezones[0]} for {lat}, {lon}"
-                            )
-                            return timezones[0]
-        except (GeocoderTimedOut, GeocoderUnavailable):
-            logger.warning("Geolocator reverse lookup timed out")
+            return timezone_resolver().timezone_at(lat, lon)
         except Exception as e:  # pragma: no cover - unexpected errors
             logger.error(f"Fallback timezone detection failed: {e}")
-
-        try:
-            from timezonefinder import TimezoneFinderL
-
-            tf = TimezoneFinder()
-            return tf.timezone_at(lat=lat, lng=lon)
-        except Exception:
             return None
 
     def parse_datetime_with_timezone(
@@ -251,10 +206,7 @@ class TimezoneManager:
 
         if timezone_str:
             try:
-                if ZoneInfo:
-                    tz = ZoneInfo(timezone_str)
-                else:
-                    tz = pytz.timezone(timezone_str)
+                tz = ZoneInfo(timezone_str)
                 timezone_used = timezone_str
             except Exception:
                 tz = pytz.UTC
@@ -263,10 +215,7 @@ class TimezoneManager:
             tz_str = self.get_timezone_for_location(lat, lon)
             if tz_str:
                 try:
-                    if ZoneInfo:
-                        tz = ZoneInfo(tz_str)
-                    else:
-                        tz = pytz.timezone(tz_str)
+                    tz = ZoneInfo(tz_str)
                     timezone_used = tz_str
                 except Exception:
                     tz = pytz.UTC
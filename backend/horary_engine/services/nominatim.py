@@ -0,0 +1,242 @@
+"""Rate-limited, coalescing access to the Nominatim geocoding service.
+
+Nominatim's usage policy allows about one request per second per client.
+Bursts used to go straight through, get throttled, and surface as
+``LOCATION_ERROR`` verdicts. Every geocoding request now goes through one
+:class:`CoalescingGeocoder` per process:
+
+* a :class:`TokenBucket` spaces upstream calls ``1 / requests_per_second``
+  apart (allowing ``burst`` back to back) and makes callers queue for their
+  slot, first come first served;
+* the queue is bounded: a caller who would be more than ``max_queue`` slots
+  or ``max_wait_seconds`` away is refused at once with
+  :class:`geopy.exc.GeocoderRateLimited` instead of waiting;
+* concurrent requests for the same location (after
+  :func:`~.geocode_cache.normalize_location`) share one upstream call, and its
+  answer or error goes to every caller;
+* a throttling answer from the server (HTTP 429) holds the bucket for the
+  ``Retry-After`` it gives, and the call queues once more for a later slot.
+
+Settings come from the ``geocoding.nominatim`` configuration section. The
+service URL can be pointed at a local stand-in server (``url``, or the
+``HORARY_NOMINATIM_URL`` environment variable) for tests.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from geopy.exc import GeocoderRateLimited, GeocoderTimedOut
+from geopy.geocoders import Nominatim
+
+from horary_config import config_snapshot
+
+from .geocode_cache import normalize_location
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_URL = "https://nominatim.openstreetmap.org"
+DEFAULT_USER_AGENT = "horary_astrology_precise"
+DEFAULT_REQUESTS_PER_SECOND = 1.0
+DEFAULT_BURST = 1
+DEFAULT_MAX_QUEUE = 30
+DEFAULT_MAX_WAIT_SECONDS = 15.0
+
+
+class TokenBucket:
+    """First-come-first-served token bucket handing out start times.
+
+    :meth:`reserve` books the caller's slot and returns how long to wait for
+    it; callers who would wait too long are refused without booking.
+    """
+
+    def __init__(self, rate: float, burst: int = DEFAULT_BURST,
+                 max_queue: int = DEFAULT_MAX_QUEUE,
+                 max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = max(float(rate), 1e-6)
+        self.interval = 1.0 / self.rate
+        self.burst = max(int(burst), 1)
+        self.max_queue = max(int(max_queue), 0)
+        self.max_wait_seconds = float(max_wait_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # When the next token is free; earlier than now while tokens are saved up
+        self._next = clock() - (self.burst - 1) * self.interval
+
+    def reserve(self, max_wait_seconds: Optional[float] = None) -> float:
+        """Seconds until the caller may start; raises when the queue is full."""
+        limit = self.max_wait_seconds if max_wait_seconds is None else max_wait_seconds
+        with self._lock:
+            now = self._clock()
+            start = max(self._next, now - (self.burst - 1) * self.interval)
+            wait = max(start - now, 0.0)
+            if wait > 0 and (wait > limit or wait * self.rate > self.max_queue):
+                raise GeocoderRateLimited(
+                    "Geocoding service is busy, please retry in a few seconds",
+                    retry_after=int(wait) + 1,
+                )
+            self._next = start + self.interval
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next ``seconds`` (the server asked us to back off)."""
+        with self._lock:
+            self._next = max(self._next, self._clock() + seconds)
+
+    def queued(self) -> int:
+        """Callers waiting for a slot (the next free slot is not anyone's yet)."""
+        with self._lock:
+            ahead = self._next - self._clock()
+            return max(math.ceil(ahead * self.rate) - 1, 0)
+
+
+class CoalescingGeocoder:
+    """Geocoding through a :class:`TokenBucket`, one upstream call per location at a time.
+
+    ``geocode`` is the upstream call, ``geocode(location, timeout)``, which
+    returns a geopy ``Location`` or ``None``.
+    """
+
+    def __init__(self, geocode: Callable[[str, float], Any], bucket: TokenBucket,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        self._geocode = geocode
+        self.bucket = bucket
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.upstream_calls = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def geocode(self, location: str, timeout: float = 10,
+                max_wait_seconds: Optional[float] = None) -> Any:
+        """Geocode ``location``, waiting for a slot or for an identical call in flight.
+
+        Raises :class:`GeocoderRateLimited` when the wait queue is full, and
+        whatever the upstream call raised.
+        """
+        key = normalize_location(location)
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            limit = self.bucket.max_wait_seconds if max_wait_seconds is None else max_wait_seconds
+            try:
+                return future.result(timeout=limit + timeout)
+            except FutureTimeoutError:
+                raise GeocoderTimedOut(f"Timed out waiting for the geocoding of '{location}'")
+
+        try:
+            future.set_result(self._call(location, timeout, max_wait_seconds))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result()
+
+    def _call(self, location: str, timeout: float, max_wait_seconds: Optional[float]) -> Any:
+        for attempt in range(2):
+            try:
+                wait = self.bucket.reserve(max_wait_seconds)
+            except GeocoderRateLimited:
+                with self._lock:
+                    self.rejected += 1
+                logger.warning(f"Geocoding queue full, refusing '{location}'")
+                raise
+            if wait > 0:
+                with self._lock:
+                    self.wait_seconds += wait
+                self._sleep(wait)
+            with self._lock:
+                self.upstream_calls += 1
+            try:
+                return self._geocode(location, timeout)
+            except GeocoderRateLimited as e:
+                with self._lock:
+                    self.throttled += 1
+                self.bucket.pause(float(e.retry_after or self.bucket.interval))
+                if attempt:
+                    raise
+                logger.warning(f"Geocoding service throttled '{location}', retrying")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests_per_second": self.bucket.rate,
+                "burst": self.bucket.burst,
+                "max_queue": self.bucket.max_queue,
+                "queued": self.bucket.queued(),
+                "in_flight": len(self._in_flight),
+                "upstream_calls": self.upstream_calls,
+                "coalesced": self.coalesced,
+                "rejected": self.rejected,
+                "throttled": self.throttled,
+                "wait_seconds": round(self.wait_seconds, 3),
+            }
+
+
+def nominatim_client(url: str = DEFAULT_URL, user_agent: str = DEFAULT_USER_AGENT) -> Nominatim:
+    """A geopy Nominatim client for the service at ``url``."""
+    parts = urlsplit(url if "//" in url else f"https://{url}")
+    domain = parts.netloc + parts.path.rstrip("/")
+    return Nominatim(user_agent=user_agent, domain=domain, scheme=parts.scheme or "https")
+
+
+def _settings() -> Tuple[str, str, float, int, int, float]:
+    settings = getattr(getattr(config_snapshot().config, "geocoding", None), "nominatim", None)
+    return (
+        os.environ.get("HORARY_NOMINATIM_URL") or getattr(settings, "url", DEFAULT_URL),
+        getattr(settings, "user_agent", DEFAULT_USER_AGENT),
+        float(getattr(settings, "requests_per_second", DEFAULT_REQUESTS_PER_SECOND)),
+        int(getattr(settings, "burst", DEFAULT_BURST)),
+        int(getattr(settings, "max_queue", DEFAULT_MAX_QUEUE)),
+        float(getattr(settings, "max_wait_seconds", DEFAULT_MAX_WAIT_SECONDS)),
+    )
+
+
+def _build(settings: Tuple[str, str, float, int, int, float]) -> CoalescingGeocoder:
+    url, user_agent, rate, burst, max_queue, max_wait = settings
+    client = nominatim_client(url, user_agent)
+    logger.info(f"Geocoding through {url} at {rate:g} requests/s")
+    return CoalescingGeocoder(
+        lambda location, timeout: client.geocode(location, timeout=timeout),
+        TokenBucket(rate, burst, max_queue, max_wait),
+    )
+
+
+# (config version, settings, geocoder) swapped as one reference
+_state: Optional[Tuple[int, Tuple, CoalescingGeocoder]] = None
+_state_lock = threading.Lock()
+
+
+def nominatim_geocoder() -> CoalescingGeocoder:
+    """The process-wide rate-limited Nominatim geocoder for the active configuration."""
+    global _state
+    version = config_snapshot().version
+    state = _state
+    if state is not None and state[0] == version:
+        return state[2]
+    with _state_lock:
+        if _state is None or _state[0] != version:
+            settings = _settings()
+            if _state is not None and _state[1] == settings:
+                _state = (version, settings, _state[2])
+            else:
+                _state = (version, settings, _build(settings))
+        return _state[2]
@@ -0,0 +1,313 @@
+"""Process-wide timezone lookups with a grid-cell cache.
+
+Constructing a :class:`timezonefinder.TimezoneFinder` reads its shortcut
+index from disk and takes a few hundred milliseconds, and it used to happen
+for every ``/api/get-timezone`` and ``/api/current-time`` request and every
+health check. :func:`timezone_resolver` returns one shared
+:class:`TimezoneResolver` that creates the finder on first use (optionally
+with its polygon data held in memory).
+
+Lookups are cached per grid cell: latitude and longitude are quantized to
+``cell_degrees`` (0.1 degrees, about 11 km, by default). The first lookup in
+a cell decides whether a zone border crosses it. TimezoneFinder indexes its
+polygons by H3 hexagons ("shortcuts"); the candidates for a cell are the
+polygons listed for every hexagon that can overlap it, and when no edge of
+any of them (or of their holes) comes near the cell, every point in the
+cell lies in the same polygon. The zone at the cell's centre is then cached
+and exact for the whole cell. Cells crossing a border are remembered as
+such and their lookups run the full point-in-polygon test, remembered per
+point for the most recent ``MAX_POINTS`` points.
+
+:meth:`TimezoneResolver.contains` checks a zone id against coordinates with
+the same shapes, locally: the bounding boxes of all polygons are loaded once
+into an array, and only the zone's polygons whose box holds the point get a
+point-in-polygon test.
+
+The polygon data is read through ``TimezoneFinder`` internals
+(``shortcut_mapping``, ``coords_of``, ``_holes_of_poly``, the polygon bounds
+and zone tables), which is why ``requirements.txt`` pins timezonefinder.
+
+Settings come from ``geocoding.timezone_in_memory``,
+``geocoding.timezone_cell_degrees`` and ``geocoding.timezone_max_cells``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from horary_config import config_snapshot
+
+try:
+    import numpy as np
+    from timezonefinder import TimezoneFinder
+    from timezonefinder.configs import (
+        DTYPE_FORMAT_H_NUMPY,
+        DTYPE_FORMAT_SIGNED_I_NUMPY,
+        POLY_MAX_VALUES,
+        POLY_NR2ZONE_ID,
+        SHORTCUT_H3_RES,
+    )
+    from timezonefinder.utils import COORD2INT_FACTOR
+    from h3.api import numpy_int as h3
+    TIMEZONEFINDER_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    TimezoneFinder = None
+    TIMEZONEFINDER_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CELL_DEGREES = 0.1
+# Larger cells could overlap hexagons beyond the neighbours of their centre's
+MAX_CELL_DEGREES = 0.25
+DEFAULT_MAX_CELLS = 200000
+# Cells this close to a pole or the antimeridian always use exact lookups
+MAX_CELL_LATITUDE = 85.0
+
+# Exact answers kept for points in border cells (repeat charts for one place)
+MAX_POINTS = 8192
+
+# Cache value for cells that cross a zone border
+_BORDER = ""
+
+
+class TimezoneResolver:
+    """Timezone ids for coordinates from one lazily created TimezoneFinder."""
+
+    def __init__(self, in_memory: bool = False, cell_degrees: float = DEFAULT_CELL_DEGREES,
+                 max_cells: int = DEFAULT_MAX_CELLS) -> None:
+        self.in_memory = bool(in_memory)
+        self.cell_degrees = min(max(float(cell_degrees), 1e-3), MAX_CELL_DEGREES)
+        self.max_cells = max(int(max_cells), 0)
+        self._finder = None
+        self._finder_error: Optional[str] = None
+        self._finder_lock = threading.Lock()
+        # TimezoneFinder seeks and reads shared file handles: one query at a time
+        self._query_lock = threading.Lock()
+        self._cells: Dict[Tuple[int, int], str] = {}
+        # (x, y) -> zone and (x, y, zone) -> contained, in polygon coordinates
+        self._points: Dict[Tuple, Any] = {}
+        # Per polygon (xmax, xmin, ymax, ymin) and each zone's first polygon
+        self._polygon_bounds = None
+        self._zone_starts = None
+        self._lock = threading.Lock()
+        self.cell_hits = 0
+        self.exact_lookups = 0
+        self.cells_classified = 0
+
+    @property
+    def available(self) -> bool:
+        return self.finder is not None
+
+    @property
+    def finder(self) -> Optional["TimezoneFinder"]:
+        """The shared TimezoneFinder, created on first use (``None`` if unavailable)."""
+        if self._finder is None and self._finder_error is None:
+            with self._finder_lock:
+                if self._finder is None and self._finder_error is None:
+                    if not TIMEZONEFINDER_AVAILABLE:
+                        self._finder_error = "timezonefinder is not installed"
+                        logger.warning(
+                            "TimezoneFinder library not available - using fallback timezone detection only"
+                        )
+                    else:
+                        try:
+                            self._finder = TimezoneFinder(in_memory=self.in_memory)
+                            logger.info("TimezoneFinder initialized successfully")
+                        except Exception as e:  # pragma: no cover - initialization failure
+                            self._finder_error = str(e)
+                            logger.error(f"Failed to initialize TimezoneFinder: {e}")
+        return self._finder
+
+    def timezone_at(self, lat: float, lon: float) -> Optional[str]:
+        """Timezone id at ``(lat, lon)``, as ``TimezoneFinder.timezone_at`` gives it."""
+        finder = self.finder
+        if finder is None:
+            return None
+        if not self.max_cells:
+            return self._exact(finder, lat, lon)
+
+        cell = (math.floor(lat / self.cell_degrees), math.floor(lon / self.cell_degrees))
+        zone = self._cells.get(cell)
+        if zone is None:
+            with self._query_lock:
+                zone = self._classify(finder, cell) or _BORDER
+            with self._lock:
+                if len(self._cells) >= self.max_cells:
+                    # Oldest first; dicts keep insertion order
+                    del self._cells[next(iter(self._cells))]
+                self._cells[cell] = zone
+                self.cells_classified += 1
+        if zone == _BORDER:
+            return self._exact(finder, lat, lon)
+        with self._lock:
+            self.cell_hits += 1
+        return zone
+
+    def contains(self, zone: str, lat: float, lon: float) -> Optional[bool]:
+        """Whether ``(lat, lon)`` lies inside one of ``zone``'s polygons.
+
+        ``None`` when there is no polygon data or ``zone`` is not in it.
+        """
+        finder = self.finder
+        if finder is None:
+            return None
+        if self.max_cells:
+            cell = (math.floor(lat / self.cell_degrees), math.floor(lon / self.cell_degrees))
+            if self._cells.get(cell) == zone:
+                return True
+        x, y = int(lon * COORD2INT_FACTOR), int(lat * COORD2INT_FACTOR)
+        inside = self._points.get((x, y, zone))
+        if inside is None:
+            try:
+                zone_id = finder.timezone_names.index(zone)
+            except ValueError:
+                return None
+            with self._query_lock:
+                bounds, zone_starts = self._polygon_tables(finder)
+                first, end = int(zone_starts[zone_id]), int(zone_starts[zone_id + 1])
+                boxes = bounds[first:end]
+                hits = np.flatnonzero(
+                    (boxes[:, 0] >= x) & (boxes[:, 1] <= x) & (boxes[:, 2] >= y) & (boxes[:, 3] <= y)
+                )
+                inside = any(finder.inside_of_polygon(first + int(hit), x, y) for hit in hits)
+            self._remember((x, y, zone), inside)
+        return inside
+
+    def certain_timezone_at(self, lat: float, lon: float) -> Optional[str]:
+        """The zone whose polygon contains ``(lat, lon)``, every candidate tested."""
+        finder = self.finder
+        if finder is None:
+            return None
+        with self._query_lock:
+            return finder.certain_timezone_at(lat=lat, lng=lon)
+
+    def _polygon_tables(self, finder) -> Tuple["np.ndarray", "np.ndarray"]:
+        if self._polygon_bounds is None:
+            bounds_file = getattr(finder, POLY_MAX_VALUES)
+            bounds_file.seek(0)
+            bounds = np.frombuffer(bounds_file.read(), dtype=DTYPE_FORMAT_SIGNED_I_NUMPY)
+            zones_file = getattr(finder, POLY_NR2ZONE_ID)
+            zones_file.seek(0)
+            self._zone_starts = np.frombuffer(zones_file.read(), dtype=DTYPE_FORMAT_H_NUMPY)
+            self._polygon_bounds = bounds.reshape(-1, 4)
+        return self._polygon_bounds, self._zone_starts
+
+    def _exact(self, finder, lat: float, lon: float) -> Optional[str]:
+        key = (int(lon * COORD2INT_FACTOR), int(lat * COORD2INT_FACTOR))
+        with self._lock:
+            self.exact_lookups += 1
+        zone = self._points.get(key)
+        if zone is None:
+            with self._query_lock:
+                zone = finder.timezone_at(lat=lat, lng=lon)
+            self._remember(key, zone)
+        return zone
+
+    def _remember(self, key: Tuple, value: Any) -> None:
+        with self._lock:
+            if len(self._points) >= MAX_POINTS:
+                del self._points[next(iter(self._points))]
+            self._points[key] = value
+
+    def _classify(self, finder, cell: Tuple[int, int]) -> Optional[str]:
+        """The zone covering the whole of ``cell``, or ``None`` if it crosses a border."""
+        lat0, lon0 = cell[0] * self.cell_degrees, cell[1] * self.cell_degrees
+        lat1, lon1 = lat0 + self.cell_degrees, lon0 + self.cell_degrees
+        if lat0 < -MAX_CELL_LATITUDE or lat1 > MAX_CELL_LATITUDE or lon0 < -180.0 or lon1 > 180.0:
+            return None
+
+        polygons = set()
+        centre = h3.geo_to_h3((lat0 + lat1) / 2, (lon0 + lon1) / 2, SHORTCUT_H3_RES)
+        # Cells are far smaller than a shortcut hexagon, so only the centre's
+        # hexagon and its neighbours can overlap; bounding boxes over-count
+        # (hexagons across the antimeridian span every longitude), never miss
+        for hexagon in h3.k_ring(centre, 1):
+            boundary = h3.h3_to_geo_boundary(hexagon)
+            lats = [point[0] for point in boundary]
+            lons = [point[1] for point in boundary]
+            if max(lats) < lat0 or min(lats) > lat1 or max(lons) < lon0 or min(lons) > lon1:
+                continue
+            polygons.update(int(polygon) for polygon in finder.shortcut_mapping[hexagon])
+
+        # Polygon coordinates are stored as int32 multiples of 1e-7 degrees
+        bounds = (int(lon0 * COORD2INT_FACTOR), int(lon1 * COORD2INT_FACTOR) + 1,
+                  int(lat0 * COORD2INT_FACTOR), int(lat1 * COORD2INT_FACTOR) + 1)
+        if len({finder.zone_id_of(polygon) for polygon in polygons}) > 1:
+            for polygon in polygons:
+                if _edges_near(finder.coords_of(polygon), *bounds):
+                    return None
+                if any(_edges_near(hole, *bounds) for hole in finder._holes_of_poly(polygon)):
+                    return None
+        return finder.timezone_at(lat=(lat0 + lat1) / 2, lng=(lon0 + lon1) / 2)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cells.clear()
+            self._points.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            border_cells = sum(1 for zone in self._cells.values() if zone == _BORDER)
+            lookups = self.cell_hits + self.exact_lookups
+            return {
+                "available": self._finder is not None,
+                "initialized": self._finder is not None or self._finder_error is not None,
+                "error": self._finder_error,
+                "in_memory": self.in_memory,
+                "cell_degrees": self.cell_degrees,
+                "cells": len(self._cells),
+                "border_cells": border_cells,
+                "points": len(self._points),
+                "max_cells": self.max_cells,
+                "cell_hits": self.cell_hits,
+                "exact_lookups": self.exact_lookups,
+                "cells_classified": self.cells_classified,
+                "cell_hit_ratio": round(self.cell_hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def _edges_near(coords: "np.ndarray", x0: int, x1: int, y0: int, y1: int) -> bool:
+    """Whether the bounding box of any edge of ring ``coords`` meets the box ``x0..x1, y0..y1``."""
+    xs, ys = coords[0], coords[1]
+    if xs.max() < x0 or xs.min() > x1 or ys.max() < y0 or ys.min() > y1:
+        return False
+    next_xs, next_ys = np.roll(xs, -1), np.roll(ys, -1)
+    return bool(np.any(
+        (np.minimum(xs, next_xs) <= x1) & (np.maximum(xs, next_xs) >= x0)
+        & (np.minimum(ys, next_ys) <= y1) & (np.maximum(ys, next_ys) >= y0)
+    ))
+
+
+def _settings() -> Tuple[bool, float, int]:
+    settings = getattr(config_snapshot().config, "geocoding", None)
+    return (
+        bool(getattr(settings, "timezone_in_memory", False)),
+        float(getattr(settings, "timezone_cell_degrees", DEFAULT_CELL_DEGREES)),
+        int(getattr(settings, "timezone_max_cells", DEFAULT_MAX_CELLS)),
+    )
+
+
+# (config version, settings, resolver) swapped as one reference
+_state: Optional[Tuple[int, Tuple, TimezoneResolver]] = None
+_state_lock = threading.Lock()
+
+
+def timezone_resolver() -> TimezoneResolver:
+    """The process-wide timezone resolver for the active configuration."""
+    global _state
+    version = config_snapshot().version
+    state = _state
+    if state is not None and state[0] == version:
+        return state[2]
+    with _state_lock:
+        if _state is None or _state[0] != version:
+            settings = _settings()
+            if _state is not None and _state[1] == settings:
+                _state = (version, settings, _state[2])
+            else:
+                _state = (version, settings, TimezoneResolver(*settings))
+        return _state[2]
@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 import datetime
 import logging
 import math
-from horary_config import cfg
+from horary_config import config_snapshot
 
 
 logger = logging.getLogger(__name__)
@@ -41,8 +41,8 @@ class Aspect(Enum):
     def orb(self) -> float:
         """Get orb from configuration."""
         try:
-            return cfg().orbs.__dict__[self.config_key]
-        except (AttributeError, KeyError):
+            return config_snapshot().aspect_orbs[self.config_key]
+        except KeyError:
             logger.warning(f"Orb not found for {self.config_key}, using default 8.0")
             return 8.0
 
@@ -80,7 +80,7 @@ class SolarCondition(Enum):
         self.description = description
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SolarAnalysis:
     """Analysis of planet's relationship to the Sun."""
     planet: Planet
@@ -90,8 +90,9 @@ class SolarAnalysis:
     traditional_exception: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanetPosition:
+    # Not frozen: calculate_chart fills in house and dignity once the houses are cast
     planet: Planet
     longitude: float
     latitude: float
@@ -103,7 +104,7 @@ class PlanetPosition:
     dignities: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AspectInfo:
     planet1: Planet
     planet2: Planet
@@ -116,7 +117,7 @@ class AspectInfo:
     degrees_to_exact: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LunarAspect:
     """Enhanced lunar aspect information."""
     planet: Planet
@@ -154,4 +155,8 @@ class HoraryChart:
     julian_day: float = 0.0
     moon_last_aspect: Optional[LunarAspect] = None
     moon_next_aspect: Optional[LunarAspect] = None
+    # Immutable per-chart ephemeris data (EphemerisSnapshot) shared by helpers
+    ephemeris: Optional[Any] = None
+    # Memoized derived facts (ChartContext), created on first use
+    context: Optional[Any] = field(default=None, repr=False, compare=False)
 
@@ -0,0 +1,40 @@
+"""Batch charts must equal single charts: both paths score dignities separately."""
+
+import dataclasses
+import datetime
+import random
+
+import pytest
+
+from horary_engine.chart_cache import chart_cache
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+
+CHARTS = 120
+
+# Derived or per-call fields the two paths are not expected to share
+_SKIP = {"context", "ephemeris"}
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return EnhancedTraditionalAstrologicalCalculator()
+
+
+def _moments():
+    rng = random.Random(12)
+    start = datetime.datetime(1990, 1, 1, tzinfo=datetime.timezone.utc)
+    rows = [(start + datetime.timedelta(days=rng.uniform(0, 16000)), rng.uniform(-60, 65), rng.uniform(-180, 180))
+            for _ in range(CHARTS)]
+    return [row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows]
+
+
+def test_batch_rows_match_calculate_chart(calculator):
+    datetimes, latitudes, longitudes = _moments()
+    batch = calculator.calculate_charts_batch(datetimes, latitudes, longitudes, ["x"] * CHARTS)
+    chart_cache().clear()
+    for index, dt in enumerate(datetimes):
+        expected = calculator.calculate_chart(dt, dt, "UTC", latitudes[index], longitudes[index], "x")
+        actual = batch.chart(index)
+        for field in dataclasses.fields(expected):
+            if field.name not in _SKIP:
+                assert getattr(actual, field.name) == getattr(expected, field.name), (index, field.name)
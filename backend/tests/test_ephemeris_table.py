@@ -0,0 +1,102 @@
+"""The ephemeris table stays within its documented bounds of Swiss Ephemeris."""
+
+import random
+
+import pytest
+
+swe = pytest.importorskip("swisseph")
+
+from horary_engine.calculation.ephemeris_table import (
+    SEGMENT_LAYOUT,
+    EphemerisTable,
+    accuracy_bound,
+    write_table,
+)
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+START = swe.julday(2024, 1, 1, 0.0)
+END = swe.julday(2027, 1, 1, 0.0)
+
+
+def _sample(jd, planet_id):
+    return swe.calc_ut(jd, planet_id, FLAGS)[0][:3]
+
+
+def _elongation(jd, planet_id):
+    longitude = swe.calc_ut(jd, planet_id, FLAGS)[0][0]
+    sun = swe.calc_ut(jd, swe.SUN, FLAGS)[0][0]
+    return (longitude - sun + 180.0) % 360.0 - 180.0
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    path = tmp_path_factory.mktemp("ephemeris") / "table.bin"
+    write_table(path, START, END, _sample)
+    table = EphemerisTable(path)
+    yield table
+    table.close()
+
+
+def _conjunctions(planet_id):
+    """Exact solar conjunctions of ``planet_id`` inside the table range."""
+    found = []
+    jd, previous = START + 1.0, None
+    while jd < END - 1.0:
+        elongation = _elongation(jd, planet_id)
+        if previous is not None and abs(elongation) < 20.0 and (previous < 0) != (elongation < 0):
+            low, high = jd - 0.5, jd
+            for _ in range(30):
+                middle = (low + high) / 2
+                if (_elongation(middle, planet_id) < 0) == (_elongation(low, planet_id) < 0):
+                    low = middle
+                else:
+                    high = middle
+            found.append(low)
+        previous = elongation
+        jd += 0.5
+    return found
+
+
+def _stations(planet_id):
+    """Days on which ``planet_id`` changes direction inside the table range."""
+    found = []
+    jd, previous = START + 2.0, None
+    while jd < END - 2.0:
+        speed = swe.calc_ut(jd, planet_id, FLAGS)[0][3]
+        if previous is not None and (previous < 0) != (speed < 0):
+            found.append(jd)
+        previous = speed
+        jd += 1.0
+    return found
+
+
+def _assert_within_bounds(table, planet_id, jds):
+    for jd in jds:
+        expected = swe.calc_ut(jd, planet_id, FLAGS)[0]
+        actual = table.position(jd, planet_id)
+        position_bound, speed_bound = accuracy_bound(planet_id, _elongation(jd, planet_id))
+        assert abs((actual[0] - expected[0] + 180.0) % 360.0 - 180.0) * 3600 <= position_bound, (planet_id, jd)
+        assert abs(actual[1] - expected[1]) * 3600 <= position_bound, (planet_id, jd)
+        assert abs(actual[3] - expected[3]) <= speed_bound, (planet_id, jd)
+
+
+@pytest.mark.parametrize("planet_id", list(SEGMENT_LAYOUT))
+def test_random_lookups(table, planet_id):
+    rng = random.Random(planet_id)
+    _assert_within_bounds(table, planet_id, [rng.uniform(START, END) for _ in range(2000)])
+
+
+@pytest.mark.parametrize("planet_id", [pid for pid in SEGMENT_LAYOUT if pid >= 2])
+def test_solar_conjunctions(table, planet_id):
+    conjunctions = _conjunctions(planet_id)
+    assert conjunctions
+    _assert_within_bounds(
+        table, planet_id, [jd + step * 0.005 for jd in conjunctions for step in range(-200, 201)]
+    )
+
+
+@pytest.mark.parametrize("planet_id", [pid for pid in SEGMENT_LAYOUT if pid >= 2])
+def test_stations(table, planet_id):
+    _assert_within_bounds(
+        table, planet_id, [jd + step * 0.05 for jd in _stations(planet_id) for step in range(-40, 41)]
+    )
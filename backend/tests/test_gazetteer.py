@@ -0,0 +1,29 @@
+from horary_engine.services.gazetteer import (
+    SUGGEST_SCAN_LIMIT,
+    Gazetteer,
+    GazetteerEntry,
+    write_gazetteer,
+)
+
+
+def _ohio(name, population):
+    return GazetteerEntry([name], 40.0, -83.0, population, "America/New_York", "US",
+                          "Ohio", "OH", "United States")
+
+
+def test_qualified_suggestion_on_a_common_prefix(tmp_path):
+    entries = [_ohio(f"Spring {i:03d}", 10000 + i) for i in range(SUGGEST_SCAN_LIMIT * 2)]
+    entries.append(GazetteerEntry(["Springtown"], 32.97, -97.68, 3000, "America/Chicago", "US",
+                                  "Texas", "TX", "United States"))
+    path = tmp_path / "gazetteer.bin"
+    write_gazetteer(path, entries)
+    gazetteer = Gazetteer(path)
+    try:
+        assert [place.name for place in gazetteer.suggest("spring, te")] == ["Springtown"]
+        assert [place.name for place in gazetteer.suggest("springt, te")] == ["Springtown"]
+        assert gazetteer.lookup("Springtown, Texas").name == "Springtown"
+        # Unqualified, the populous Ohio places still come first
+        assert gazetteer.suggest("spring", limit=1)[0].name == "Spring 191"
+        assert all(place.admin_code == "OH" for place in gazetteer.suggest("spring, oh", limit=5))
+    finally:
+        gazetteer.close()
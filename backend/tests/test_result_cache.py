@@ -0,0 +1,45 @@
+import dataclasses
+import enum
+from typing import List, Optional
+
+from horary_engine.result_cache import (
+    MemoryCacheBackend,
+    ResultCache,
+    SQLiteCacheBackend,
+    layout_digest,
+)
+
+
+class Colour(enum.Enum):
+    RED = "red"
+
+
+def _point(*fields):
+    return dataclasses.make_dataclass("Point", fields)
+
+
+def test_layout_digest_follows_fields_and_referenced_types():
+    @dataclasses.dataclass
+    class Line:
+        points: List[_point(("x", float), ("y", float))]
+        colour: Optional[Colour] = None
+
+    @dataclasses.dataclass
+    class Renamed:
+        points: List[_point(("x", float), ("z", float))]
+        colour: Optional[Colour] = None
+
+    Renamed.__qualname__ = Line.__qualname__
+    assert layout_digest([Line]) == layout_digest([Line])
+    assert layout_digest([Line]) != layout_digest([Renamed])
+
+
+def test_undecodable_entries_are_misses_and_evicted(tmp_path):
+    for backend in (MemoryCacheBackend(), SQLiteCacheBackend(tmp_path / "cache.sqlite3")):
+        cache = ResultCache(backend)
+        cache.put("chart", "k", {"ok": True})
+        assert cache.get("chart", "k") == {"ok": True}
+        backend.set(cache._key("chart", "k"), b"not a pickle", 0.0)
+        assert cache.get("chart", "k") is None
+        assert len(backend) == 0
+        assert cache.misses["chart"] == 1